@@ -27,11 +27,21 @@
 # ----------------------------------------------------------------------------------------------------
 import  os
 import  re
+import  errno
 import  shutil
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import  mCore.platformLib
 
 import  mFileSystem.exceptionLib
+import  mFileSystem.directoryWalkerLib
+import  mFileSystem.fileLib
+import  mFileSystem.pathListLib
+import  mFileSystem.versionIndexLib
 import  mFileSystem.versionLib
 
 
@@ -39,9 +49,106 @@ import  mFileSystem.versionLib
 # -----------------------------------------------------------------------------------------------------
 # CODE
 # -----------------------------------------------------------------------------------------------------
+#
+## [ bool ] - Whether the platform is Windows, determined once at import.
+_IS_WINDOWS                   = mCore.platformLib.Platform.isWindows()
+
+## [ int ] - Maximum number of results cached by mFileSystem.directoryLib.Directory.toNativeSeparators method.
+NATIVE_SEPARATORS_CACHE_SIZE  = 4096
+
+## [ dict ] - Cached results of mFileSystem.directoryLib.Directory.toNativeSeparators method.
+_nativeSeparatorsCache        = {}
+
+#
+## @brief Replace the separators in given path with native separators.
+#
+#  This function gives the same result as replacing double backslashes, backslashes, double slashes and
+#  slashes with os.sep in order, but replaces only what is present in the path.
+#
+#  @param path [ str | None | in  ] - Path.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _replaceSeparators(path):
+
+    if os.sep == '\\':
+        if '\\\\' in path:
+            path = path.replace('\\\\', '\\')
+        if '/' in path:
+            path = path.replace('//', '\\').replace('/', '\\')
+    else:
+        if '\\' in path:
+            path = path.replace('\\\\', os.sep).replace('\\', os.sep)
+        if '//' in path:
+            path = path.replace('//', os.sep)
+
+    return path
+
+#
+## @brief Convert separators in given path to native separators, adding or removing the leading and trailing ones.
+#
+#  This function is used by mFileSystem.directoryLib.Directory.toNativeSeparators method, which caches its results.
+#
+#  @param path               [ str  | None | in  ] - Path.
+#  @param startWithSeparator [ bool | None | in  ] - Add separator at the beginning.
+#  @param endWithSeparator   [ bool | None | in  ] - Add separator at the end.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _toNativeSeparators(path, startWithSeparator, endWithSeparator):
+
+    path = _replaceSeparators(path)
+
+    return _setEndSeparators(path, startWithSeparator, endWithSeparator)
+
+#
+## @brief Add or remove the leading and trailing separators of given path, which has native separators.
+#
+#  @param path               [ str  | None | in  ] - Path.
+#  @param startWithSeparator [ bool | None | in  ] - Add separator at the beginning.
+#  @param endWithSeparator   [ bool | None | in  ] - Add separator at the end.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _setEndSeparators(path, startWithSeparator, endWithSeparator):
+
+    if startWithSeparator:
+        # Add separator at the beginning if OS is not Windows
+        if not _IS_WINDOWS and not path.startswith(os.sep):
+            path = os.sep + path
+    elif path.startswith(os.sep):
+        # Remove separator at the beginning
+        path = path[1:]
+
+    if endWithSeparator:
+        # Add separator at the end
+        if not path.endswith(os.sep):
+            path = path + os.sep
+    elif path.endswith(os.sep):
+        # Remove separator at the end
+        path = path[:-1]
+
+    return path
+
 #
 ## @brief [ CLASS ] - Class to operate on directories.
 class Directory(object):
+
+    ## [ re.Pattern ] - Matches names of versioned files, like file.v001.txt.
+    VERSIONED_FILE_RE        = re.compile(r'(.*?)(\w+)(\.v)([0-9]{3})(\.)?([aA-zZ]*)')
+
+    ## [ re.Pattern ] - Matches names of versioned files without their extension and captures base name and version, like file.v001.
+    VERSIONED_FILE_NAME_RE   = re.compile(r'^(.+)\.v([0-9]{3,})$')
+
+    ## [ str ] - Base name of the pointer files, which hold the name of the latest versioned file in a directory.
+    LATEST_POINTER_FILE_NAME = '.latest'
+
+    ## [ int ] - Maximum number of consecutive missing versions, which are probed past when following a latest pointer file.
+    VERSION_PROBE_MAX_GAP    = 8
+
     #
     # ------------------------------------------------------------------------------------------------
     # PRIVATE METHODS
@@ -67,32 +174,57 @@ class Directory(object):
     # PROTECTED METHODS
     # ------------------------------------------------------------------------------------------------
     #
-    ## @brief This method is used by mFileSystem.directoryLib.Directory.listDirectoriesRecursively method.
+    ## @brief Iterate over the entries under the directory in the sorted order of their paths.
+    #
+    #  Hidden directories are not traversed if ignoreDot argument is provided True, see
+    #  mFileSystem.directoryWalkerLib.DirectoryWalker class.
     #
-    #  @param directory     [ str           | None | in  ] - Absolute path of a directory.
-    #  @param directories   [ list of str   | None | in  ] - Where the subdirectories will be stored.
-    #  @param ignoreDot     [ bool          | True | in  ] - Ignore directories that start with dot (hidden directories).
+    #  @param ignoreDot      [ bool | True | in  ] - Ignore files and directories that start with dot (hidden ones).
+    #  @param maxDepth       [ int  | None | in  ] - Maximum depth of the entries, entries directly under the directory are at depth 1.
+    #  @param followSymlinks [ bool | True | in  ] - Traverse symbolic links to directories.
     #
     #  @exception N/A
     #
-    #  @return None - None.
-    def _listDirectoriesRecursively(self, directory, directories, ignoreDot=True):
+    #  @return generator - (directory, name, isFolder) tuples, directory is relative to the directory with a trailing separator.
+    def _walkSorted(self, ignoreDot=True, maxDepth=None, followSymlinks=True):
 
-        if not os.path.isdir(directory):
-            return
+        return mFileSystem.directoryWalkerLib.DirectoryWalker(self._directory,
+                                                              maxDepth=maxDepth,
+                                                              followSymlinks=followSymlinks,
+                                                              ignoreDot=ignoreDot).walk()
 
-        directoryList = [Directory.join(directory, x) for x in os.listdir(directory) if
-                         os.path.isdir(Directory.join(directory, x))]
-        if not directoryList:
-            return
+    #
+    ## @brief Iterate over the files under the directory in the sorted order of their paths.
+    #
+    #  @param extension        [ str  | None | in  ] - Extension of the files that need to be listed.
+    #  @param ignoreDot        [ bool | True | in  ] - Ignore files and directories that start with dot (hidden ones).
+    #  @param ignoreExtensions [ list | None | in  ] - Extensions that will be ignored.
+    #  @param maxDepth         [ int  | None | in  ] - Maximum depth of the files, files directly under the directory are at depth 1.
+    #  @param followSymlinks   [ bool | True | in  ] - Traverse symbolic links to directories.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - (directory, name) tuples, directory is relative to the directory with a trailing separator.
+    def _iterateFilesSorted(self, extension=None, ignoreDot=True, ignoreExtensions=None, maxDepth=None, followSymlinks=True):
 
-        if ignoreDot:
-            directoryList = [x for x in directoryList if not x.startswith('.')]
+        if extension and not extension.startswith('.'):
+            extension = '.{}'.format(extension)
+
+        splitext = os.path.splitext
+
+        for directory, name, isFolder in self._walkSorted(ignoreDot, maxDepth, followSymlinks):
+
+            if isFolder:
+                continue
 
-        directories.extend(directoryList)
+            if extension or ignoreExtensions:
+                fileExtension = splitext(name)[1]
+                if extension and fileExtension != extension:
+                    continue
+                if ignoreExtensions and fileExtension in ignoreExtensions:
+                    continue
 
-        for d in directoryList:
-            self._listDirectoriesRecursively(d, directories)
+            yield directory, name
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -322,24 +454,24 @@ class Directory(object):
     #
     ## @brief List directories recursively.
     #
-    #  @param ignoreDot [ bool | True | in  ] - Ignore directories that start with dot (hidden directories).
+    #  Directories are listed in sorted order while they are traversed, see _walkSorted method.
+    #
+    #  @param ignoreDot      [ bool | True | in  ] - Ignore directories that start with dot (hidden directories).
+    #  @param maxDepth       [ int  | None | in  ] - Maximum depth of the directories, directories directly under the directory are at depth 1.
+    #  @param followSymlinks [ bool | True | in  ] - Traverse symbolic links to directories, loops are detected and not traversed.
     #
     #  @exception N/A
     #
     #  @return list of str - Directories.
     #  @return None        - Returns None if a directory is not set previously or doesn't exist.
-    def listDirectoriesRecursively(self, ignoreDot=True):
+    def listDirectoriesRecursively(self, ignoreDot=True, maxDepth=None, followSymlinks=True):
 
         if not self.exists():
             return None
 
-        directories = []
-
-        self._listDirectoriesRecursively(self._directory, directories, ignoreDot)
+        prefix = Directory.toNativeSeparators(self._directory) + os.sep
 
-        directories.sort()
-
-        return directories
+        return [prefix + x + y for x, y, isFolder in self._walkSorted(ignoreDot, maxDepth, followSymlinks) if isFolder]
 
     #
     ## @}
@@ -373,7 +505,8 @@ class Directory(object):
                 extension = '.{}'.format(extension)
             fileList = [x for x in os.listdir(self._directory) if os.path.splitext(x)[1] == extension]
         else:
-            fileList = [x for x in os.listdir(self._directory) if os.path.isfile(Directory.join(self._directory, x))]
+            names    = os.listdir(self._directory)
+            fileList = [x for x, y in zip(names, Directory._joinFast(self._directory, names)) if os.path.isfile(y)]
 
         if ignoreDot and fileList:
             fileList = [x for x in fileList if not x.startswith('.')]
@@ -412,11 +545,10 @@ class Directory(object):
         if extension:
             if not extension.startswith('.'):
                 extension = '.{}'.format(extension)
-            fileList = [Directory.join(directory, x) for x in os.listdir(directory) if
-                        os.path.splitext(x)[1] == extension]
+            fileList = Directory._joinFast(directory, [x for x in os.listdir(directory) if
+                                                       os.path.splitext(x)[1] == extension])
         else:
-            fileList = [Directory.join(directory, x) for x in os.listdir(directory) if
-                        os.path.isfile(Directory.join(directory, x))]
+            fileList = [x for x in Directory._joinFast(directory, os.listdir(directory)) if os.path.isfile(x)]
 
         if not ignoreDot:
             return sorted(fileList)
@@ -443,41 +575,84 @@ class Directory(object):
     #  @param extension        [ str  | None  | in  ] - Extension of the files that need to be listed.
     #  @param ignoreDot        [ bool | True  | in  ] - Ignore files that start with dot (hidden files).
     #  @param ignoreExtensions [ list | None  | in  ] - Extensions that will be ignored.
+    #  @param compact          [ bool | False | in  ] - Return a compact path list, see mFileSystem.pathListLib.PathList class.
+    #  @param maxDepth         [ int  | None  | in  ] - Maximum depth of the files, files directly under the directory are at depth 1.
+    #  @param followSymlinks   [ bool | True  | in  ] - Traverse symbolic links to directories, loops are detected and not traversed.
     #
     #  @exception N/A
     #
-    #  @return list of str - Files.
-    #  @return None        - Returns None if a directory is not set previously or doesn't exist.
-    def listFilesRecursively(self, relative=False, extension=None, ignoreDot=True, ignoreExtensions=None):
+    #  @return list of str                      - Files.
+    #  @return mFileSystem.pathListLib.PathList - Files, if compact argument is provided True.
+    #  @return None                             - Returns None if a directory is not set previously or doesn't exist.
+    def listFilesRecursively(self,
+                             relative=False,
+                             extension=None,
+                             ignoreDot=True,
+                             ignoreExtensions=None,
+                             compact=False,
+                             maxDepth=None,
+                             followSymlinks=True):
 
         if not self.exists():
             return None
 
-        filesList = []
+        if compact:
+            prefix = os.sep if relative else Directory.toNativeSeparators(self._directory) + os.sep
 
-        # Current directory
-        filesList.extend([x for x in self.listFilesWithAbsolutePath(directory=self._directory,
-                                                                    ignoreDot=ignoreDot,
-                                                                    extension=extension) if x])
+            pathList = mFileSystem.pathListLib.PathList(prefix)
 
-        # Sub directories
-        directories = self.listDirectoriesRecursively(ignoreDot=ignoreDot)
-        if directories:
-            for d in directories:
-                filesList.extend(f for f in self.listFilesWithAbsolutePath(directory=d,
-                                                                           ignoreDot=ignoreDot,
-                                                                           extension=extension))
+            for directory, name in self._iterateFilesSorted(extension=extension,
+                                                            ignoreDot=ignoreDot,
+                                                            ignoreExtensions=ignoreExtensions,
+                                                            maxDepth=maxDepth,
+                                                            followSymlinks=followSymlinks):
+                pathList.append(directory, name)
+
+            return pathList
+
+        return list(self.iterateFilesRecursively(relative=relative,
+                                                 extension=extension,
+                                                 ignoreDot=ignoreDot,
+                                                 ignoreExtensions=ignoreExtensions,
+                                                 maxDepth=maxDepth,
+                                                 followSymlinks=followSymlinks))
 
-        if filesList and relative:
-            filesList = [x.split(self._directory)[1] for x in filesList]
+    #
+    ## @brief Iterate over the files including files under sub directories recursively.
+    #
+    #  Files are yielded in sorted order while the directories are traversed, so the results can be consumed
+    #  before the whole tree is listed. All hidden directories and files will be ignored if you provide True
+    #  for ignoreDot argument.
+    #
+    #  @param relative         [ bool | False | in  ] - List files relative to the directory.
+    #  @param extension        [ str  | None  | in  ] - Extension of the files that need to be listed.
+    #  @param ignoreDot        [ bool | True  | in  ] - Ignore files that start with dot (hidden files).
+    #  @param ignoreExtensions [ list | None  | in  ] - Extensions that will be ignored.
+    #  @param maxDepth         [ int  | None  | in  ] - Maximum depth of the files, files directly under the directory are at depth 1.
+    #  @param followSymlinks   [ bool | True  | in  ] - Traverse symbolic links to directories, loops are detected and not traversed.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Files, nothing is yielded if a directory is not set previously or doesn't exist.
+    def iterateFilesRecursively(self,
+                                relative=False,
+                                extension=None,
+                                ignoreDot=True,
+                                ignoreExtensions=None,
+                                maxDepth=None,
+                                followSymlinks=True):
 
-        if filesList and ignoreExtensions:
-            filesList = [x for x in filesList if not os.path.splitext(x)[1] in ignoreExtensions]
+        if not self.exists():
+            return
 
-        if filesList:
-            filesList.sort()
+        prefix = os.sep if relative else Directory.toNativeSeparators(self._directory) + os.sep
 
-        return filesList
+        for directory, name in self._iterateFilesSorted(extension=extension,
+                                                        ignoreDot=ignoreDot,
+                                                        ignoreExtensions=ignoreExtensions,
+                                                        maxDepth=maxDepth,
+                                                        followSymlinks=followSymlinks):
+            yield prefix + directory + name
 
     #
     ## @}
@@ -499,6 +674,21 @@ class Directory(object):
 
         return [x for x in directory.split(os.sep) if x]
 
+    #
+    ## @brief Split each of given paths by ignoring empty parts.
+    #
+    #  @param paths [ iterable of str | None | in  ] - Paths.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list of str - Parts of the paths.
+    @staticmethod
+    def splitMany(paths):
+
+        sep = os.sep
+
+        return [[x for x in path.split(sep) if x] for path in paths]
+
     ## @name SEPARATOR
 
     ## @{
@@ -583,6 +773,8 @@ class Directory(object):
     #  Separator will only be added at the beginning of the directory if startWithSeparator
     #  provided True and the platform is not Windows.
     #
+    #  Results are memoized, a directory converted before costs a dict lookup.
+    #
     #  @param directory          [ str  | None  | in  ] - Directory.
     #  @param startWithSeparator [ bool | True  | in  ] - Add separator at the beginning.
     #  @param endWithSeparator   [ bool | False | in  ] - Add separator at the end.
@@ -593,27 +785,47 @@ class Directory(object):
     @staticmethod
     def toNativeSeparators(directory, startWithSeparator=True, endWithSeparator=False):
 
-        directory = directory.replace('\\\\', os.sep)
-        directory = directory.replace('\\', os.sep)
-        directory = directory.replace('//', os.sep)
-        directory = directory.replace('/', os.sep)
+        key    = (directory, startWithSeparator, endWithSeparator)
+        result = _nativeSeparatorsCache.get(key)
+        if result is not None:
+            return result
 
-        if startWithSeparator:
-            # Add separator at the beginning if OS is not Windows
-            if not mCore.platformLib.Platform.isWindows():
-                directory = Directory.addStartSeparator(directory)
-        else:
-            # Remove separator at the beginning
-            directory = Directory.removeStartSeparator(directory)
+        result = _toNativeSeparators(directory, startWithSeparator, endWithSeparator)
 
-        if endWithSeparator:
-            # Add separator at the end
-            directory = Directory.addEndSeparator(directory)
-        else:
-            # Remove separator at the end
-            directory = Directory.removeEndSeparator(directory)
+        if len(_nativeSeparatorsCache) >= NATIVE_SEPARATORS_CACHE_SIZE:
+            _nativeSeparatorsCache.clear()
 
-        return directory
+        _nativeSeparatorsCache[key] = result
+
+        return result
+
+    #
+    ## @brief Convert separators in each of given paths to native separators.
+    #
+    #  This method gives the same result as calling toNativeSeparators method for each path, results are
+    #  not cached. If `useNumpy` argument is provided True and NumPy is installed, separators are replaced
+    #  on a NumPy string array, which is faster for large numbers of paths.
+    #
+    #  @param paths              [ iterable of str | None  | in  ] - Paths.
+    #  @param startWithSeparator [ bool            | True  | in  ] - Add separator at the beginning.
+    #  @param endWithSeparator   [ bool            | False | in  ] - Add separator at the end.
+    #  @param useNumpy           [ bool            | False | in  ] - Use NumPy if it is installed.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    @staticmethod
+    def toNativeSeparatorsMany(paths, startWithSeparator=True, endWithSeparator=False, useNumpy=False):
+
+        paths = list(paths)
+
+        if useNumpy and numpy is not None and paths:
+            array = numpy.asarray(paths, dtype=numpy.str_)
+            for separator in ('\\\\', '\\', '//', '/'):
+                array = numpy.char.replace(array, separator, os.sep)
+            return [_setEndSeparators(x, startWithSeparator, endWithSeparator) for x in array.tolist()]
+
+        return [_toNativeSeparators(x, startWithSeparator, endWithSeparator) for x in paths]
 
     #
     ## @}
@@ -646,11 +858,71 @@ class Directory(object):
             for d in directories:
                 if not d:
                     continue
-                d = Directory.removeStartSeparator(d)
-                finalDirectory = os.path.join(finalDirectory, d)
+                if d.startswith(os.sep):
+                    d = d[1:]
+                if _IS_WINDOWS or d.startswith('/'):
+                    finalDirectory = os.path.join(finalDirectory, d)
+                elif not finalDirectory or finalDirectory.endswith('/'):
+                    # Same as posixpath.join
+                    finalDirectory = finalDirectory + d
+                else:
+                    finalDirectory = finalDirectory + '/' + d
 
         return Directory.toNativeSeparators(finalDirectory)
 
+    #
+    ## @brief Join given directory with each of given relative paths.
+    #
+    #  This method is used by the listing methods and joinMany method, it gives the same result as join
+    #  method for each path, but the directory is converted to native separators only once and the paths
+    #  that are already in native form are appended to it as they are.
+    #
+    #  @param directory [ str         | None | in  ] - Directory.
+    #  @param names     [ list of str | None | in  ] - Relative paths, like the names listed by os.listdir.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    @staticmethod
+    def _joinFast(directory, names):
+
+        join    = Directory.join
+        sep     = os.sep
+        double  = sep * 2
+
+        # Any separator other than a single native one needs to be converted
+        special = '/' if _IS_WINDOWS else '\\'
+
+        if not directory or special in directory or double in directory or directory.endswith(':'):
+            return [join(directory, x) for x in names]
+
+        prefix = Directory.toNativeSeparators(directory) + sep
+
+        return [join(directory, x) if not x or special in x or double in x or x[0] == sep or x[-1] == sep \
+                else prefix + x for x in names]
+
+    #
+    ## @brief Join given directory with each of given relative paths.
+    #
+    #  This method gives the same result as calling join method for each path, but the directory is
+    #  converted once and the paths in native form are only appended to it.
+    #
+    # @code
+    #mFileSystem.directoryLib.Directory.joinMany('/mnt/libs', ['boost/1.66', 'qt/5.12'])
+    #['/mnt/libs/boost/1.66', '/mnt/libs/qt/5.12']
+    # @endcode
+    #
+    #  @param directory [ str             | None | in  ] - Directory.
+    #  @param paths     [ iterable of str | None | in  ] - Relative paths.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    @staticmethod
+    def joinMany(directory, paths):
+
+        return Directory._joinFast(directory, list(paths))
+
     #
     ## @brief Join given directories and make sure that right separator is used based on the current platform.
     #
@@ -760,12 +1032,19 @@ class Directory(object):
     #  '2.0.1'                              | None            |
     #  2 / '2' / '02' / '002'               | None            |
     #
+    #  If `constraint` argument is provided, only the folders whose versions satisfy it are considered and the
+    #  version option is applied to them, e.g. `version=kLatest, constraint='>=1.0.0, <3.0.0'` returns 2.0.0.
+    #  Constraints are answered from the process wide version index of the directory, see
+    #  mFileSystem.versionIndexLib.VersionIndex.query method and mFileSystem.versionLib.VersionConstraint class.
+    #
     #  @param directory    [ str       | None  | in  ] - Directory where the versioned folders are.
     #  @param absolutePath [ bool      | None  | in  ] - Whether to return absolute path of the versioned folders.
     #  @param version      [ enum, str | None  | in  ] - Requested version from sFileSystem.versionLib.Version class or a string that would match with the name of the versioned folder.
     #  @param semanticOnly [ bool      | None  | in  ] - Check semantic version, leave out any folder without semantic version naming convention.
     #  @param ignore       [ bool      | False | in  ] - Ignore if requested version doesn't exist and return the path of the version folder anyway.
     #  @param createPath   [ bool      | True  | in  ] - Create given path if it doesn't exist.
+    #  @param useIndex     [ bool      | False | in  ] - Answer from the process wide version index of the directory, see mFileSystem.versionIndexLib.VersionIndex class.
+    #  @param constraint   [ str       | None  | in  ] - Version constraint like '>=1.2, <2', or mFileSystem.versionLib.VersionConstraint instance.
     #
     #  @exception N/A
     #
@@ -778,7 +1057,9 @@ class Directory(object):
                              version=mFileSystem.versionLib.Version.kLatest,
                              semanticOnly=True,
                              ignore=False,
-                             createPath=False):
+                             createPath=False,
+                             useIndex=False,
+                             constraint=None):
 
         if not os.path.isdir(directory):
             if createPath:
@@ -787,6 +1068,49 @@ class Directory(object):
             else:
                 return None
 
+        if constraint is not None:
+            versionList = mFileSystem.versionIndexLib.getVersionIndex(directory, semanticOnly=semanticOnly).query(constraint)
+
+            if absolutePath:
+                versionList = [os.path.join(directory, x) for x in versionList]
+
+            if not versionList:
+                return None
+
+            if version == mFileSystem.versionLib.Version.kAll:
+                return versionList
+
+            elif version in (mFileSystem.versionLib.Version.kLatest,
+                             mFileSystem.versionLib.Version.kCurrent,
+                             mFileSystem.versionLib.Version.kLast):
+                return versionList[-1]
+
+            elif version == mFileSystem.versionLib.Version.kFirst:
+                return versionList[0]
+
+            elif version == mFileSystem.versionLib.Version.kPrevious:
+                return versionList[-2] if len(versionList) > 1 else versionList[0]
+
+            versionList = [x for x in versionList if os.path.basename(x) == version]
+
+            return versionList[0] if versionList else None
+
+        if useIndex:
+            result = mFileSystem.versionIndexLib.getVersionIndex(directory, semanticOnly=semanticOnly).get(version)
+
+            if result is None and ignore and not isinstance(version, tuple) and \
+               version not in mFileSystem.versionIndexLib.VERSION_OPTIONS:
+                # We ignore if requested version folder doesn't exist
+                result = version
+
+            if result is None or not absolutePath:
+                return result
+
+            if version == mFileSystem.versionLib.Version.kAll:
+                return [os.path.join(directory, x) for x in result]
+
+            return os.path.join(directory, result)
+
         _directory  = Directory(directory)
 
         versionList = None
@@ -800,7 +1124,7 @@ class Directory(object):
             versionList = [x for x in versionList if re.search(r'([0-9]{1,}\.[0-9]{1,}\.[0-9]{1,})', x)]
 
         if versionList:
-            versionList.sort(key=lambda x: [int(x) for x in x.split('.')])
+            versionList.sort(key=lambda x: [int(y) for y in os.path.basename(x).split('.')])
 
 
         if version == mFileSystem.versionLib.Version.kAll:
@@ -824,7 +1148,7 @@ class Directory(object):
             return versionList[-2:][0]
 
         else:
-            versionList = [x for x in versionList if x == version]
+            versionList = [x for x in versionList if os.path.basename(x) == version]
             if versionList:
                 return versionList[0]
 
@@ -867,6 +1191,8 @@ class Directory(object):
     #  @param version      [ enum, str, int | None  | in  ] - Requested version from mFileSystem.versionLib.Version class, string or int that would match with the version of the file.
     #  @param extension    [ str            | None  | in  ] - Extension of the files to be listed.
     #  @param createPath   [ bool           | True  | in  ] - Create given path if it doesn't exist.
+    #  @param usePointer   [ bool           | False | in  ] - Use the latest pointer file for the latest version, see findLatestVersionedFile method.
+    #  @param baseName     [ str            | None  | in  ] - Base name of the files for the latest version, see findLatestVersionedFile method.
     #
     #  @exception N/A
     #
@@ -878,7 +1204,9 @@ class Directory(object):
                           absolutePath=False,
                           version=mFileSystem.versionLib.Version.kLatest,
                           extension=None,
-                          createPath=True):
+                          createPath=True,
+                          usePointer=False,
+                          baseName=None):
 
         if not os.path.isdir(directory):
             if createPath:
@@ -886,6 +1214,15 @@ class Directory(object):
             else:
                 return None
 
+        if version in (mFileSystem.versionLib.Version.kLatest,
+                       mFileSystem.versionLib.Version.kCurrent,
+                       mFileSystem.versionLib.Version.kLast):
+            return Directory.findLatestVersionedFile(directory,
+                                                     absolutePath=absolutePath,
+                                                     extension=extension,
+                                                     usePointer=usePointer,
+                                                     baseName=baseName)
+
         _directory  = Directory(directory)
 
         versionList = None
@@ -930,5 +1267,363 @@ class Directory(object):
 
         return None
 
+    #
+    ## @brief Find the latest versioned file under given path.
+    #
+    #  Directory entries are scanned once and the greatest name is kept, unlike listVersionedFiles method
+    #  with mFileSystem.versionLib.Version.kAll argument, which sorts all the versioned files.
+    #
+    #  If `baseName` argument is provided, only the files of given base name are searched and the greatest
+    #  version is kept. If `usePointer` argument is provided True as well, the latest pointer file of the base
+    #  name and the extension maintained by setLatestVersionedFile method is read instead, which takes constant
+    #  time regardless of the number of files. The pointer may lag behind, so the following versions are probed
+    #  past gaps of up to VERSION_PROBE_MAX_GAP missing versions and the latest one of them is returned. Directory is scanned if the pointer file doesn't exist or the
+    #  file it points to has been removed. Pointer is not used if `baseName` argument is not provided.
+    #
+    #  @param directory    [ str  | None  | in  ] - Directory where the versioned files are.
+    #  @param absolutePath [ bool | False | in  ] - Whether to return absolute path of the versioned file.
+    #  @param extension    [ str  | None  | in  ] - Extension of the files to be searched.
+    #  @param usePointer   [ bool | False | in  ] - Whether to read the latest pointer file.
+    #  @param baseName     [ str  | None  | in  ] - Base name of the files to be searched.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Versioned file.
+    #  @return None - If no versioned file found.
+    @staticmethod
+    def findLatestVersionedFile(directory, absolutePath=False, extension=None, usePointer=False, baseName=None):
+
+        if extension and not extension.startswith('.'):
+            extension = '.{}'.format(extension)
+
+        latest = None
+
+        if baseName is not None:
+
+            version = 0
+
+            if usePointer:
+                version = Directory._readLatestPointerVersion(directory, baseName, extension)
+
+                if version and os.path.isfile(os.path.join(directory, Directory._getVersionedFileName(baseName, version, extension))):
+                    version = Directory._probeLatestVersion(directory, baseName, extension, version)
+                    latest  = Directory._getVersionedFileName(baseName, version, extension)
+
+            if not latest:
+                latest = Directory._scanLatestVersion(directory, baseName, extension)[1]
+
+        else:
+            match = Directory.VERSIONED_FILE_RE.search
+
+            if hasattr(os, 'scandir'):
+                names = (x.name for x in os.scandir(directory) if \
+                         (extension and os.path.splitext(x.name)[1] == extension) or (not extension and x.is_file()))
+            else:
+                names = (x for x in os.listdir(directory) if \
+                         (extension and os.path.splitext(x)[1] == extension) or \
+                         (not extension and os.path.isfile(os.path.join(directory, x))))
+
+            for name in names:
+                if (latest is None or name > latest) and not name.startswith('.') and match(name):
+                    latest = name
+
+        if latest is None:
+            return None
+
+        if absolutePath:
+            return Directory.join(directory, latest)
+
+        return latest
+
+    #
+    ## @brief Set the latest versioned file under given path.
+    #
+    #  The name of the file is written into the latest pointer file of its base name and extension atomically,
+    #  so the file can be found in constant time by findLatestVersionedFile method. This method should be
+    #  called each time a new version is published.
+    #
+    #  @param directory [ str | None | in  ] - Directory where the versioned files are.
+    #  @param fileName  [ str | None | in  ] - Name of the latest versioned file, like file.v001.txt.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, it is taken from the file name if it's not provided.
+    #
+    #  @exception ValueError - If given file name is not a versioned file name.
+    #
+    #  @return str - Absolute path of the pointer file.
+    @staticmethod
+    def setLatestVersionedFile(directory, fileName, extension=None):
+
+        fileName = os.path.basename(fileName)
+
+        if extension:
+            if not extension.startswith('.'):
+                extension = '.{}'.format(extension)
+            stem = fileName[:-len(extension)] if fileName.endswith(extension) else ''
+        else:
+            stem, extension = os.path.splitext(fileName)
+
+        match = Directory.VERSIONED_FILE_NAME_RE.match(stem)
+        if not match:
+            raise ValueError('Not a versioned file name: {}'.format(fileName))
+
+        pointerFile = Directory.getLatestPointerFile(directory, extension, baseName=match.group(1))
+
+        with mFileSystem.fileLib.AtomicWriter(pointerFile) as outFile:
+            outFile.write(fileName)
+
+        return pointerFile
+
+    #
+    ## @brief Get the latest pointer file of given path.
+    #
+    #  Pointer files are kept per base name and extension, since versions are allocated per base name.
+    #
+    #  @param directory [ str | None | in  ] - Directory where the versioned files are.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, like .txt.
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned files.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the pointer file.
+    @staticmethod
+    def getLatestPointerFile(directory, extension=None, baseName=None):
+
+        return os.path.join(directory, '{}{}{}'.format(Directory.LATEST_POINTER_FILE_NAME,
+                                                       '.{}'.format(baseName) if baseName else '',
+                                                       extension or ''))
+
+    #
+    ## @brief Create the next semantic versioned folder under given path.
+    #
+    #  The next version is computed from the latest version in the process wide version index of the
+    #  directory, see mFileSystem.versionIndexLib.getVersionIndex function, and allocated by an exclusive
+    #  mkdir. If another process allocates the same version first, the following version is tried, so
+    #  concurrent publishers never get the same folder and never list the directory again.
+    #
+    #  Say the latest folder is 1.2.3, the following folders would be created for given `component` argument.
+    #
+    #  Component | Creates |
+    #  --------- | ------- |
+    #  0         | 2.0.0   |
+    #  1         | 1.3.0   |
+    #  2         | 1.2.4   |
+    #
+    #  @param directory      [ str | None    | in  ] - Directory where the versioned folders are.
+    #  @param component      [ int | 0       | in  ] - Index of the version component to be incremented, following components are reset to 0.
+    #  @param initialVersion [ str | '1.0.0' | in  ] - Version to be created if there is no versioned folder.
+    #  @param maxRetries     [ int | 100     | in  ] - Maximum number of versions to try.
+    #
+    #  @exception mFileSystem.exceptionLib.DirectoryAlreadyExists - If all tried versions have been allocated by others.
+    #
+    #  @return str - Absolute path of the created folder.
+    @staticmethod
+    def createNextVersion(directory, component=0, initialVersion='1.0.0', maxRetries=100):
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        index     = mFileSystem.versionIndexLib.getVersionIndex(directory, semanticOnly=True)
+        latest    = index.get(mFileSystem.versionLib.Version.kLatest)
+        candidate = None
+
+        if latest is None:
+            candidate = mFileSystem.versionIndexLib.parseVersion(initialVersion)
+        else:
+            candidate = Directory._incrementVersion(mFileSystem.versionIndexLib.parseVersion(latest), component)
+
+        for i in range(maxRetries):
+
+            folder = os.path.join(directory, '.'.join(str(x) for x in candidate))
+
+            try:
+                os.mkdir(folder)
+                return folder
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+
+            candidate = Directory._incrementVersion(candidate, component)
+
+        raise mFileSystem.exceptionLib.DirectoryAlreadyExists('Could not allocate a new version under: {}'.format(directory))
+
+    #
+    ## @brief Create the next versioned file under given path.
+    #
+    #  Files are named like `baseName.v001.extension`. The next version is computed from the latest pointer
+    #  file of the base name and the extension if it exists, see setLatestVersionedFile method, followed by
+    #  probing the next versions, or by scanning the directory once otherwise. The file is allocated by an
+    #  exclusive create, if another process allocates the same version first the versions following it are
+    #  probed and the next one of the latest existing version is tried.
+    #
+    #  The pointer file is updated once the file is created unless it already holds a later version. Reading
+    #  and updating the pointer is not atomic, a concurrent publisher may still overwrite it with an earlier
+    #  version, therefore the pointer may lag behind the latest file. findLatestVersionedFile method probes
+    #  the versions following the pointer, so it finds the latest file regardless.
+    #
+    #  @param directory  [ str | None | in  ] - Directory where the versioned files are.
+    #  @param baseName   [ str | None | in  ] - Base name of the files.
+    #  @param extension  [ str | None | in  ] - Extension of the files.
+    #  @param maxRetries [ int | 100  | in  ] - Maximum number of versions to try.
+    #
+    #  @exception mFileSystem.exceptionLib.FileAlreadyExists - If all tried versions have been allocated by others.
+    #
+    #  @return str - Absolute path of the created empty file.
+    @staticmethod
+    def createNextVersionedFile(directory, baseName, extension, maxRetries=100):
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        if not extension.startswith('.'):
+            extension = '.{}'.format(extension)
+
+        version = Directory._readLatestPointerVersion(directory, baseName, extension)
+
+        if version:
+            version = Directory._probeLatestVersion(directory, baseName, extension, version)
+        else:
+            version = Directory._scanLatestVersion(directory, baseName, extension)[0]
+
+        for i in range(maxRetries):
+
+            version += 1
+            fileName = Directory._getVersionedFileName(baseName, version, extension)
+            absFile  = os.path.join(directory, fileName)
+
+            try:
+                os.close(os.open(absFile, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+                # Skip the versions allocated by others meanwhile
+                version = Directory._probeLatestVersion(directory, baseName, extension, version)
+                continue
+
+            # Avoid moving the pointer back if a later version has been published meanwhile
+            if Directory._readLatestPointerVersion(directory, baseName, extension) < version:
+                Directory.setLatestVersionedFile(directory, fileName, extension=extension)
+
+            return absFile
+
+        raise mFileSystem.exceptionLib.FileAlreadyExists('Could not allocate a new version under: {}'.format(directory))
+
+    #
+    ## @brief Read the version of the file in the latest pointer file of given base name and extension.
+    #
+    #  @param directory [ str | None | in  ] - Directory where the versioned files are.
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned files.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, like .txt.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Version, 0 if there is no pointer file or it doesn't hold a file of given base name and extension.
+    @staticmethod
+    def _readLatestPointerVersion(directory, baseName, extension):
+
+        try:
+            with open(Directory.getLatestPointerFile(directory, extension, baseName=baseName), 'r') as pointerFile:
+                match = Directory._getVersionedFilePattern(baseName, extension).match(pointerFile.read().strip())
+        except (IOError, OSError):
+            return 0
+
+        return int(match.group(1)) if match else 0
+
+    #
+    ## @brief Find the latest version of the files of given base name and extension by scanning given path.
+    #
+    #  @param directory [ str | None | in  ] - Directory where the versioned files are.
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned files.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, like .txt.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Version and name of the file, (0, None) if there is no versioned file.
+    @staticmethod
+    def _scanLatestVersion(directory, baseName, extension):
+
+        match  = Directory._getVersionedFilePattern(baseName, extension).match
+        latest = (0, None)
+
+        for name in os.listdir(directory):
+            result = match(name)
+            if result and int(result.group(1)) > latest[0]:
+                latest = (int(result.group(1)), name)
+
+        return latest
+
+    #
+    ## @brief Probe the versions following given version and get the latest existing one.
+    #
+    #  Versions removed in the middle, by mFileSystem.versionRetentionLib.prune function for instance, are
+    #  probed past as long as no more than VERSION_PROBE_MAX_GAP consecutive versions are missing. Later
+    #  versions following a longer gap are not found.
+    #
+    #  @param directory [ str | None | in  ] - Directory where the versioned files are.
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned files.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, like .txt.
+    #  @param version   [ int | None | in  ] - Version to start from.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Version.
+    @staticmethod
+    def _probeLatestVersion(directory, baseName, extension, version):
+
+        gap = 0
+
+        while gap <= Directory.VERSION_PROBE_MAX_GAP:
+
+            if os.path.isfile(os.path.join(directory, Directory._getVersionedFileName(baseName, version + gap + 1, extension))):
+                version += gap + 1
+                gap      = 0
+            else:
+                gap     += 1
+
+        return version
+
+    #
+    ## @brief Get name of the versioned file of given base name, version and extension.
+    #
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned file.
+    #  @param version   [ int | None | in  ] - Version.
+    #  @param extension [ str | None | in  ] - Extension of the versioned file, like .txt.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name of the file, like file.v001.txt.
+    @staticmethod
+    def _getVersionedFileName(baseName, version, extension):
+
+        return '{}.v{:03d}{}'.format(baseName, version, extension or '')
+
+    #
+    ## @brief Get pattern of the names of the versioned files of given base name and extension.
+    #
+    #  @param baseName  [ str | None | in  ] - Base name of the versioned files.
+    #  @param extension [ str | None | in  ] - Extension of the versioned files, like .txt.
+    #
+    #  @exception N/A
+    #
+    #  @return re.Pattern - Pattern, first group of which is the version.
+    @staticmethod
+    def _getVersionedFilePattern(baseName, extension):
+
+        return re.compile(r'^{}\.v([0-9]{{3,}}){}$'.format(re.escape(baseName), re.escape(extension or '')))
+
+    #
+    ## @brief Increment given version.
+    #
+    #  @param version   [ tuple of int | None | in  ] - Version.
+    #  @param component [ int          | None | in  ] - Index of the component to be incremented, following components are reset to 0.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple of int - Incremented version.
+    @staticmethod
+    def _incrementVersion(version, component):
+
+        version = tuple(version) + (0,) * max(0, component + 1 - len(version))
+
+        return version[:component] + (version[component] + 1,) + (0,) * (len(version) - component - 1)
+
     #
     ## @}
@@ -0,0 +1,385 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/directoryWalkerLib.py @brief [ FILE   ] - Walk directory trees.
+## @package mFileSystem.directoryWalkerLib    @brief [ MODULE ] - Walk directory trees.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Entry kind of a file.
+_FILE            = 0
+
+## [ int ] - Entry kind of a folder.
+_FOLDER          = 1
+
+## [ int ] - Entry kind of the contents of a folder.
+_DESCEND         = 2
+
+## [ int ] - Entry kind of the contents of a folder, which is a symbolic link.
+_DESCEND_SYMLINK = 3
+
+#
+## @brief [ CLASS ] - Class to collect metrics of a walk per depth.
+#
+#  Entries directly under the walked directory are at depth 1.
+class WalkStats(object):
+
+    ## [ tuple of str ] - Names of the counters.
+    COUNTERS = ('directories', 'files', 'symlinks', 'loops', 'errors')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of list of int ] - Counters of each depth, index 0 is depth 1.
+        self._depths = []
+
+    #
+    ## @brief Get counters of given depth.
+    #
+    #  @param depth [ int | None | in  ] - Depth.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Counters in the order of COUNTERS.
+    def _counters(self, depth):
+
+        while len(self._depths) < depth:
+            self._depths.append([0] * len(WalkStats.COUNTERS))
+
+        return self._depths[depth - 1]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Record an event.
+    #
+    #  @param counter [ str | None | in  ] - Name of the counter, one of COUNTERS.
+    #  @param depth   [ int | None | in  ] - Depth of the entry.
+    #
+    #  @exception ValueError - If the counter doesn't exist.
+    #
+    #  @return None - None.
+    def record(self, counter, depth):
+
+        self._counters(depth)[WalkStats.COUNTERS.index(counter)] += 1
+
+    #
+    ## @brief Deepest depth reached.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Depth.
+    def maxDepth(self):
+
+        return len(self._depths)
+
+    #
+    ## @brief Get a counter.
+    #
+    #  @param counter [ str | None | in  ] - Name of the counter, one of COUNTERS.
+    #  @param depth   [ int | None | in  ] - Depth, total of all the depths if None.
+    #
+    #  @exception ValueError - If the counter doesn't exist.
+    #
+    #  @return int - Count.
+    def count(self, counter, depth=None):
+
+        index = WalkStats.COUNTERS.index(counter)
+
+        if depth is None:
+            return sum(x[index] for x in self._depths)
+
+        if depth < 1 or depth > len(self._depths):
+            return 0
+
+        return self._depths[depth - 1][index]
+
+    #
+    ## @brief Get stats as dict.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Totals of the counters and a list of counters per depth.
+    def asDict(self):
+
+        result = dict((x, self.count(x)) for x in WalkStats.COUNTERS)
+
+        result['depths'] = [dict(zip(WalkStats.COUNTERS, x), depth=i + 1) for i, x in enumerate(self._depths)]
+
+        return result
+
+#
+## @brief [ CLASS ] - Class to walk a directory tree depth first.
+#
+#  Directories are traversed with an explicit stack rather than recursion, so the depth of a tree is not
+#  limited by the recursion limit of Python. Entries of each directory are listed once with os.scandir
+#  where available.
+#
+#  If entries are sorted, they are yielded in the sorted order of their paths, so no global sort is
+#  needed. A folder is yielded at the position of its own path and its contents at the position of its
+#  path followed by a separator, `a`, `a-b`, `a/c` for instance.
+#
+#  When symbolic links are followed, loops are detected by the (device, inode) pairs of the directories
+#  being traversed, a symbolic link to one of them is yielded but not traversed again.
+#
+# @code
+#import mFileSystem.directoryWalkerLib
+#
+#walker = mFileSystem.directoryWalkerLib.DirectoryWalker('/mnt/project', maxDepth=3)
+#for directory, name, isFolder in walker.walk():
+#    pass
+#
+#walker.stats().asDict()
+# @endcode
+class DirectoryWalker(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory      [ str  | None | in  ] - Absolute path of the directory to walk.
+    #  @param maxDepth       [ int  | None | in  ] - Maximum depth of the entries, entries directly under the directory are at depth 1, unlimited if None.
+    #  @param followSymlinks [ bool | True | in  ] - Traverse symbolic links to directories.
+    #  @param ignoreDot      [ bool | True | in  ] - Ignore files and directories that start with dot (hidden ones).
+    #  @param sort           [ bool | True | in  ] - Yield entries in the sorted order of their paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory, maxDepth=None, followSymlinks=True, ignoreDot=True, sort=True):
+
+        ## [ str ] - Absolute path of the directory to walk.
+        self._directory      = directory
+
+        ## [ int ] - Maximum depth of the entries.
+        self._maxDepth       = maxDepth
+
+        ## [ bool ] - Traverse symbolic links to directories.
+        self._followSymlinks = followSymlinks
+
+        ## [ bool ] - Ignore hidden files and directories.
+        self._ignoreDot      = ignoreDot
+
+        ## [ bool ] - Yield entries in the sorted order of their paths.
+        self._sort           = sort
+
+        ## [ mFileSystem.directoryWalkerLib.WalkStats ] - Stats of the last walk.
+        self._stats          = WalkStats()
+
+    #
+    ## @brief Iterate over the entries.
+    #
+    #  @see walk
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Entries.
+    def __iter__(self):
+
+        return self.walk()
+
+    #
+    ## @brief List entries of given directory.
+    #
+    #  @param path  [ str | None | in  ] - Absolute path of a directory.
+    #  @param depth [ int | None | in  ] - Depth of the entries.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - (key, name, kind) tuples, empty if the directory can't be listed.
+    def _listEntries(self, path, depth):
+
+        entries   = []
+        ignoreDot = self._ignoreDot
+        sep       = os.sep
+
+        try:
+            if hasattr(os, 'scandir'):
+                items = [(x.name, x.is_dir(), x.is_file(), x.is_symlink()) for x in os.scandir(path) \
+                         if not (ignoreDot and x.name.startswith('.'))]
+            else:
+                items = []
+                for name in os.listdir(path):
+                    if ignoreDot and name.startswith('.'):
+                        continue
+                    entryPath = os.path.join(path, name)
+                    items.append((name, os.path.isdir(entryPath), os.path.isfile(entryPath), os.path.islink(entryPath)))
+        except OSError:
+            self._stats.record('errors', depth)
+            return entries
+
+        for name, isFolder, isFile, isSymlink in items:
+
+            if isFolder:
+                entries.append((name, name, _FOLDER))
+
+                if isSymlink:
+                    self._stats.record('symlinks', depth)
+                    if self._followSymlinks:
+                        entries.append((name + sep, name, _DESCEND_SYMLINK))
+                    continue
+
+                entries.append((name + sep, name, _DESCEND))
+
+            elif isFile:
+                entries.append((name, name, _FILE))
+
+        if self._sort:
+            entries.sort()
+
+        return entries
+
+    #
+    ## @brief Get (device, inode) pair of given directory.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception OSError - If the directory can't be stat'ed.
+    #
+    #  @return tuple - Device and inode.
+    def _getIdentity(self, path):
+
+        stat = os.stat(path)
+
+        return stat.st_dev, stat.st_ino
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the directory to walk.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Directory.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @brief Stats of the last walk, they are updated while walking.
+    #
+    #  @exception N/A
+    #
+    #  @return mFileSystem.directoryWalkerLib.WalkStats - Stats.
+    def stats(self):
+
+        return self._stats
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Walk the directory.
+    #
+    #  Identities of the directories are read only when a symbolic link is about to be traversed, so trees
+    #  without symbolic links are walked without a stat per directory.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - (directory, name, isFolder) tuples, directory is relative to the walked directory with a trailing separator.
+    def walk(self):
+
+        self._stats = WalkStats()
+
+        if self._maxDepth is not None and self._maxDepth < 1:
+            return
+
+        root     = self._directory
+        sep      = os.sep
+        maxDepth = self._maxDepth
+        stats    = self._stats
+
+        # Frames are [directory, entries, identity], identities are read on demand
+        stack = [['', iter(self._listEntries(root, 1)), None]]
+
+        while stack:
+
+            frame = stack[-1]
+            depth = len(stack)
+
+            for key, name, kind in frame[1]:
+
+                if kind == _FILE:
+                    stats.record('files', depth)
+                    yield frame[0], name, False
+
+                elif kind == _FOLDER:
+                    stats.record('directories', depth)
+                    yield frame[0], name, True
+
+                else:
+                    if maxDepth is not None and depth >= maxDepth:
+                        continue
+
+                    subDirectory = frame[0] + name + sep
+                    path         = os.path.join(root, subDirectory)
+
+                    if kind == _DESCEND_SYMLINK:
+                        try:
+                            identity = self._getIdentity(path)
+                            for ancestor in stack:
+                                if ancestor[2] is None:
+                                    ancestor[2] = self._getIdentity(os.path.join(root, ancestor[0]))
+                        except OSError:
+                            stats.record('errors', depth + 1)
+                            continue
+
+                        if any(x[2] == identity for x in stack):
+                            stats.record('loops', depth + 1)
+                            continue
+
+                    stack.append([subDirectory, iter(self._listEntries(path, depth + 1)), None])
+                    break
+
+            else:
+                stack.pop()
@@ -25,8 +25,13 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import binascii
+import errno
+import io
 import os
 import shutil
+import stat
+import sys
 
 import mFileSystem.directoryLib
 import mFileSystem.exceptionLib
@@ -36,6 +41,168 @@ import mFileSystem.exceptionLib
 # -----------------------------------------------------------------------------------------------------
 # CODE
 # -----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Maximum number of names tried to create a temporary file.
+TEMPORARY_FILE_MAX_RETRIES = 100
+
+#
+## [ str ] - Encoding of the files read and written in text mode.
+TEXT_ENCODING              = 'utf-8'
+
+#
+## [ function ] - Function to replace a file with another one atomically.
+_replaceFile = getattr(os, 'replace', os.rename)
+
+#
+## @brief Open given file in text mode with mFileSystem.fileLib.TEXT_ENCODING encoding.
+#
+#  Files are opened in the native str mode in Python 2, same as mFileSystem.fileLib.AtomicWriter class does.
+#
+#  @param path [ str | None | in  ] - Absolute path of a file.
+#  @param mode [ str | None | in  ] - Mode, such as 'r' or 'a'.
+#
+#  @exception IOError - If the file can't be opened.
+#
+#  @return file - File object.
+def openTextFile(path, mode):
+
+    if sys.version_info[0] < 3:
+        return open(path, mode)
+
+    return io.open(path, mode, encoding=TEXT_ENCODING)
+
+#
+## @brief [ CLASS ] - Context manager to write a file atomically.
+#
+#  Content is written into a temporary file in the same directory as the target file, which then
+#  replaces the target file. Therefore readers either see the previous content or the new content
+#  in full, never a partially written file. Temporary file is removed if an exception is raised.
+#
+#  Permissions of the target file are preserved if it exists, otherwise the file gets the same permissions
+#  as a newly created one since the temporary file is created with the file mode creation mask of the process
+#  applied by the operating system. Files are written in text mode with mFileSystem.fileLib.TEXT_ENCODING
+#  encoding by default, which mFileSystem.fileLib.File class uses to read and append as well.
+#
+# @code
+#import mFileSystem.fileLib
+#
+#with mFileSystem.fileLib.AtomicWriter('absolutePath/file.txt', fsync=True) as outFile:
+#    outFile.write('content')
+# @endcode
+class AtomicWriter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path     [ str  | None    | in  ] - Absolute path of the target file.
+    #  @param binary   [ bool | False   | in  ] - Whether the file will be written in binary mode.
+    #  @param fsync    [ bool | False   | in  ] - Whether to flush the file and its directory to the disk before returning.
+    #  @param encoding [ str  | 'utf-8' | in  ] - Encoding of the file if it is written in text mode, see mFileSystem.fileLib.TEXT_ENCODING.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path, binary=False, fsync=False, encoding=TEXT_ENCODING):
+
+        ## [ str ] - Absolute path of the target file, symbolic links are resolved so the link itself is preserved.
+        self._path          = os.path.realpath(path)
+
+        ## [ bool ] - Whether the file will be written in binary mode.
+        self._binary        = binary
+
+        ## [ bool ] - Whether to flush the file and its directory to the disk.
+        self._fsync         = fsync
+
+        ## [ str ] - Encoding of the file if it is written in text mode.
+        self._encoding      = encoding
+
+        ## [ str ] - Absolute path of the temporary file.
+        self._temporaryFile = None
+
+        ## [ file ] - File object of the temporary file.
+        self._fileObject    = None
+
+    #
+    ## @brief Create the temporary file.
+    #
+    #  @exception OSError - If the temporary file can't be created.
+    #
+    #  @return file - File object of the temporary file.
+    def __enter__(self):
+
+        directory, fileName = os.path.split(self._path)
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+        for i in range(TEMPORARY_FILE_MAX_RETRIES):
+
+            self._temporaryFile = os.path.join(directory, '.{}.{}.tmp'.format(fileName,
+                                                                              binascii.hexlify(os.urandom(6)).decode('ascii')))
+
+            try:
+                # Mode creation mask is applied by the operating system
+                fileDescriptor = os.open(self._temporaryFile, flags, 0o666)
+                break
+            except OSError as error:
+                if error.errno != errno.EEXIST or i == TEMPORARY_FILE_MAX_RETRIES - 1:
+                    raise
+
+        if self._binary:
+            self._fileObject = os.fdopen(fileDescriptor, 'wb')
+        elif sys.version_info[0] < 3:
+            self._fileObject = os.fdopen(fileDescriptor, 'w')
+        else:
+            self._fileObject = io.open(fileDescriptor, 'w', encoding=self._encoding)
+
+        return self._fileObject
+
+    #
+    ## @brief Replace the target file with the temporary file, remove the temporary file if an exception is raised.
+    #
+    #  @param excType   [ type      | None | in  ] - Exception type.
+    #  @param excValue  [ Exception | None | in  ] - Exception.
+    #  @param traceback [ traceback | None | in  ] - Traceback.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Always `False`, exceptions are propagated.
+    def __exit__(self, excType, excValue, traceback):
+
+        try:
+            if excType is None:
+                self._fileObject.flush()
+                if self._fsync:
+                    os.fsync(self._fileObject.fileno())
+
+            self._fileObject.close()
+
+            if excType is not None:
+                os.remove(self._temporaryFile)
+                return False
+
+            if os.path.isfile(self._path):
+                os.chmod(self._temporaryFile, stat.S_IMODE(os.stat(self._path).st_mode))
+
+            _replaceFile(self._temporaryFile, self._path)
+
+        except BaseException:
+            if os.path.isfile(self._temporaryFile):
+                os.remove(self._temporaryFile)
+            raise
+
+        if self._fsync and hasattr(os, 'O_DIRECTORY'):
+            # Make the rename itself durable
+            directoryDescriptor = os.open(os.path.dirname(self._path), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directoryDescriptor)
+            finally:
+                os.close(directoryDescriptor)
+
+        return False
+
 #
 ## @brief [ CLASS ] - Operate on files.
 class File(object):
@@ -400,20 +567,27 @@ class File(object):
     #
     ## @brief Write given line into the file.
     #
-    #  @param line   [ str  | None | in  ] - Line to be written.
-    #  @param append [ bool | True | in  ] - Whether the line will be appended.
+    #  File is written atomically if `append` argument is provided False, see mFileSystem.fileLib.AtomicWriter class.
+    #
+    #  @param line   [ str  | None  | in  ] - Line to be written.
+    #  @param append [ bool | True  | in  ] - Whether the line will be appended.
+    #  @param fsync  [ bool | False | in  ] - Whether to flush the file to the disk before returning.
     #
     #  @exception N/A
     #
     #  @return bool - Result.
-    def write(self, line, append=True):
+    def write(self, line, append=True, fsync=False):
 
         if not self.exists():
             return False
 
-        _file = open(self._file, 'a' if append else 'w')
-        _file.write(line)
-        _file.close()
+        if append:
+            _file = openTextFile(self._file, 'a')
+            _file.write(line)
+            _file.close()
+        else:
+            with AtomicWriter(self._file, fsync=fsync) as _file:
+                _file.write(line)
 
         self.update()
 
@@ -422,20 +596,27 @@ class File(object):
     #
     ## @brief Write given lines into the file.
     #
-    #  @param lines  [ list of str | None | in  ] - Lines to be written.
-    #  @param append [ bool        | True | in  ] - Whether the lines will be appended.
+    #  File is written atomically if `append` argument is provided False, see mFileSystem.fileLib.AtomicWriter class.
+    #
+    #  @param lines  [ list of str | None  | in  ] - Lines to be written.
+    #  @param append [ bool        | True  | in  ] - Whether the lines will be appended.
+    #  @param fsync  [ bool        | False | in  ] - Whether to flush the file to the disk before returning.
     #
     #  @exception N/A
     #
     #  @return bool - Result.
-    def writeLines(self, lines, append=True):
+    def writeLines(self, lines, append=True, fsync=False):
 
         if not self.exists():
             return False
 
-        _file = open(self._file, 'a' if append else 'w')
-        _file.writelines(lines)
-        _file.close()
+        if append:
+            _file = openTextFile(self._file, 'a')
+            _file.writelines(lines)
+            _file.close()
+        else:
+            with AtomicWriter(self._file, fsync=fsync) as _file:
+                _file.writelines(lines)
 
         self.update()
 
@@ -455,7 +636,7 @@ class File(object):
         if not self.exists():
             return None
 
-        _file = open(self._file, 'r')
+        _file = openTextFile(self._file, 'r')
         self._content = _file.read()
         _file.close()
 
@@ -475,7 +656,7 @@ class File(object):
         if not self.exists():
             return None
 
-        _file = open(self._file, 'r')
+        _file = openTextFile(self._file, 'r')
         self._content = _file.readlines()
         _file.close()
 
@@ -0,0 +1,503 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/jsonBackendLib.py @brief [ FILE   ] - JSON backends.
+## @package mFileSystem.jsonBackendLib    @brief [ MODULE ] - JSON backends.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import json
+import os
+import sys
+import timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## [ float ] - Positive infinity.
+_INFINITY = float('inf')
+
+#
+## @brief Whether given content contains NaN or Infinity, which can't be represented by some of the backends.
+#
+#  @param content [ variant | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def containsNonFiniteFloat(content):
+
+    stack = [content]
+
+    while stack:
+
+        value = stack.pop()
+
+        if isinstance(value, float):
+            if value != value or value in (_INFINITY, -_INFINITY):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return False
+
+
+#
+## @brief [ CLASS ] - JSON backend using standard library json module.
+#
+#  This class is the base class of the other backends, which fall back to the methods of this class
+#  for the content they can't handle the same way the standard library does.
+class JSONBackend(object):
+
+    ## [ str ] - Name of the backend.
+    NAME = 'json'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse given JSON document.
+    #
+    #  @param content [ str, bytes | None | in  ] - JSON document.
+    #
+    #  @exception ValueError - If given content is not a valid JSON document.
+    #
+    #  @return variant - Content.
+    def loads(self, content):
+
+        if isinstance(content, bytes) and not isinstance(content, str):
+            content = content.decode('utf-8')
+
+        return json.loads(content)
+
+    #
+    ## @brief Serialize given content as a JSON document.
+    #
+    #  @param content [ variant | None | in  ] - Content.
+    #  @param indent  [ int     | None | in  ] - Indentation.
+    #
+    #  @exception TypeError - If given content is not serializable.
+    #
+    #  @return str - JSON document.
+    def dumps(self, content, indent=None):
+
+        return json.dumps(content, indent=indent)
+
+    #
+    ## @brief Parse JSON document from given file object.
+    #
+    #  @param fileObject [ file | None | in  ] - File object opened for reading in binary mode.
+    #
+    #  @exception ValueError - If the content of the file is not a valid JSON document.
+    #
+    #  @return variant - Content.
+    def load(self, fileObject):
+
+        return self.loads(fileObject.read())
+
+    #
+    ## @brief Serialize given content as a JSON document into given file object.
+    #
+    #  @param content    [ variant | None | in  ] - Content.
+    #  @param fileObject [ file    | None | in  ] - File object opened for writing in text mode.
+    #  @param indent     [ int     | None | in  ] - Indentation.
+    #
+    #  @exception TypeError - If given content is not serializable.
+    #
+    #  @return None - None.
+    def dump(self, content, fileObject, indent=None):
+
+        fileObject.write(self.dumps(content, indent=indent))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the module this backend uses is installed.
+    #
+    #  @param cls [ object | None | in  ] - Class object.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @classmethod
+    def isAvailable(cls):
+
+        return True
+
+#
+## @brief [ CLASS ] - JSON backend using orjson module.
+#
+#  orjson supports only two spaces of indentation, 64 bit integers and string keys, standard library
+#  is used for anything else. NaN and Infinity, which orjson writes as null, are serialized by the standard
+#  library as well so they are never lost.
+#
+#  Documents are formatted differently than the ones of the standard library, separators are compact and
+#  non ASCII characters are written as they are rather than being escaped, so documents must be written
+#  and read as UTF-8, see mFileSystem.jsonFileLib.JSONFile.write method.
+class OrjsonBackend(JSONBackend):
+
+    ## [ str ] - Name of the backend.
+    NAME = 'orjson'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse given JSON document.
+    #
+    #  @param content [ str, bytes | None | in  ] - JSON document.
+    #
+    #  @exception ValueError - If given content is not a valid JSON document.
+    #
+    #  @return variant - Content.
+    def loads(self, content):
+
+        try:
+            return orjson.loads(content)
+        except ValueError:
+            # Big integers, NaN and Infinity are supported by the standard library
+            return JSONBackend.loads(self, content)
+
+    #
+    ## @brief Serialize given content as a JSON document.
+    #
+    #  @param content [ variant | None | in  ] - Content.
+    #  @param indent  [ int     | None | in  ] - Indentation.
+    #
+    #  @exception TypeError - If given content is not serializable.
+    #
+    #  @return str - JSON document.
+    def dumps(self, content, indent=None):
+
+        if indent is None:
+            option = 0
+        elif indent == 2:
+            option = orjson.OPT_INDENT_2
+        else:
+            return JSONBackend.dumps(self, content, indent=indent)
+
+        try:
+            document = orjson.dumps(content, option=option)
+        except TypeError:
+            return JSONBackend.dumps(self, content, indent=indent)
+
+        # Content is searched only if there is a null, which NaN and Infinity are written as
+        if b'null' in document and containsNonFiniteFloat(content):
+            return JSONBackend.dumps(self, content, indent=indent)
+
+        return document.decode('utf-8')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the module this backend uses is installed.
+    #
+    #  @param cls [ object | None | in  ] - Class object.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @classmethod
+    def isAvailable(cls):
+
+        return orjson is not None
+
+#
+## @brief [ CLASS ] - JSON backend using simdjson module, which is used only for parsing.
+class SimdjsonBackend(JSONBackend):
+
+    ## [ str ] - Name of the backend.
+    NAME = 'simdjson'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse given JSON document.
+    #
+    #  @param content [ str, bytes | None | in  ] - JSON document.
+    #
+    #  @exception ValueError - If given content is not a valid JSON document.
+    #
+    #  @return variant - Content.
+    def loads(self, content):
+
+        try:
+            return simdjson.loads(content)
+        except ValueError:
+            return JSONBackend.loads(self, content)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the module this backend uses is installed.
+    #
+    #  @param cls [ object | None | in  ] - Class object.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @classmethod
+    def isAvailable(cls):
+
+        return simdjson is not None
+
+#
+## @brief [ CLASS ] - JSON backend using ujson module.
+#
+#  Separators of the documents are compact if no indentation is given, indented documents are formatted
+#  the same as the ones of the standard library. Zero indentation is handled by the standard library.
+class UjsonBackend(JSONBackend):
+
+    ## [ str ] - Name of the backend.
+    NAME = 'ujson'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse given JSON document.
+    #
+    #  @param content [ str, bytes | None | in  ] - JSON document.
+    #
+    #  @exception ValueError - If given content is not a valid JSON document.
+    #
+    #  @return variant - Content.
+    def loads(self, content):
+
+        try:
+            return ujson.loads(content)
+        except ValueError:
+            return JSONBackend.loads(self, content)
+
+    #
+    ## @brief Serialize given content as a JSON document.
+    #
+    #  @param content [ variant | None | in  ] - Content.
+    #  @param indent  [ int     | None | in  ] - Indentation.
+    #
+    #  @exception TypeError - If given content is not serializable.
+    #
+    #  @return str - JSON document.
+    def dumps(self, content, indent=None):
+
+        # ujson writes compact documents for zero indentation rather than line breaks
+        if indent is not None and not (isinstance(indent, int) and indent > 0):
+            return JSONBackend.dumps(self, content, indent=indent)
+
+        try:
+            return ujson.dumps(content, indent=indent or 0, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return JSONBackend.dumps(self, content, indent=indent)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether the module this backend uses is installed.
+    #
+    #  @param cls [ object | None | in  ] - Class object.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @classmethod
+    def isAvailable(cls):
+
+        return ujson is not None
+
+#
+## [ tuple of class ] - Backends in order of preference.
+BACKENDS = (OrjsonBackend, SimdjsonBackend, UjsonBackend, JSONBackend)
+
+#
+## [ str ] - Environment variable, which can be set to the name of a backend to override the preference order.
+BACKEND_ENV_VARIABLE = 'MFILESYSTEM_JSON_BACKEND'
+
+#
+## @brief Get available backends in order of preference.
+#
+#  @exception N/A
+#
+#  @return list of class - Backends.
+def listAvailableBackends():
+
+    return [x for x in BACKENDS if x.isAvailable()]
+
+#
+## @brief Select a backend, the one set by BACKEND_ENV_VARIABLE is used if it is available.
+#
+#  @exception N/A
+#
+#  @return mFileSystem.jsonBackendLib.JSONBackend - Backend.
+def _selectBackend():
+
+    backends = listAvailableBackends()
+
+    name = os.environ.get(BACKEND_ENV_VARIABLE)
+    if name:
+        for backend in backends:
+            if backend.NAME == name:
+                return backend()
+
+    return backends[0]()
+
+#
+## [ mFileSystem.jsonBackendLib.JSONBackend ] - Backend in use, selected once at import.
+_backend = _selectBackend()
+
+#
+## @brief Get the backend in use.
+#
+#  @exception N/A
+#
+#  @return mFileSystem.jsonBackendLib.JSONBackend - Backend.
+def getBackend():
+
+    return _backend
+
+#
+## @brief Set the backend in use.
+#
+#  @param name [ str | None | in  ] - Name of the backend.
+#
+#  @exception ValueError - If backend with given name is not available.
+#
+#  @return mFileSystem.jsonBackendLib.JSONBackend - Backend.
+def setBackend(name):
+
+    global _backend
+
+    for backend in listAvailableBackends():
+        if backend.NAME == name:
+            _backend = backend()
+            return _backend
+
+    raise ValueError('JSON backend is not available: {}'.format(name))
+
+#
+## @brief Measure parse and serialization time of given content with each available backend.
+#
+#  @param content    [ variant | None | in  ] - Content.
+#  @param iterations [ int     | 10   | in  ] - Number of iterations.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names of the backends, values are dict instances, keys of which are;
+#                 loads, dumps (best time of an iteration in seconds) and size (serialized size in bytes).
+def benchmark(content, iterations=10):
+
+    results = {}
+
+    for backendClass in listAvailableBackends():
+
+        backend  = backendClass()
+        document = backend.dumps(content)
+
+        results[backend.NAME] = {'loads' : min(timeit.repeat(lambda: backend.loads(document), number=1, repeat=iterations)),
+                                 'dumps' : min(timeit.repeat(lambda: backend.dumps(content), number=1, repeat=iterations)),
+                                 'size'  : len(document.encode('utf-8'))
+                                 }
+
+    return results
+
+#
+## @brief Create content in the shape of a config file.
+#
+#  @param keyCount [ int | 500 | in  ] - Number of keys.
+#
+#  @exception N/A
+#
+#  @return dict - Content.
+def createConfigContent(keyCount=500):
+
+    return dict(('key{}'.format(i), {'enabled' : i % 2 == 0,
+                                     'value'   : i * 1.5,
+                                     'name'    : 'name{}'.format(i),
+                                     'paths'   : ['/mnt/projects/{}/{}'.format(i, x) for x in range(3)]
+                                     }) for i in range(keyCount))
+
+#
+## @brief Create content in the shape of a manifest file.
+#
+#  @param entryCount [ int | 100000 | in  ] - Number of entries.
+#
+#  @exception N/A
+#
+#  @return list of dict - Content.
+def createManifestContent(entryCount=100000):
+
+    return [{'path'    : '/mnt/projects/show/shot{:04d}/asset{}.v{:03d}.abc'.format(i // 100, i, i % 100),
+             'size'    : i * 4096,
+             'version' : i % 100,
+             'hash'    : '{:064x}'.format(i),
+             'tags'    : ['published', 'approved']
+             } for i in range(entryCount)]
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    sys.stdout.write('Selected backend: {}\n'.format(getBackend().NAME))
+
+    for shapeName, shapeContent in (('config', createConfigContent()), ('manifest', createManifestContent())):
+
+        sys.stdout.write('\n{}\n'.format(shapeName))
+
+        for backendName, result in sorted(benchmark(shapeContent).items(), key=lambda x: x[1]['loads']):
+            sys.stdout.write('    {:<10} loads: {:.6f}s  dumps: {:.6f}s  size: {} bytes\n'.format(backendName,
+                                                                                                 result['loads'],
+                                                                                                 result['dumps'],
+                                                                                                 result['size']))
@@ -25,18 +25,998 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import io
 import json
+import multiprocessing
+import os
+import re
+
+from   collections import OrderedDict
+from   threading   import Lock
 
 import mFileSystem.fileLib
+import mFileSystem.jsonBackendLib
+import mFileSystem.msgPackLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief Parse records of a JSON Lines file, which start in given byte range.
+#
+#  This function is used by mFileSystem.jsonFileLib.JSONLinesFile.readParallel method, it is defined
+#  at module level so it can be sent to worker processes.
+#
+#  @param arguments [ tuple | None | in  ] - Absolute path of the file, start and end byte offsets.
+#
+#  @exception N/A
+#
+#  @return list - Records.
+def _readJSONLinesChunk(arguments):
+
+    path, start, end = arguments
+
+    records = []
+
+    with open(path, 'rb') as inFile:
+
+        if start:
+            # Skip the record that started in the previous chunk
+            inFile.seek(start - 1)
+            inFile.readline()
+
+        while inFile.tell() < end:
+
+            line = inFile.readline()
+            if not line:
+                break
+
+            line = line.strip()
+            if line:
+                records.append(mFileSystem.jsonBackendLib.getBackend().loads(line))
+
+    return records
+
+#
+## @brief Raise an error for an attempt to alter a frozen content.
+#
+#  @exception TypeError - Always.
+#
+#  @return None - None.
+def _raiseReadOnly(*args, **kwargs):
+
+    raise TypeError('Content is read only, use a copy of it to make changes.')
+
+#
+## @brief Convert given content to a read only content recursively.
+#
+#  @param content [ variant | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return variant - Content, dict and list instances are converted to FrozenDict and FrozenList instances.
+def freezeContent(content):
+
+    if isinstance(content, dict):
+        return FrozenDict((k, freezeContent(v)) for k, v in content.items())
+
+    if isinstance(content, list):
+        return FrozenList(freezeContent(x) for x in content)
+
+    return content
+
+#
+## @brief Convert given content to a mutable content recursively.
+#
+#  @param content [ variant | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return variant - Content, dict and list instances are copied as dict and list instances.
+def thawContent(content):
+
+    if isinstance(content, dict):
+        return dict((k, thawContent(v)) for k, v in content.items())
+
+    if isinstance(content, list):
+        return [thawContent(x) for x in content]
+
+    return content
+
+#
+## @brief [ CLASS ] - Read only dict, which is used for the content shared by mFileSystem.jsonFileLib.JSONContentCache.
+class FrozenDict(dict):
+
+    __setitem__ = _raiseReadOnly
+    __delitem__ = _raiseReadOnly
+    __ior__     = _raiseReadOnly
+    clear       = _raiseReadOnly
+    pop         = _raiseReadOnly
+    popitem     = _raiseReadOnly
+    setdefault  = _raiseReadOnly
+    update      = _raiseReadOnly
+
+    #
+    ## @brief Get a mutable copy.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Copy.
+    def __copy__(self):
+
+        return dict(self)
+
+    #
+    ## @brief Get a mutable deep copy.
+    #
+    #  @param memo [ dict | None | in  ] - Memo.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Copy.
+    def __deepcopy__(self, memo):
+
+        return thawContent(self)
+
+    #
+    ## @brief Support pickling.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Reduce value.
+    def __reduce__(self):
+
+        return (FrozenDict, (dict(self),))
+
+#
+## @brief [ CLASS ] - Read only list, which is used for the content shared by mFileSystem.jsonFileLib.JSONContentCache.
+class FrozenList(list):
+
+    __setitem__ = _raiseReadOnly
+    __delitem__ = _raiseReadOnly
+    __iadd__    = _raiseReadOnly
+    __imul__    = _raiseReadOnly
+    append      = _raiseReadOnly
+    clear       = _raiseReadOnly
+    extend      = _raiseReadOnly
+    insert      = _raiseReadOnly
+    pop         = _raiseReadOnly
+    remove      = _raiseReadOnly
+    reverse     = _raiseReadOnly
+    sort        = _raiseReadOnly
+
+    #
+    ## @brief Get a mutable copy.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Copy.
+    def __copy__(self):
+
+        return list(self)
+
+    #
+    ## @brief Get a mutable deep copy.
+    #
+    #  @param memo [ dict | None | in  ] - Memo.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Copy.
+    def __deepcopy__(self, memo):
+
+        return thawContent(self)
+
+    #
+    ## @brief Support pickling.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Reduce value.
+    def __reduce__(self):
+
+        return (FrozenList, (list(self),))
+
+#
+## @brief [ CLASS ] - Process wide cache of parsed JSON files.
+#
+#  Content is keyed by absolute path, modification time, size, inode and device of the file, therefore
+#  a cached content is never returned for a file that has been altered or replaced since. Least recently
+#  used content is evicted when the cache exceeds its entry count or the total size of the cached files
+#  exceeds its byte limit.
+#
+#  Raw document of a file is cached along with its frozen content, see mFileSystem.jsonFileLib.freezeContent
+#  function. Frozen content is created only when it is requested, since freezing is considerably slower
+#  than parsing the document again.
+class JSONContentCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param maxEntries [ int | 256       | in  ] - Maximum number of cached files.
+    #  @param maxBytes   [ int | 268435456 | in  ] - Maximum total size of the cached files in bytes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, maxEntries=256, maxBytes=268435456):
+
+        ## [ int ] - Maximum number of cached files.
+        self._maxEntries = maxEntries
+
+        ## [ int ] - Maximum total size of the cached files in bytes.
+        self._maxBytes   = maxBytes
+
+        ## [ collections.OrderedDict ] - Keys are absolute paths, values are (key, document, content) tuples.
+        self._entries    = OrderedDict()
+
+        ## [ int ] - Total size of the cached files in bytes.
+        self._bytes      = 0
+
+        ## [ threading.Lock ] - Lock.
+        self._lock       = Lock()
+
+    #
+    ## @brief Number of cached files.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._entries)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cached document and content of given file.
+    #
+    #  @param path [ str   | None | in  ] - Absolute path of a file.
+    #  @param key  [ tuple | None | in  ] - Stat key of the file, see getKey method.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Raw document and frozen content, which is None if it hasn't been created yet.
+    #  @return None  - If the file is not cached or it has been altered since it was cached.
+    def get(self, path, key):
+
+        with self._lock:
+
+            entry = self._entries.pop(path, None)
+            if entry is None:
+                return None
+
+            if entry[0] != key:
+                self._bytes -= entry[0][1]
+                return None
+
+            # Move to the end as the most recently used
+            self._entries[path] = entry
+
+            return entry[1:]
+
+    #
+    ## @brief Cache given document and content of given file.
+    #
+    #  @param path     [ str     | None | in  ] - Absolute path of a file.
+    #  @param key      [ tuple   | None | in  ] - Stat key of the file, see getKey method.
+    #  @param document [ bytes   | None | in  ] - Raw document.
+    #  @param content  [ variant | None | in  ] - Frozen content.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def set(self, path, key, document, content=None):
+
+        if key[1] > self._maxBytes:
+            return
+
+        with self._lock:
+
+            entry = self._entries.pop(path, None)
+            if entry is not None:
+                self._bytes -= entry[0][1]
+
+            self._entries[path] = (key, document, content)
+            self._bytes += key[1]
+
+            while len(self._entries) > self._maxEntries or self._bytes > self._maxBytes:
+                self._bytes -= self._entries.popitem(last=False)[1][0][1]
+
+    #
+    ## @brief Remove all cached content.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cache key from given stat result.
+    #
+    #  @param stat [ os.stat_result | None | in  ] - Stat result of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Modification time, size, inode and device of the file.
+    @staticmethod
+    def getKey(stat):
+
+        return (getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size, stat.st_ino, stat.st_dev)
+
+#
+## [ mFileSystem.jsonFileLib.JSONContentCache ] - Process wide cache used by mFileSystem.jsonFileLib.JSONFile.read method.
+contentCache = JSONContentCache()
+
+#
+## @brief [ CLASS ] - Class to read top level items of a JSON document incrementally.
+#
+#  Document is read in chunks and only the top level item being parsed is kept in memory, therefore
+#  memory usage is bounded by the size of the largest top level item rather than the size of the document.
+class JSONStreamReader(object):
+
+    ## [ str ] - Whitespace characters allowed between JSON tokens.
+    WHITESPACE     = ' \t\n\r'
+
+    ## [ re.Pattern ] - Matches characters of a number till the end of the buffer.
+    NUMBER_TAIL_RE = re.compile(r'[-+.eE0-9]*$')
+
+    ## [ re.Pattern ] - Matches rest of a string after its opening quote.
+    STRING_END_RE  = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"')
+
+    ## [ re.Pattern ] - Matches characters till the next one, which affects the nesting of arrays and objects,
+    #                    complete strings are matched as a whole so their escaped quotes and brackets are skipped.
+    STRUCTURE_RE   = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param fileObject [ file | None  | in  ] - File object opened for reading.
+    #  @param chunkSize  [ int  | 65536 | in  ] - Number of characters read from the file at once.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, fileObject, chunkSize=65536):
+
+        ## [ file ] - File object.
+        self._fileObject = fileObject
+
+        ## [ int ] - Number of characters read from the file at once.
+        self._chunkSize  = chunkSize
+
+        ## [ str ] - Characters read from the file and not consumed yet.
+        self._buffer     = ''
+
+        ## [ int ] - Position in the buffer.
+        self._position   = 0
+
+        ## [ bool ] - Whether end of the file has been reached.
+        self._isEOF      = False
+
+        ## [ json.JSONDecoder ] - Decoder.
+        self._decoder    = json.JSONDecoder()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Read more characters from the file into the buffer.
+    #
+    #  Consumed characters are dropped from the buffer. At least as many characters as the unconsumed
+    #  part of the buffer are read, so retrying to parse a large item costs linear time overall.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, returns `False` if end of the file has been reached.
+    def _fill(self):
+
+        if self._isEOF:
+            return False
+
+        if self._position:
+            self._buffer   = self._buffer[self._position:]
+            self._position = 0
+
+        chunk = self._fileObject.read(max(self._chunkSize, len(self._buffer)))
+        if not chunk:
+            self._isEOF = True
+            return False
+
+        self._buffer += chunk
+
+        return True
+
+    #
+    ## @brief Skip whitespace characters and get the next character without consuming it.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Character, empty string if end of the file has been reached.
+    def _peek(self):
+
+        while True:
+
+            while self._position < len(self._buffer) and self._buffer[self._position] in JSONStreamReader.WHITESPACE:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._fill():
+                return ''
+
+    #
+    ## @brief Consume given character.
+    #
+    #  @param character [ str | None | in  ] - Expected character.
+    #
+    #  @exception ValueError - If next character is not the expected one.
+    #
+    #  @return None - None.
+    def _expect(self, character):
+
+        if self._peek() != character:
+            raise ValueError('Expecting "{}" at position {} of the buffer.'.format(character, self._position))
+
+        self._position += 1
+
+    #
+    ## @brief Parse the next value.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return variant - Value.
+    def _readValue(self):
+
+        if not self._peek():
+            raise ValueError('Expecting value, end of the file has been reached.')
+
+        while True:
+
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except ValueError:
+                # Value may be incomplete
+                if self._fill():
+                    continue
+                raise
+
+            # A number cut at the end of the buffer may continue in the next chunk
+            if JSONStreamReader.NUMBER_TAIL_RE.match(self._buffer, end) and self._fill():
+                continue
+
+            self._position = end
+
+            return value
+
+    #
+    ## @brief Skip the next value without parsing it.
+    #
+    #  Arrays and objects are skipped by tracking their nesting, none of their items is built.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return None - None.
+    def _skipValue(self):
+
+        character = self._peek()
+
+        if character == '"':
+            self._position += 1
+            self._skipString()
+            return
+
+        if character not in ('[', '{'):
+            self._readValue()
+            return
+
+        self._position += 1
+        depth = 1
+
+        while depth:
+
+            self._position = JSONStreamReader.STRUCTURE_RE.match(self._buffer, self._position).end()
+
+            # Buffer ends in the middle of a string or before the end of the value
+            if self._position == len(self._buffer) or self._buffer[self._position] == '"':
+                if not self._fill():
+                    raise ValueError('Expecting end of array or object, end of the file has been reached.')
+                continue
+
+            if self._buffer[self._position] in '[{':
+                depth += 1
+            else:
+                depth -= 1
+
+            self._position += 1
+
+    #
+    ## @brief Skip rest of a string, opening quote must already be consumed.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return None - None.
+    def _skipString(self):
+
+        while True:
+
+            match = JSONStreamReader.STRING_END_RE.match(self._buffer, self._position)
+            if match:
+                self._position = match.end()
+                return
+
+            if not self._fill():
+                raise ValueError('Expecting end of string, end of the file has been reached.')
+
+    #
+    ## @brief Move to the value of given key in an object, opening brace must already be consumed.
+    #
+    #  @param key [ str | None | in  ] - Key.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return bool - Result, returns `False` if the object doesn't have the key.
+    def _seekKey(self, key):
+
+        if self._peek() == '}':
+            return False
+
+        while True:
+
+            if self._peek() != '"':
+                raise ValueError('Expecting property name at position {} of the buffer.'.format(self._position))
+
+            currentKey = self._readValue()
+
+            self._expect(':')
+
+            if currentKey == key:
+                return True
+
+            self._skipValue()
+
+            character = self._peek()
+            self._position += 1
+
+            if character == '}':
+                return False
+
+            if character != ',':
+                raise ValueError('Expecting "," or "}}" at position {} of the buffer.'.format(self._position - 1))
+
+    #
+    ## @brief Move to the item at given index in an array, opening bracket must already be consumed.
+    #
+    #  @param index [ int | None | in  ] - Index.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return bool - Result, returns `False` if the array doesn't have the index.
+    def _seekIndex(self, index):
+
+        if self._peek() == ']':
+            return False
+
+        currentIndex = 0
+
+        while True:
+
+            if currentIndex == index:
+                return True
+
+            self._skipValue()
+
+            character = self._peek()
+            self._position += 1
+
+            if character == ']':
+                return False
+
+            if character != ',':
+                raise ValueError('Expecting "," or "]" at position {} of the buffer.'.format(self._position - 1))
+
+            currentIndex += 1
+
+    #
+    ## @brief Iterate items of an array, opening bracket must already be consumed.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return generator - Values.
+    def _iterateArray(self):
+
+        if self._peek() == ']':
+            self._position += 1
+            return
+
+        while True:
+
+            yield self._readValue()
+
+            character = self._peek()
+            self._position += 1
+
+            if character == ']':
+                return
+
+            if character != ',':
+                raise ValueError('Expecting "," or "]" at position {} of the buffer.'.format(self._position - 1))
+
+    #
+    ## @brief Iterate items of an object, opening brace must already be consumed.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return generator - (key, value) tuples.
+    def _iterateObject(self):
+
+        if self._peek() == '}':
+            self._position += 1
+            return
+
+        while True:
+
+            if self._peek() != '"':
+                raise ValueError('Expecting property name at position {} of the buffer.'.format(self._position))
+
+            key = self._readValue()
+
+            self._expect(':')
+
+            yield key, self._readValue()
+
+            character = self._peek()
+            self._position += 1
+
+            if character == '}':
+                return
+
+            if character != ',':
+                raise ValueError('Expecting "," or "}}" at position {} of the buffer.'.format(self._position - 1))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Iterate top level items of the document.
+    #
+    #  @exception ValueError - If the document is not valid or its top level value is not an array or an object.
+    #
+    #  @return generator - Values if top level value is an array, (key, value) tuples if it is an object.
+    def iterate(self):
+
+        character = self._peek()
+
+        if character == '[':
+            self._position += 1
+            return self._iterateArray()
+
+        if character == '{':
+            self._position += 1
+            return self._iterateObject()
+
+        raise ValueError('Top level value of the document must be an array or an object.')
+
+    #
+    ## @brief Find the value at given path of the document.
+    #
+    #  Document is read only until the value is found, values before it are skipped without being parsed.
+    #  First occurrence of a key is used if an object has duplicate keys.
+    #
+    #  @param path [ list | None | in  ] - Keys of objects and indices of arrays, which lead to the value.
+    #
+    #  @exception KeyError   - If there is no value at given path.
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return variant - Value.
+    def find(self, path):
+
+        for component in path:
+
+            character = self._peek()
+
+            if character == '{' and not isinstance(component, int):
+                self._position += 1
+                if self._seekKey(component):
+                    continue
+
+            elif character == '[' and isinstance(component, int) and not isinstance(component, bool) and component >= 0:
+                self._position += 1
+                if self._seekIndex(component):
+                    continue
+
+            raise KeyError('There is no value at path: {}'.format(path))
+
+        return self._readValue()
+
+#
+## @brief [ CLASS ] - Class to operate on JSON files.
+class JSONFile(mFileSystem.fileLib.File):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None):
+
+        mFileSystem.fileLib.File.__dict__['__init__'](self, path)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Set JSON content.
+    #
+    #  @param content [ variant | None | in  ] - Value to be set.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setContent(self, content):
+
+        ## [ str ] - Content of the file.
+        self._content = content
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, returns `False` is the file doesn't exist, `True` otherwise.
+    def setFile(self, path):
+
+        if mFileSystem.fileLib.File.__dict__['setFile'](self, path):
+            return True
+
+        return False
+
+    ## @name CONTENT
+
+    ## @{
+    #
+    ## @brief Write the content into the file.
+    #
+    #  Content is serialized by the backend in use, see mFileSystem.jsonBackendLib module. Format of the
+    #  document depends on the backend, orjson and ujson backends write compact separators and orjson
+    #  backend writes non ASCII characters as they are rather than escaping them. File is always encoded
+    #  as UTF-8 regardless of the locale. File is written atomically, see mFileSystem.fileLib.AtomicWriter class.
+    #
+    #  @param indent [ int  | None  | in  ] - Indentation.
+    #  @param fsync  [ bool | False | in  ] - Whether to flush the file to the disk before returning.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def write(self, indent=None, fsync=False):
+
+        content = mFileSystem.jsonBackendLib.getBackend().dumps(self._content, indent=indent)
+
+        with mFileSystem.fileLib.AtomicWriter(self._file, binary=True, fsync=fsync) as outFile:
+            outFile.write(content.encode('utf-8'))
+
+        return True
+
+    #
+    ## @brief Read the content of the file and store it in content member.
+    #
+    #  Content is parsed by the backend in use, see mFileSystem.jsonBackendLib module.
+    #
+    #  If `cache` argument is provided True, process wide mFileSystem.jsonFileLib.contentCache is consulted.
+    #  If `copy` argument is provided False, content of a file which hasn't been altered since it was cached
+    #  costs a stat call, it is shared by all the readers and returned as read only. Otherwise the cached
+    #  document is parsed again, which saves reading the file but costs about as much as not caching.
+    #  Freezing the content, which happens the first time it is requested as read only, costs a few times
+    #  more than parsing it, therefore the cache pays off only for files read repeatedly as read only.
+    #
+    #  @param cache [ bool | False | in  ] - Whether to use the cache.
+    #  @param copy  [ bool | True  | in  ] - Whether to return a mutable copy of the cached content rather than the read only content itself.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Content.
+    def read(self, cache=False, copy=True):
+
+        if not cache:
+            with open(self._file, 'rb') as inFile:
+                self._content = mFileSystem.jsonBackendLib.getBackend().load(inFile)
+
+            return self._content
+
+        key   = JSONContentCache.getKey(os.stat(self._file))
+        entry = contentCache.get(self._file, key)
+
+        if entry is None:
+            with open(self._file, 'rb') as inFile:
+                # Key is taken from the opened file so it matches the document
+                key   = JSONContentCache.getKey(os.fstat(inFile.fileno()))
+                entry = (inFile.read(), None)
+
+            contentCache.set(self._file, key, entry[0])
+
+        document, content = entry
+
+        if copy:
+            self._content = mFileSystem.jsonBackendLib.getBackend().loads(document)
+            return self._content
+
+        if content is None:
+            content = freezeContent(mFileSystem.jsonBackendLib.getBackend().loads(document))
+            contentCache.set(self._file, key, document, content)
+
+        self._content = content
+
+        return self._content
+
+    #
+    ## @}
+
+    ## @name STREAMING
+
+    ## @{
+    #
+    ## @brief Iterate top level items of the file without reading the whole content.
+    #
+    #  Content member is not altered.
+    #
+    #  @param chunkSize [ int | 65536 | in  ] - Number of characters read from the file at once.
+    #
+    #  @exception ValueError - If the document is not valid or its top level value is not an array or an object.
+    #
+    #  @return generator - Values if top level value is an array, (key, value) tuples if it is an object.
+    def iterate(self, chunkSize=65536):
+
+        with io.open(self._file, encoding='utf-8') as inFile:
+            for item in JSONStreamReader(inFile, chunkSize=chunkSize).iterate():
+                yield item
+
+    #
+    ## @brief Get the value at given path without reading the whole file.
+    #
+    #  File is read only until the value is found, values before it are skipped without being parsed,
+    #  therefore memory usage is bounded by the size of the value rather than the size of the file. Skipping
+    #  costs less than parsing only per character, a value near the end of a large file takes longer to get
+    #  than reading the whole file does.
+    #  First occurrence of a key is used if an object has duplicate keys, see
+    #  mFileSystem.jsonFileLib.JSONStreamReader.find method, whereas read method uses the last one.
+    #  Content member is not altered.
+    #
+    # @code
+    #version = _file.get(['version'])
+    #name    = _file.get(['assets', 0, 'name'], default='')
+    # @endcode
+    #
+    #  @param path      [ str, list | None  | in  ] - Key or list of keys of objects and non negative indices of arrays.
+    #  @param default   [ variant   | None  | in  ] - Value to be returned if there is no value at given path.
+    #  @param chunkSize [ int       | 65536 | in  ] - Number of characters read from the file at once.
+    #
+    #  @exception ValueError - If the document is not valid.
+    #
+    #  @return variant - Value.
+    def get(self, path, default=None, chunkSize=65536):
+
+        if not isinstance(path, (list, tuple)):
+            path = [path]
+
+        with io.open(self._file, encoding='utf-8') as inFile:
+            try:
+                return JSONStreamReader(inFile, chunkSize=chunkSize).find(path)
+            except KeyError:
+                return default
+
+    #
+    ## @brief Write given items into the file as a JSON array one by one.
+    #
+    #  Items can be provided by a generator, in which case they are never held in memory all at once.
+    #  File is encoded as UTF-8 and written atomically, see mFileSystem.fileLib.AtomicWriter class.
+    #  Content member is not altered.
+    #
+    #  @param items  [ iterable | None  | in  ] - Items of the array.
+    #  @param indent [ int      | None  | in  ] - Indentation.
+    #  @param fsync  [ bool     | False | in  ] - Whether to flush the file to the disk before returning.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def writeIterable(self, items, indent=None, fsync=False):
+
+        if indent is None:
+            separator = ', '
+            start     = '['
+            end       = ']'
+        else:
+            prefix    = '\n' + ' ' * indent
+            separator = ',' + prefix
+            start     = '[' + prefix
+            end       = '\n]'
+
+        backend = mFileSystem.jsonBackendLib.getBackend()
+
+        with mFileSystem.fileLib.AtomicWriter(self._file, binary=True, fsync=fsync) as outFile:
+
+            isEmpty = True
 
+            for item in items:
+
+                content = backend.dumps(item, indent=indent)
+                if indent is not None:
+                    content = content.replace('\n', prefix)
+
+                outFile.write(((start if isEmpty else separator) + content).encode('utf-8'))
+
+                isEmpty = False
+
+            outFile.write(('[]' if isEmpty else end).encode('utf-8'))
+
+        return True
+
+    #
+    ## @}
 
 #
-# ----------------------------------------------------------------------------------------------------
-# CODE
-# ----------------------------------------------------------------------------------------------------
+## @brief [ CLASS ] - Class to operate on JSON Lines files.
 #
-## @brief [ CLASS ] - Class to operate on JSON files.
-class JSONFile(mFileSystem.fileLib.File):
+#  Each line of a JSON Lines file holds one record as a JSON value. Records can be appended without
+#  rewriting the file and iterated without reading the whole file.
+#
+# @code
+#import mFileSystem.jsonFileLib
+#
+#_file = mFileSystem.jsonFileLib.JSONLinesFile.create('absolutePath/log.jsonl')
+#_file.append({'event':'start'})
+#_file.append({'event':'stop'})
+#
+#for record in _file.iterate():
+#    print(record)
+#
+#print(_file.record(1))
+# @endcode
+class JSONLinesFile(mFileSystem.fileLib.File):
+
+    ## [ int ] - Files smaller than this size in bytes are read serially by readParallel method.
+    PARALLEL_READ_MIN_SIZE = 1048576
+
     #
     # ------------------------------------------------------------------------------------------------
     # PRIVATE METHODS
@@ -51,6 +1031,9 @@ class JSONFile(mFileSystem.fileLib.File):
     #  @return None - None.
     def __init__(self, path=None):
 
+        ## [ list of int ] - Byte offsets of the records, None if index is not built.
+        self._offsets = None
+
         mFileSystem.fileLib.File.__dict__['__init__'](self, path)
 
     #
@@ -61,7 +1044,306 @@ class JSONFile(mFileSystem.fileLib.File):
 
     ## @{
     #
-    ## @brief Set JSON content.
+    ## @brief Set records.
+    #
+    #  @param content [ list | None | in  ] - Records.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setContent(self, content):
+
+        ## [ list ] - Records.
+        self._content = content
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set file.
+    #
+    #  Index of the records is discarded.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, returns `False` is the file doesn't exist, `True` otherwise.
+    def setFile(self, path):
+
+        self._offsets = None
+
+        if mFileSystem.fileLib.File.__dict__['setFile'](self, path):
+            return True
+
+        return False
+
+    ## @name CONTENT
+
+    ## @{
+    #
+    ## @brief Write the records into the file, existing records are overwritten.
+    #
+    #  File is written atomically, see mFileSystem.fileLib.AtomicWriter class.
+    #
+    #  @param fsync [ bool | False | in  ] - Whether to flush the file to the disk before returning.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def write(self, fsync=False):
+
+        with mFileSystem.fileLib.AtomicWriter(self._file, binary=True, fsync=fsync) as outFile:
+            for record in self._content:
+                outFile.write(JSONLinesFile.toLine(record))
+
+        self._offsets = None
+
+        return True
+
+    #
+    ## @brief Read all the records of the file and store them in content member.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Records.
+    def read(self):
+
+        self._content = list(self.iterate())
+
+        return self._content
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name RECORDS
+
+    ## @{
+    #
+    ## @brief Append given record to the end of the file.
+    #
+    #  @param record [ variant | None | in  ] - Record.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def append(self, record):
+
+        return self.appendMany([record])
+
+    #
+    ## @brief Append given records to the end of the file.
+    #
+    #  A line break is written first if the file doesn't end with one, so the first record isn't joined
+    #  onto the last line of a file written by another application.
+    #
+    #  @param records [ iterable | None | in  ] - Records.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def appendMany(self, records):
+
+        if not self.exists():
+            return False
+
+        with open(self._file, 'a+b') as outFile:
+
+            outFile.seek(0, 2)
+
+            if outFile.tell():
+                outFile.seek(-1, 2)
+                if outFile.read(1) != b'\n':
+                    outFile.write(b'\n')
+                outFile.seek(0, 2)
+
+            for record in records:
+
+                if self._offsets is not None:
+                    self._offsets.append(outFile.tell())
+
+                outFile.write(JSONLinesFile.toLine(record))
+
+        return True
+
+    #
+    ## @brief Iterate records of the file without reading the whole file.
+    #
+    #  Content member is not altered.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Records.
+    def iterate(self):
+
+        backend = mFileSystem.jsonBackendLib.getBackend()
+
+        with open(self._file, 'rb') as inFile:
+            for line in inFile:
+                line = line.strip()
+                if line:
+                    yield backend.loads(line)
+
+    #
+    ## @brief Build index of the records, which allows random access by record method.
+    #
+    #  Index is kept up to date by append methods of this instance, it must be rebuilt if the file is
+    #  altered by other means.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Record count.
+    def buildIndex(self):
+
+        offsets = []
+        offset  = 0
+
+        with open(self._file, 'rb') as inFile:
+            for line in inFile:
+                if line.strip():
+                    offsets.append(offset)
+                offset += len(line)
+
+        self._offsets = offsets
+
+        return len(self._offsets)
+
+    #
+    ## @brief Get record count, index is built if it hasn't been built yet.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Record count.
+    def recordCount(self):
+
+        if self._offsets is None:
+            self.buildIndex()
+
+        return len(self._offsets)
+
+    #
+    ## @brief Get record at given index, index of the records is built if it hasn't been built yet.
+    #
+    #  @param index [ int | None | in  ] - Index of the record, negative values count from the end.
+    #
+    #  @exception IndexError - If there is no record at given index.
+    #
+    #  @return variant - Record.
+    def record(self, index):
+
+        if self._offsets is None:
+            self.buildIndex()
+
+        offset = self._offsets[index]
+
+        with open(self._file, 'rb') as inFile:
+            inFile.seek(offset)
+            return mFileSystem.jsonBackendLib.getBackend().loads(inFile.readline())
+
+    #
+    ## @brief Read all the records of the file by parsing chunks of it in parallel processes.
+    #
+    #  File is split into byte ranges, each range is parsed by a worker process and the records are
+    #  returned in file order. Files smaller than PARALLEL_READ_MIN_SIZE are read serially.
+    #
+    #  @param workers [ int | None | in  ] - Number of worker processes, CPU count is used if None is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Records.
+    def readParallel(self, workers=None):
+
+        if not workers:
+            workers = multiprocessing.cpu_count()
+
+        size = os.path.getsize(self._file)
+
+        if workers < 2 or size < JSONLinesFile.PARALLEL_READ_MIN_SIZE:
+            return self.read()
+
+        chunkSize = size // workers + 1
+        arguments = [(self._file, x, min(x + chunkSize, size)) for x in range(0, size, chunkSize)]
+
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            chunks = pool.map(_readJSONLinesChunk, arguments)
+        finally:
+            pool.close()
+            pool.join()
+
+        self._content = [record for chunk in chunks for record in chunk]
+
+        return self._content
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Serialize given record as a line of a JSON Lines file.
+    #
+    #  @param record [ variant | None | in  ] - Record.
+    #
+    #  @exception N/A
+    #
+    #  @return bytes - Line including the line ending.
+    @staticmethod
+    def toLine(record):
+
+        return '{}\n'.format(mFileSystem.jsonBackendLib.getBackend().dumps(record)).encode('utf-8')
+
+#
+## @brief [ CLASS ] - Class to operate on MessagePack files, which hold the same data model as JSON files in compact binary form.
+#
+#  Content is serialized by mFileSystem.msgPackLib module, which requires msgpack module. Use
+#  mFileSystem.msgPackLib.isAvailable function to check whether it is installed and fall back to
+#  mFileSystem.jsonFileLib.JSONFile class otherwise.
+#
+# @code
+#import mFileSystem.jsonFileLib
+#
+#_jsonFile = mFileSystem.jsonFileLib.JSONFile('absolutePath/manifest.json')
+#_file     = mFileSystem.jsonFileLib.MessagePackFile.fromJSONFile(_jsonFile, 'absolutePath/manifest.msgpack')
+#
+#content = _file.read()
+# @endcode
+class MessagePackFile(mFileSystem.fileLib.File):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None):
+
+        mFileSystem.fileLib.File.__dict__['__init__'](self, path)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Set content.
     #
     #  @param content [ variant | None | in  ] - Value to be set.
     #
@@ -70,7 +1352,7 @@ class JSONFile(mFileSystem.fileLib.File):
     #  @return None - None.
     def setContent(self, content):
 
-        ## [ str ] - Content of the file.
+        ## [ variant ] - Content of the file.
         self._content = content
 
     #
@@ -101,36 +1383,93 @@ class JSONFile(mFileSystem.fileLib.File):
     #
     ## @brief Write the content into the file.
     #
-    #  @param indent [ int | None | in  ] - Indentation.
+    #  File is written atomically, see mFileSystem.fileLib.AtomicWriter class.
     #
-    #  @exception N/A
+    #  @param fsync [ bool | False | in  ] - Whether to flush the file to the disk before returning.
+    #
+    #  @exception ImportError - If msgpack module is not installed.
     #
     #  @return bool - Result.
-    def write(self, indent=None):
+    def write(self, fsync=False):
+
+        content = mFileSystem.msgPackLib.packb(self._content)
 
-        with open(self._file, 'w') as outFile:
-            json.dump(self._content, outFile, indent=indent)
+        with mFileSystem.fileLib.AtomicWriter(self._file, binary=True, fsync=fsync) as outFile:
+            outFile.write(content)
 
         return True
 
     #
     ## @brief Read the content of the file and store it in content member.
     #
-    #  @exception N/A
+    #  @exception ImportError - If msgpack module is not installed.
     #
     #  @return variant - Content.
     def read(self):
 
-        with open(self._file) as inFile:
-            self._content = json.load(inFile,
-                                      cls=None,
-                                      object_hook=None,
-                                      parse_float=None,
-                                      parse_int=None,
-                                      parse_constant=None,
-                                      object_pairs_hook=None)
+        with open(self._file, 'rb') as inFile:
+            self._content = mFileSystem.msgPackLib.unpackb(inFile.read())
 
         return self._content
 
     #
-    ## @}
\ No newline at end of file
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Convert this file to a JSON file.
+    #
+    #  Content of this file is read if it hasn't been read yet.
+    #
+    #  @param path      [ str  | None  | in  ] - Absolute path of the JSON file.
+    #  @param indent    [ int  | None  | in  ] - Indentation.
+    #  @param overwrite [ bool | False | in  ] - Whether existing file will be overwritten.
+    #
+    #  @exception IOError - If the file exists and overwrite argument is provided False.
+    #
+    #  @return mFileSystem.jsonFileLib.JSONFile - JSON file.
+    def toJSONFile(self, path, indent=None, overwrite=False):
+
+        if self._content is None:
+            self.read()
+
+        _file = JSONFile.create(path, overwrite=overwrite)
+        _file.setContent(self._content)
+        _file.write(indent=indent)
+        _file.update()
+
+        return _file
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Convert given JSON file to a MessagePack file.
+    #
+    #  Content of the JSON file is read if it hasn't been read yet.
+    #
+    #  @param cls       [ object                           | None  | in  ] - Class object.
+    #  @param jsonFile  [ mFileSystem.jsonFileLib.JSONFile | None  | in  ] - JSON file.
+    #  @param path      [ str                              | None  | in  ] - Absolute path of the MessagePack file.
+    #  @param overwrite [ bool                             | False | in  ] - Whether existing file will be overwritten.
+    #
+    #  @exception IOError - If the file exists and overwrite argument is provided False.
+    #
+    #  @return mFileSystem.jsonFileLib.MessagePackFile - MessagePack file.
+    @classmethod
+    def fromJSONFile(cls, jsonFile, path, overwrite=False):
+
+        content = jsonFile.content()
+        if content is None:
+            content = jsonFile.read()
+
+        _file = cls.create(path, overwrite=overwrite)
+        _file.setContent(content)
+        _file.write()
+        _file.update()
+
+        return _file
@@ -0,0 +1,91 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/msgPackLib.py @brief [ FILE   ] - MessagePack serialization.
+## @package mFileSystem.msgPackLib    @brief [ MODULE ] - MessagePack serialization.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+# MessagePack serializes the JSON data model (null, bool, int, float, str, array and map) in a compact
+# binary form. msgpack module is required, it is imported lazily so the modules importing this module
+# can be used without it. Use mFileSystem.jsonFileLib.JSONFile class where msgpack module isn't installed.
+#
+## @brief Whether msgpack module is installed.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isAvailable():
+
+    return msgpack is not None
+
+#
+## @brief Make sure msgpack module is installed.
+#
+#  @exception ImportError - If msgpack module is not installed.
+#
+#  @return None - None.
+def _checkAvailable():
+
+    if msgpack is None:
+        raise ImportError('msgpack module is required to serialize MessagePack data.')
+
+#
+## @brief Serialize given content.
+#
+#  @param content [ variant | None | in  ] - Content.
+#
+#  @exception ImportError - If msgpack module is not installed.
+#  @exception TypeError   - If content contains a type, which is not supported.
+#
+#  @return bytes - Serialized content.
+def packb(content):
+
+    _checkAvailable()
+
+    return msgpack.packb(content, use_bin_type=True)
+
+#
+## @brief Deserialize given data.
+#
+#  @param data [ bytes | None | in  ] - Serialized content.
+#
+#  @exception ImportError - If msgpack module is not installed.
+#  @exception ValueError  - If data is not valid.
+#
+#  @return variant - Content.
+def unpackb(data):
+
+    _checkAvailable()
+
+    return msgpack.unpackb(data, raw=False)
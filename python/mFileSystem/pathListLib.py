@@ -0,0 +1,248 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/pathListLib.py @brief [ FILE   ] - Compact storage of path lists.
+## @package mFileSystem.pathListLib    @brief [ MODULE ] - Compact storage of path lists.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+
+from   array import array
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## [ function ] - Function to intern strings.
+try:
+    _intern = sys.intern
+except AttributeError:
+    # Python 2
+    _intern = intern
+
+#
+## @brief [ CLASS ] - Read only sequence of paths stored as directory and name pairs.
+#
+#  Each directory is stored once in a table and each path as the index of its directory and its name,
+#  names are interned so repeated names are stored once as well. Paths are built only when they are
+#  accessed, therefore memory usage doesn't grow with the length of the common prefixes.
+#
+# @code
+#import mFileSystem.directoryLib
+#
+#_directory = mFileSystem.directoryLib.Directory('/mnt/project')
+#paths = _directory.listFilesRecursively(compact=True)
+#
+#len(paths)
+#paths[0]
+#for path in paths:
+#    pass
+# @endcode
+class PathList(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param prefix [ str | None | in  ] - Prefix of all the paths, like the absolute path of the listed directory with a trailing separator.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, prefix=''):
+
+        ## [ str ] - Prefix of all the paths.
+        self._prefix           = prefix
+
+        ## [ list of str ] - Directories relative to the prefix, with trailing separators.
+        self._directories      = []
+
+        ## [ dict ] - Keys are directories, values are their indexes in the directory table.
+        self._directoryIndexes = {}
+
+        ## [ array.array ] - Directory index of each path.
+        self._indexes          = array('L')
+
+        ## [ list of str ] - Name of each path.
+        self._names            = []
+
+    #
+    ## @brief Number of paths.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._names)
+
+    #
+    ## @brief Get path or paths at given index or slice.
+    #
+    #  @param index [ int, slice | None | in  ] - Index or slice.
+    #
+    #  @exception IndexError - If the index is out of range.
+    #
+    #  @return str         - Path.
+    #  @return list of str - Paths, if a slice is given.
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._names)))]
+
+        return '{}{}{}'.format(self._prefix, self._directories[self._indexes[index]], self._names[index])
+
+    #
+    ## @brief Iterate over the paths.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Paths.
+    def __iter__(self):
+
+        prefixes = [self._prefix + x for x in self._directories]
+
+        for index, name in zip(self._indexes, self._names):
+            yield prefixes[index] + name
+
+    #
+    ## @brief Compare with another path list or a list of paths.
+    #
+    #  @param other [ variant | None | in  ] - Another path list or a list of paths.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __eq__(self, other):
+
+        if not isinstance(other, (PathList, list, tuple)) or len(other) != len(self):
+            return False
+
+        return all(x == y for x, y in zip(self, other))
+
+    #
+    ## @brief Compare with another path list or a list of paths.
+    #
+    #  @param other [ variant | None | in  ] - Another path list or a list of paths.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __ne__(self, other):
+
+        return not self.__eq__(other)
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representation.
+    def __repr__(self):
+
+        return '<PathList {} paths in {} directories under {!r}>'.format(len(self._names),
+                                                                         len(self._directories),
+                                                                         self._prefix)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Prefix of all the paths.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Prefix.
+    def prefix(self):
+
+        return self._prefix
+
+    #
+    ## @brief Directories relative to the prefix, with trailing separators.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Directories.
+    def directories(self):
+
+        return list(self._directories)
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Append a path.
+    #
+    #  @param directory [ str | None | in  ] - Directory relative to the prefix, with a trailing separator, or an empty string.
+    #  @param name      [ str | None | in  ] - Name.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def append(self, directory, name):
+
+        index = self._directoryIndexes.get(directory)
+        if index is None:
+            index = len(self._directories)
+            self._directories.append(directory)
+            self._directoryIndexes[directory] = index
+
+        self._indexes.append(index)
+        self._names.append(_intern(name))
+
+    #
+    ## @brief Get directory and name of the path at given index.
+    #
+    #  @param index [ int | None | in  ] - Index.
+    #
+    #  @exception IndexError - If the index is out of range.
+    #
+    #  @return str - Directory relative to the prefix.
+    #  @return str - Name.
+    def split(self, index):
+
+        return self._directories[self._indexes[index]], self._names[index]
+
+    #
+    ## @brief Get all the paths as a list.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    def toList(self):
+
+        return list(self)
@@ -26,16 +26,220 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import time
 
+from   threading import Lock
 from   threading import Timer
 
 import mFileSystem.directoryLib
+import mFileSystem.jsonFileLib
 
 
 #
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+#
+## [ function ] - Clock used to measure durations.
+_clock = getattr(time, 'perf_counter', time.time)
+
+#
+## @brief [ CLASS ] - Class to collect metrics of a watcher.
+#
+#  An instance of this class is updated by mFileSystem.simpleWatcherLib.SimpleWatcher after each tick,
+#  it can be polled from any thread.
+class WatcherStats(object):
+
+    ## [ tuple of float ] - Upper bounds of the scan duration histogram buckets in seconds, last bucket holds the rest.
+    SCAN_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ threading.Lock ] - Lock to keep the metrics consistent.
+        self._lock                  = Lock()
+
+        self.reset()
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Reset the metrics.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def reset(self):
+
+        with self._lock:
+
+            ## [ int ] - Number of ticks.
+            self._tickCount             = 0
+
+            ## [ float ] - Duration of the last scan in seconds, listing and comparing the files.
+            self._scanDuration          = 0.0
+
+            ## [ float ] - Total duration of the scans in seconds.
+            self._totalScanDuration     = 0.0
+
+            ## [ float ] - Maximum duration of a scan in seconds.
+            self._maxScanDuration       = 0.0
+
+            ## [ list of int ] - Scan duration histogram, see SCAN_DURATION_BUCKETS.
+            self._scanDurationHistogram = [0] * (len(WatcherStats.SCAN_DURATION_BUCKETS) + 1)
+
+            ## [ int ] - Number of entries scanned in the last tick.
+            self._entriesScanned        = 0
+
+            ## [ int ] - Number of stat calls issued in the last tick.
+            self._statCalls             = 0
+
+            ## [ int ] - Total number of stat calls.
+            self._totalStatCalls        = 0
+
+            ## [ int ] - Number of events emitted in the last tick.
+            self._eventsEmitted         = 0
+
+            ## [ int ] - Total number of events emitted.
+            self._totalEventsEmitted    = 0
+
+            ## [ float ] - Duration of the callbacks of the last tick in seconds.
+            self._callbackDuration      = 0.0
+
+            ## [ float ] - Total duration of the callbacks in seconds.
+            self._totalCallbackDuration = 0.0
+
+            ## [ float ] - How late the last tick started compared to its schedule in seconds.
+            self._lag                   = 0.0
+
+            ## [ int ] - Number of intervals passed while ticks were running.
+            self._missedTicks           = 0
+
+    #
+    ## @brief Record metrics of a tick.
+    #
+    #  @param scanDuration     [ float | None | in  ] - Duration of the scan in seconds.
+    #  @param entriesScanned   [ int   | None | in  ] - Number of entries scanned.
+    #  @param statCalls        [ int   | None | in  ] - Number of stat calls issued.
+    #  @param eventsEmitted    [ int   | None | in  ] - Number of events emitted.
+    #  @param callbackDuration [ float | None | in  ] - Duration of the callbacks in seconds.
+    #  @param lag              [ float | None | in  ] - How late the tick started compared to its schedule in seconds.
+    #  @param interval         [ float | None | in  ] - Watch interval in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def record(self, scanDuration, entriesScanned, statCalls, eventsEmitted, callbackDuration, lag, interval):
+
+        bucket = len(WatcherStats.SCAN_DURATION_BUCKETS)
+        for i, upperBound in enumerate(WatcherStats.SCAN_DURATION_BUCKETS):
+            if scanDuration <= upperBound:
+                bucket = i
+                break
+
+        with self._lock:
+
+            self._tickCount             += 1
+
+            self._scanDuration          = scanDuration
+            self._totalScanDuration     += scanDuration
+            self._maxScanDuration       = max(self._maxScanDuration, scanDuration)
+            self._scanDurationHistogram[bucket] += 1
+
+            self._entriesScanned        = entriesScanned
+
+            self._statCalls             = statCalls
+            self._totalStatCalls        += statCalls
+
+            self._eventsEmitted         = eventsEmitted
+            self._totalEventsEmitted    += eventsEmitted
+
+            self._callbackDuration      = callbackDuration
+            self._totalCallbackDuration += callbackDuration
+
+            self._lag                   = lag
+
+            if interval > 0:
+                self._missedTicks       += int((scanDuration + callbackDuration + lag) // interval)
+
+    #
+    ## @brief Get string representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def asStr(self):
+
+        data = self.asDict()
+
+        info = '\n'
+        info += 'Object              : {}\n'.format(self.__class__)
+        info += 'Tick Count          : {}\n'.format(data['tickCount'])
+        info += 'Scan Duration       : {:.6f}\n'.format(data['scanDuration'])
+        info += 'Average Scan        : {:.6f}\n'.format(data['averageScanDuration'])
+        info += 'Max Scan Duration   : {:.6f}\n'.format(data['maxScanDuration'])
+        info += 'Entries Scanned     : {}\n'.format(data['entriesScanned'])
+        info += 'Stat Calls          : {}\n'.format(data['statCalls'])
+        info += 'Events Emitted      : {}\n'.format(data['eventsEmitted'])
+        info += 'Callback Duration   : {:.6f}\n'.format(data['callbackDuration'])
+        info += 'Lag                 : {:.6f}\n'.format(data['lag'])
+        info += 'Missed Ticks        : {}\n'.format(data['missedTicks'])
+
+        return info
+
+    #
+    ## @brief Get a consistent snapshot of the metrics as dict instance.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are; tickCount, scanDuration, totalScanDuration, averageScanDuration, maxScanDuration,
+    #                 scanDurationHistogram, entriesScanned, statCalls, totalStatCalls, eventsEmitted,
+    #                 totalEventsEmitted, callbackDuration, totalCallbackDuration, lag, missedTicks.
+    #                 scanDurationHistogram is a list of (upper bound, count) tuples, upper bound of the last one is None.
+    def asDict(self):
+
+        with self._lock:
+
+            upperBounds = list(WatcherStats.SCAN_DURATION_BUCKETS) + [None]
+
+            return {'tickCount'             : self._tickCount,
+                    'scanDuration'          : self._scanDuration,
+                    'totalScanDuration'     : self._totalScanDuration,
+                    'averageScanDuration'   : self._totalScanDuration / self._tickCount if self._tickCount else 0.0,
+                    'maxScanDuration'       : self._maxScanDuration,
+                    'scanDurationHistogram' : list(zip(upperBounds, self._scanDurationHistogram)),
+                    'entriesScanned'        : self._entriesScanned,
+                    'statCalls'             : self._statCalls,
+                    'totalStatCalls'        : self._totalStatCalls,
+                    'eventsEmitted'         : self._eventsEmitted,
+                    'totalEventsEmitted'    : self._totalEventsEmitted,
+                    'callbackDuration'      : self._callbackDuration,
+                    'totalCallbackDuration' : self._totalCallbackDuration,
+                    'lag'                   : self._lag,
+                    'missedTicks'           : self._missedTicks
+                    }
+
 #
 ## @brief [ CLASS ] - Class to watch file changes.
 #
@@ -55,6 +259,10 @@ import mFileSystem.directoryLib
 #    sys.stdout.write('deleted')
 #    sys.stdout.write(fileList)
 #
+#def moved(fileList):
+#    sys.stdout.write('moved')
+#    sys.stdout.write(fileList)
+#
 #def changed(fileList):
 #    sys.stdout.write('changed')
 #    sys.stdout.write(fileList)
@@ -65,10 +273,13 @@ import mFileSystem.directoryLib
 #                                                       createdCallback=created,
 #                                                       editedCallback=edited,
 #                                                       deletedCallback=deleted,
-#                                                       callback=changed)
-#                                                       )
+#                                                       movedCallback=moved,
+#                                                       callback=changed,
+#                                                       stateFile='otherAbsolutePath/watcherState.json')
 # _watcher.start()
 #
+# sys.stdout.write(_watcher.stats().asStr())
+#
 # #_watcher.stop()
 #
 # @endcode
@@ -86,7 +297,10 @@ class SimpleWatcher(object):
     #  @param createdCallback [ function | None  | in  ] - Created callback.
     #  @param editedCallback  [ function | None  | in  ] - Edited callback.
     #  @param deletedCallback [ function | None  | in  ] - Deleted callback.
+    #  @param movedCallback   [ function | None  | in  ] - Moved callback, which is invoked with a list of (old, new) tuples.
     #  @param callback        [ function | None  | in  ] - Callback.
+    #  @param stateFile       [ str      | None  | in  ] - Absolute path of a file where the snapshot of the watched files will be checkpointed, it is never reported if it's located under the watched path.
+    #  @param statsCallback   [ function | None  | in  ] - Callback invoked with mFileSystem.simpleWatcherLib.WatcherStats instance after each tick.
     #
     #  @exception N/A
     #
@@ -98,7 +312,10 @@ class SimpleWatcher(object):
                  createdCallback=None,
                  editedCallback=None,
                  deletedCallback=None,
-                 callback=None):
+                 movedCallback=None,
+                 callback=None,
+                 stateFile=None,
+                 statsCallback=None):
 
         ## [ str ] - Absolute directory to be watched.
         self._path              = path
@@ -118,12 +335,21 @@ class SimpleWatcher(object):
         ## [ function ] - Deleted callback.
         self._deletedCallback   = deletedCallback
 
+        ## [ function ] - Moved callback.
+        self._movedCallback     = movedCallback
+
 
         ## [ function ] - Callback.
         self._callback          = callback
 
+        ## [ str ] - Absolute path of the state file, where the snapshot of the watched files is checkpointed.
+        self._stateFile         = stateFile
+
+        ## [ function ] - Stats callback.
+        self._statsCallback     = statsCallback
 
-        ## [ dict ] - Data of the files that being watched.
+
+        ## [ dict ] - Data of the files that being watched, keys are absolute paths and values are (mtime, size, inode, device) tuples.
         self._entryData         = {}
 
         ## [ list ] - Created files list.
@@ -135,31 +361,74 @@ class SimpleWatcher(object):
         ## [ list ] - Deleted files list.
         self._deletedFiles      = []
 
+        ## [ list of tuple ] - Moved files list, items are (old, new) tuples.
+        self._movedFiles        = []
+
         ## [ float ] - Watch interval.
         self._interval          = 1.0
 
         ## [ mFileSystem.directoryLib.Directory ] - Directory class instance.
-        self._directory         = mFileSystem.directoryLib.Directory(directory=absPath)
+        self._directory         = mFileSystem.directoryLib.Directory(directory=path)
+
+        ## [ bool ] - Whether the watcher is running.
+        self._isRunning         = False
+
+        ## [ mFileSystem.simpleWatcherLib.WatcherStats ] - Metrics of the watcher.
+        self._stats             = WatcherStats()
+
+        ## [ int ] - Number of stat calls issued in the current tick.
+        self._statCalls         = 0
+
+        ## [ float ] - Time the next tick is scheduled to start at.
+        self._scheduledTime     = None
 
         ## [ threading.Timer ] - Timer class instance.
-        self._thread            = Timer(self._interval, self._detectChanges)
+        self._thread            = Timer(self._interval, self._run)
 
     #
     # ------------------------------------------------------------------------------------------------
     # PROTECTED METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Detect file changes and schedule the next detection.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _run(self):
+
+        lag = 0.0
+        if self._scheduledTime is not None:
+            lag = max(0.0, _clock() - self._scheduledTime)
+
+        self._detectChanges(lag=lag)
+
+        if not self._isRunning:
+            return
+
+        # Repeat the process
+        self._scheduledTime = _clock() + self._interval
+        self._thread = Timer(self._interval, self._run)
+        self._thread.start()
+
     #
     ## @brief Detect file changes.
     #
+    #  @param lag [ float | 0.0 | in  ] - How late this tick started compared to its schedule in seconds.
+    #
     #  @exception N/A
     #
     #  @return None - None.
-    def _detectChanges(self):
+    def _detectChanges(self, lag=0.0):
+
+        scanStartTime = _clock()
 
         # Clear files
         self._createdFiles[:] = []
         self._editedFiles[:]  = []
         self._deletedFiles[:] = []
+        self._movedFiles[:]   = []
+        self._statCalls       = 0
 
         # List files
         entryList = []
@@ -169,29 +438,20 @@ class SimpleWatcher(object):
         else:
             entryList = self._directory.listFilesRecursively(extension=self._extension)
 
-        if not entryList and not self._entryData:
-            return
+        if not entryList:
+            entryList = []
 
-        # Detect deleted files
-        if self._entryData:
-            for k, v in self._entryData.items():
-                if not k in entryList:
-                    self._deletedFiles.append(k)
-                    del self._entryData[k]
+        # State file is written by the watcher itself
+        if self._stateFile and entryList:
+            stateFile     = os.path.abspath(self._stateFile)
+            stateFileName = os.path.basename(stateFile)
+            entryList     = [x for x in entryList if not (x.endswith(stateFileName) and os.path.abspath(x) == stateFile)]
 
-        for f in entryList:
+        if entryList or self._entryData:
+            self._compareEntries(entryList)
 
-            if self._entryData.get(f):
-                # File is already listed previously
-                # so check the file for changes
-                timeStamp = os.stat(f).st_mtime
-                if self._entryData[f] != timeStamp:
-                    self._entryData[f] = timeStamp
-                    self._editedFiles.append(f)
-            else:
-                # File has been created so add it
-                self._entryData[f] = os.stat(f).st_mtime
-                self._createdFiles.append(f)
+        scanDuration      = _clock() - scanStartTime
+        callbackStartTime = _clock()
 
         # Invoke callbacks
         if self._callback:
@@ -207,6 +467,10 @@ class SimpleWatcher(object):
             if self._deletedFiles:
                 fileList.extend(self._deletedFiles)
 
+            for oldFile, newFile in self._movedFiles:
+                fileList.append(oldFile)
+                fileList.append(newFile)
+
             if fileList:
                 self._callback(fileList)
 
@@ -221,14 +485,124 @@ class SimpleWatcher(object):
             if self._deletedCallback and self._deletedFiles:
                 self._deletedCallback(self._deletedFiles)
 
-        # Repeat the process
-        self._thread = Timer(self._interval, self._detectChanges)
-        self._thread.start()
+            if self._movedCallback and self._movedFiles:
+                self._movedCallback(self._movedFiles)
+
+        callbackDuration = _clock() - callbackStartTime
+
+        eventsEmitted = len(self._createdFiles) + len(self._editedFiles) + len(self._deletedFiles) + len(self._movedFiles)
+
+        # Checkpoint the snapshot only if something has changed
+        if eventsEmitted:
+            self.saveState()
+
+        self._stats.record(scanDuration=scanDuration,
+                           entriesScanned=len(entryList),
+                           statCalls=self._statCalls,
+                           eventsEmitted=eventsEmitted,
+                           callbackDuration=callbackDuration,
+                           lag=lag,
+                           interval=self._interval)
+
+        if self._statsCallback:
+            self._statsCallback(self._stats)
+
+    #
+    ## @brief Compare given files with the snapshot and update created, edited, deleted and moved files.
+    #
+    #  @param entryList [ list of str | None | in  ] - Absolute paths of the files currently exist.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _compareEntries(self, entryList):
+
+        entrySet = set(entryList)
+
+        deletedEntryData = {}
+
+        # Detect deleted files
+        for f in [x for x in self._entryData if not x in entrySet]:
+            self._deletedFiles.append(f)
+            deletedEntryData[f] = self._entryData.pop(f)
+
+        for f in entryList:
+
+            self._statCalls += 1
+
+            try:
+                entryData = SimpleWatcher.getEntryData(f)
+            except OSError:
+                # File has been deleted after being listed, it will be
+                # reported as deleted in the next tick if it was known
+                continue
+
+            previousEntryData = self._entryData.get(f)
+
+            if previousEntryData is None:
+                # File has been created so add it
+                self._entryData[f] = entryData
+                self._createdFiles.append(f)
+
+            elif previousEntryData[:2] != entryData[:2]:
+                # File is already listed previously
+                # and its modification time or size has changed
+                self._entryData[f] = entryData
+                self._editedFiles.append(f)
+
+        if self._movedCallback and self._createdFiles and self._deletedFiles:
+            self._detectMovedFiles(deletedEntryData)
+
+    #
+    ## @brief Pair deleted and created files, which share the same identity, as moved files.
+    #
+    #  Paired files are removed from created and deleted files lists.
+    #
+    #  @param deletedEntryData [ dict | None | in  ] - Data of the deleted files, keys are absolute paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _detectMovedFiles(self, deletedEntryData):
+
+        deletedIdentities = {}
+
+        for f in self._deletedFiles:
+            identity = SimpleWatcher.getEntryIdentity(deletedEntryData[f])
+            if identity:
+                deletedIdentities[identity] = f
+
+        if not deletedIdentities:
+            return
+
+        for f in self._createdFiles:
+            identity = SimpleWatcher.getEntryIdentity(self._entryData[f])
+            if identity in deletedIdentities:
+                self._movedFiles.append((deletedIdentities.pop(identity), f))
+
+        if not self._movedFiles:
+            return
+
+        oldFiles = set(x[0] for x in self._movedFiles)
+        newFiles = set(x[1] for x in self._movedFiles)
+
+        self._deletedFiles[:] = [x for x in self._deletedFiles if not x in oldFiles]
+        self._createdFiles[:] = [x for x in self._createdFiles if not x in newFiles]
 
     #
     # ------------------------------------------------------------------------------------------------
     # PUBLIC METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Metrics of the watcher.
+    #
+    #  @exception N/A
+    #
+    #  @return mFileSystem.simpleWatcherLib.WatcherStats - Stats.
+    def stats(self):
+
+        return self._stats
+
     #
     ## @brief Start watcher.
     #
@@ -237,16 +611,115 @@ class SimpleWatcher(object):
     #  @return None - None.
     def start(self):
 
+        if self._stateFile and not self._entryData:
+            self.loadState()
+
+        self._isRunning = True
+
+        self._scheduledTime = _clock() + self._interval
+
         self._thread.start()
 
     #
     ## @brief Stop watcher.
     #
+    #  Snapshot will be checkpointed into the state file if one is provided.
+    #
     #  @exception N/A
     #
     #  @return None - None.
     def stop(self):
 
+        self._isRunning = False
+
         self._thread.cancel()
 
+        self.saveState()
+
+    #
+    ## @brief Load the snapshot of the watched files from the state file.
+    #
+    #  Snapshot is discarded if the state file is written for another path or it can't be parsed,
+    #  in which case all the existing files will be reported as created in the next tick.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, returns `False` if no state file is provided or snapshot couldn't be loaded.
+    def loadState(self):
+
+        if not self._stateFile or not os.path.isfile(self._stateFile):
+            return False
+
+        try:
+            content = mFileSystem.jsonFileLib.JSONFile(self._stateFile).read()
+        except ValueError:
+            return False
+
+        if not isinstance(content, dict) or content.get('path') != self._path:
+            return False
+
+        self._entryData = dict((k, tuple(v)) for k, v in content.get('entries', {}).items())
+
+        return True
+
+    #
+    ## @brief Checkpoint the snapshot of the watched files into the state file.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, returns `False` if no state file is provided.
+    def saveState(self):
+
+        if not self._stateFile:
+            return False
+
+        if not os.path.isfile(self._stateFile):
+            mFileSystem.jsonFileLib.JSONFile.create(self._stateFile, overwrite=False)
+
+        _file = mFileSystem.jsonFileLib.JSONFile(self._stateFile)
+        _file.setContent({'path'    : self._path,
+                          'entries' : self._entryData})
+        _file.write()
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get data of given file, which is used to detect changes.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception OSError - If the file doesn't exist.
+    #
+    #  @return tuple - Modification time, size, inode and device of the file.
+    @staticmethod
+    def getEntryData(path):
+
+        stat = os.stat(path)
+
+        return (stat.st_mtime, stat.st_size, stat.st_ino, stat.st_dev)
+
+    #
+    ## @brief Get identity of a file from its data, which persists when the file is moved.
+    #
+    #  Modification time and size are part of the identity as well, since they are preserved when a file is
+    #  moved and they prevent an inode, which is reused by a newly created file, being reported as a move.
+    #
+    #  @param entryData [ tuple | None | in  ] - Data of a file returned by getEntryData method.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Device, inode, size and modification time of the file.
+    #  @return None  - If the platform doesn't provide inode numbers or the data has no inode and device.
+    @staticmethod
+    def getEntryIdentity(entryData):
+
+        if len(entryData) < 4 or not entryData[2]:
+            return None
+
+        return (entryData[3], entryData[2], entryData[1], entryData[0])
+
 
@@ -26,6 +26,11 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import re
+
+from   collections      import OrderedDict
+from   multiprocessing  import pool
+from   threading        import Lock
 
 import mCore.pythonUtilsLib
 import mCore.pythonVersionLib
@@ -37,12 +42,413 @@ import mFileSystem.fileLib
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class to replace given keys in a content in a single pass.
+#
+#  Keys are combined into a single regular expression, longer keys take precedence over the keys they
+#  start with. Content is scanned once regardless of the number of keys and replaced values are never
+#  matched again, unlike replacing the keys one by one.
+class ReplacePattern(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param keys [ iterable of str | None | in  ] - Keys to be replaced.
+    #
+    #  @exception ValueError - If a key is empty.
+    #
+    #  @return None - None.
+    def __init__(self, keys):
+
+        keys = sorted(set(keys), key=lambda x: (-len(x), x))
+
+        if keys and not keys[-1]:
+            raise ValueError('Keys to be replaced must not be empty.')
+
+        ## [ list of str ] - Keys, longest first.
+        self._keys         = keys
+
+        ## [ int ] - Length of the longest key.
+        self._maxKeyLength = len(keys[0]) if keys else 0
+
+        ## [ re.Pattern ] - Regular expression matching any of the keys.
+        self._regex        = re.compile('|'.join(re.escape(x) for x in keys)) if keys else None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Keys, longest first.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Keys.
+    def keys(self):
+
+        return self._keys
+
+    #
+    ## @brief Length of the longest key.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Length.
+    def maxKeyLength(self):
+
+        return self._maxKeyLength
+
+    #
+    ## @brief Regular expression matching any of the keys.
+    #
+    #  @exception N/A
+    #
+    #  @return re.Pattern - Regular expression, None if there is no key.
+    def regex(self):
+
+        return self._regex
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Replace the keys in given content.
+    #
+    #  @param content     [ str  | None | in  ] - Content.
+    #  @param replaceData [ dict | None | in  ] - Keys are the keys of this pattern, values are the values they will be replaced with.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Replaced content.
+    def replace(self, content, replaceData):
+
+        if not self._regex:
+            return content
+
+        return self._regex.sub(lambda match: replaceData[match.group()], content)
+
+    #
+    ## @brief Replace the keys in given chunks of a content.
+    #
+    #  Keys straddling chunk boundaries are replaced as well. Only the last `maxKeyLength - 1` characters
+    #  of a chunk are carried over to the next one, therefore memory usage is bounded by the chunk size.
+    #
+    #  @param chunks      [ iterable of str | None | in  ] - Chunks of a content.
+    #  @param replaceData [ dict            | None | in  ] - Keys are the keys of this pattern, values are the values they will be replaced with.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Replaced chunks.
+    def replaceChunks(self, chunks, replaceData):
+
+        if not self._regex:
+            for chunk in chunks:
+                yield chunk
+            return
+
+        tailLength = self._maxKeyLength - 1
+        buffer     = ''
+
+        for chunk in chunks:
+
+            buffer += chunk
+
+            # Any key starting before the safe end fits in the buffer, so its match is final
+            safeEnd  = len(buffer) - tailLength
+            position = 0
+            pieces   = []
+
+            match = self._regex.search(buffer, position)
+            while match and match.start() < safeEnd:
+                pieces.append(buffer[position:match.start()])
+                pieces.append(replaceData[match.group()])
+                position = match.end()
+                match    = self._regex.search(buffer, position)
+
+            if position < safeEnd:
+                pieces.append(buffer[position:safeEnd])
+                position = safeEnd
+
+            buffer = buffer[position:]
+
+            if pieces:
+                yield ''.join(pieces)
+
+        if buffer:
+            yield self.replace(buffer, replaceData)
+
+#
+## [ int ] - Maximum number of patterns cached by getReplacePattern function.
+REPLACE_PATTERN_CACHE_SIZE = 128
+
+## [ collections.OrderedDict ] - Cached patterns, keys are sorted tuples of the keys.
+_replacePatternCache       = OrderedDict()
+
+## [ threading.Lock ] - Lock of the pattern cache.
+_replacePatternCacheLock   = Lock()
+
+#
+## @brief Get a pattern for given keys, patterns are cached so the same keys are compiled only once.
+#
+#  @param keys [ iterable of str | None | in  ] - Keys to be replaced.
+#
+#  @exception ValueError - If a key is empty.
+#
+#  @return mFileSystem.templateFileLib.ReplacePattern - Pattern.
+def getReplacePattern(keys):
+
+    cacheKey = tuple(sorted(keys))
+
+    with _replacePatternCacheLock:
+        pattern = _replacePatternCache.pop(cacheKey, None)
+        if pattern is not None:
+            _replacePatternCache[cacheKey] = pattern
+            return pattern
+
+    pattern = ReplacePattern(cacheKey)
+
+    with _replacePatternCacheLock:
+        _replacePatternCache[cacheKey] = pattern
+        while len(_replacePatternCache) > REPLACE_PATTERN_CACHE_SIZE:
+            _replacePatternCache.popitem(last=False)
+
+    return pattern
+
+#
+## @brief [ CLASS ] - Template content split into literal and placeholder segments.
+#
+#  Content is scanned once when an instance is created, rendering only joins the segments with the
+#  replace values, therefore rendering the same template many times doesn't scan the content again.
+class ParsedTemplate(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param content [ str                                        | None | in  ] - Template content.
+    #  @param pattern [ mFileSystem.templateFileLib.ReplacePattern | None | in  ] - Pattern of the keys.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, content, pattern):
+
+        ## [ list of str ] - Literal segments, there is one more literal than placeholders.
+        self._literals     = []
+
+        ## [ list of str ] - Keys of the placeholders, each placeholder is between two literals.
+        self._placeholders = []
+
+        position = 0
+
+        if pattern.regex():
+            for match in pattern.regex().finditer(content):
+                self._literals.append(content[position:match.start()])
+                self._placeholders.append(match.group())
+                position = match.end()
+
+        self._literals.append(content[position:])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Number of placeholders.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def placeholderCount(self):
+
+        return len(self._placeholders)
+
+    #
+    ## @brief Render the template with given data.
+    #
+    #  @param replaceData [ dict | None | in  ] - Keys are the keys of the placeholders, values are the values they will be replaced with.
+    #
+    #  @exception KeyError - If replaceData doesn't have a key of a placeholder.
+    #
+    #  @return str - Rendered content.
+    def render(self, replaceData):
+
+        pieces = [self._literals[0]]
+
+        for key, literal in zip(self._placeholders, self._literals[1:]):
+            pieces.append(replaceData[key])
+            pieces.append(literal)
+
+        return ''.join(pieces)
+
+#
+## @brief [ CLASS ] - Process wide cache of template files.
+#
+#  Cached entries are validated by the modification time, the size, the inode and the device of the files,
+#  therefore a cached template costs an open and a stat rather than a read. A file replaced by another one
+#  of the same size and modification time is read again since the inode differs. Parsed templates are cached alongside the content so they
+#  are shared by all mFileSystem.templateFileLib.TemplateFile instances of the same template file.
+class TemplateCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param maxEntries [ int | 128 | in  ] - Maximum number of cached files.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, maxEntries=128):
+
+        ## [ int ] - Maximum number of cached files.
+        self._maxEntries = maxEntries
+
+        ## [ collections.OrderedDict ] - Keys are absolute paths, values are (key, content, parsed templates) tuples.
+        self._entries    = OrderedDict()
+
+        ## [ threading.Lock ] - Lock.
+        self._lock       = Lock()
+
+    #
+    ## @brief Number of cached files.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._entries)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cached content and parsed templates of given file.
+    #
+    #  @param path [ str   | None | in  ] - Absolute path of a file.
+    #  @param key  [ tuple | None | in  ] - Stat key of the file, see getKey method.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Content and parsed templates, keys of the parsed templates are sorted tuples of the keys.
+    #  @return None  - If the file is not cached or has been altered since it was cached.
+    def get(self, path, key):
+
+        with self._lock:
+
+            entry = self._entries.pop(path, None)
+            if entry is None or entry[0] != key:
+                return None
+
+            # Move to the end as the most recently used
+            self._entries[path] = entry
+
+            return entry[1], entry[2]
+
+    #
+    ## @brief Cache given content of given file.
+    #
+    #  @param path    [ str   | None | in  ] - Absolute path of a file.
+    #  @param key     [ tuple | None | in  ] - Stat key of the file, see getKey method.
+    #  @param content [ str   | None | in  ] - Content.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Parsed templates of the file, which will be filled by the callers.
+    def set(self, path, key, content):
+
+        parsedTemplates = {}
+
+        with self._lock:
+
+            self._entries.pop(path, None)
+            self._entries[path] = (key, content, parsedTemplates)
+
+            while len(self._entries) > self._maxEntries:
+                self._entries.popitem(last=False)
+
+        return parsedTemplates
+
+    #
+    ## @brief Remove all cached templates.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cache key from given stat result.
+    #
+    #  @param stat [ os.stat_result | None | in  ] - Stat result of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Modification time, size, inode and device of the file.
+    @staticmethod
+    def getKey(stat):
+
+        return (getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size, stat.st_ino, stat.st_dev)
+
+#
+## [ mFileSystem.templateFileLib.TemplateCache ] - Process wide cache used by mFileSystem.templateFileLib.TemplateFile.setFile method.
+templateCache = TemplateCache()
+
+#
+## @brief Render given parsed template and write it into given file.
+#
+#  This function is used by mFileSystem.templateFileLib.TemplateFile.renderMany method.
+#
+#  @param arguments [ tuple | None | in  ] - Parsed template, replace data, absolute path of the output file and fsync flag.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the output file.
+def _renderToFile(arguments):
+
+    parsedTemplate, replaceData, absFile, fsync = arguments
+
+    content = parsedTemplate.render(replaceData)
+
+    with mFileSystem.fileLib.AtomicWriter(absFile, fsync=fsync) as _file:
+        _file.write(content)
+
+    return absFile
+
 #
 ## @brief [ CLASS ] - Class to operate on template files.
 #
 #  This class allows you to read a template file and replace its content and write the changed content
 #  out into a file.
 class TemplateFile(mFileSystem.fileLib.File):
+
+    ## [ int ] - Minimum number of outputs of renderMany method in a directory to list the directory once
+    #            rather than checking each output.
+    LIST_DIRECTORY_MIN_FILES = 16
+
     #
     # ------------------------------------------------------------------------------------------------
     # PRIVATE METHODS
@@ -63,6 +469,9 @@ class TemplateFile(mFileSystem.fileLib.File):
         ## [ str ] - Replaced content.
         self._replacedContent = None
 
+        ## [ dict ] - Parsed templates, keys are sorted tuples of the keys.
+        self._parsedTemplates = {}
+
     #
     # ------------------------------------------------------------------------------------------------
     # PROPERTY METHODS
@@ -100,31 +509,54 @@ class TemplateFile(mFileSystem.fileLib.File):
     #
     ## @brief Set template file.
     #
-    #  @param absFile [ str | None | in  ] - Absolute path of a template file.
+    #  Content and parsed templates are shared through mFileSystem.templateFileLib.templateCache when `cache`
+    #  argument is provided True, the file is read only if it has been altered or replaced since it was cached.
+    #
+    #  @param absFile [ str  | None | in  ] - Absolute path of a template file.
+    #  @param cache   [ bool | True | in  ] - Whether to use the process wide template cache.
     #
     #  @exception N/A
     #
     #  @return bool - Result, returns `False` is the file doesn't exist, `True` otherwise.
-    def setFile(self, absFile):
+    def setFile(self, absFile, cache=True):
+
+        self._parsedTemplates = {}
 
         result = mFileSystem.fileLib.File.__dict__['setFile'](self, absFile)
         if not result:
             return False
 
-        mFileSystem.fileLib.File.__dict__['read'](self)
+        if not cache:
+            mFileSystem.fileLib.File.__dict__['read'](self)
+            return True
+
+        with mFileSystem.fileLib.openTextFile(absFile, 'r') as inFile:
+
+            # Key is taken from the opened file so it matches the content read
+            key   = TemplateCache.getKey(os.fstat(inFile.fileno()))
+            entry = templateCache.get(absFile, key)
+
+            if entry is None:
+                self._content         = inFile.read()
+                self._parsedTemplates = templateCache.set(absFile, key, self._content)
+            else:
+                self._content, self._parsedTemplates = entry
 
         return True
 
     #
     ## @brief Write replaced content into the output file.
     #
+    #  File is written atomically, see mFileSystem.fileLib.AtomicWriter class.
+    #
     #  @param absFile   [ str  | None  | in  ] - Absolute path of the output file.
     #  @param overwrite [ bool | False | in  ] - Whether existing `absFile` file will be overwritten.
+    #  @param fsync     [ bool | False | in  ] - Whether to flush the file to the disk before returning.
     #
     #  @exception IOError - If `absFile` exists and overwrite argument provided False.
     #
     #  @return bool - Result.
-    def write(self, absFile, overwrite=False):
+    def write(self, absFile, overwrite=False, fsync=False):
 
         if os.path.isfile(absFile) and not overwrite:
             raise IOError('File already exists, could not be created: {}'.format(absFile))
@@ -132,10 +564,9 @@ class TemplateFile(mFileSystem.fileLib.File):
         path = os.path.dirname(absFile)
         if not os.path.isdir(path):
             os.makedirs(path)
-        
-        _file = open(absFile, 'w')
-        _file.write(self._replacedContent)
-        _file.close()
+
+        with mFileSystem.fileLib.AtomicWriter(absFile, fsync=fsync) as _file:
+            _file.write(self._replacedContent)
 
         return True
 
@@ -146,14 +577,23 @@ class TemplateFile(mFileSystem.fileLib.File):
     #
     ## @brief Replace what needs to be replaced in the template file.
     #
-    #  @param replaceData [ dict | None | in  ] - Data, which will be used to replace whats in the template file.
+    #  Keys are replaced one by one unless `compiled` argument is provided True, in which case all the keys
+    #  are replaced in a single pass, see mFileSystem.templateFileLib.ReplacePattern class.
+    #
+    #  @param replaceData [ dict | None  | in  ] - Data, which will be used to replace whats in the template file.
+    #  @param compiled    [ bool | False | in  ] - Whether to replace all the keys in a single pass.
     #
     #  @exception N/A
     #
     #  @return str - File info
-    def replace(self, replaceData):
+    def replace(self, replaceData, compiled=False):
 
         self._replaceData       = replaceData
+
+        if compiled:
+            self._replacedContent = getReplacePattern(replaceData).replace(self._content, replaceData)
+            return self._replacedContent
+
         self._replacedContent   = self._content
 
         items = None
@@ -185,3 +625,138 @@ class TemplateFile(mFileSystem.fileLib.File):
         self._replacedContent = function(self._content)
 
         return self._replacedContent
+
+    #
+    ## @brief Parse the template content into literal and placeholder segments for given keys.
+    #
+    #  Parsed templates are kept by this instance, so the content is scanned only once for the same keys.
+    #
+    #  @param keys [ iterable of str | None | in  ] - Keys to be replaced.
+    #
+    #  @exception N/A
+    #
+    #  @return mFileSystem.templateFileLib.ParsedTemplate - Parsed template.
+    def parse(self, keys):
+
+        cacheKey = tuple(sorted(keys))
+
+        parsedTemplate = self._parsedTemplates.get(cacheKey)
+        if parsedTemplate is None:
+            parsedTemplate = ParsedTemplate(self._content, getReplacePattern(cacheKey))
+            self._parsedTemplates[cacheKey] = parsedTemplate
+
+        return parsedTemplate
+
+    #
+    ## @brief Render the template into many output files.
+    #
+    #  Template is parsed once for each distinct set of keys and every output is rendered the same way as
+    #  replace method with `compiled` argument provided True. Output directories are created once. Existing
+    #  outputs are checked by listing their directory once if at least LIST_DIRECTORY_MIN_FILES outputs go
+    #  into it, by checking each output otherwise. Outputs are written atomically by a pool of worker threads,
+    #  see mFileSystem.fileLib.AtomicWriter class.
+    #
+    #  Replaced content member is not altered.
+    #
+    # @code
+    #_templateFile.renderMany([({'SHOT':'sh010'}, '/absolutePath/sh010/scene.txt'),
+    #                          ({'SHOT':'sh020'}, '/absolutePath/sh020/scene.txt')])
+    # @endcode
+    #
+    #  @param items     [ iterable | None  | in  ] - (replaceData, absFile) tuples.
+    #  @param overwrite [ bool     | False | in  ] - Whether existing output files will be overwritten.
+    #  @param workers   [ int      | 8     | in  ] - Number of worker threads.
+    #  @param fsync     [ bool     | False | in  ] - Whether to flush the files to the disk before returning.
+    #
+    #  @exception IOError - If an output file exists and overwrite argument provided False, no file is written in this case.
+    #
+    #  @return list of str - Absolute paths of the output files.
+    def renderMany(self, items, overwrite=False, workers=8, fsync=False):
+
+        items = list(items)
+        if not items:
+            return []
+
+        # Check and create output directories once
+        directories = {}
+        for _, absFile in items:
+            directories.setdefault(os.path.dirname(absFile), []).append(absFile)
+
+        for directory, absFiles in directories.items():
+
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+                continue
+
+            if overwrite:
+                continue
+
+            if len(absFiles) >= TemplateFile.LIST_DIRECTORY_MIN_FILES:
+                fileNames     = set(os.listdir(directory or os.curdir))
+                existingFiles = [x for x in absFiles if os.path.basename(x) in fileNames]
+            else:
+                existingFiles = [x for x in absFiles if os.path.exists(x)]
+
+            if existingFiles:
+                raise IOError('File already exists, could not be created: {}'.format(existingFiles[0]))
+
+        arguments = [(self.parse(replaceData), replaceData, absFile, fsync) for replaceData, absFile in items]
+
+        if workers < 2 or len(arguments) < 2:
+            return [_renderToFile(x) for x in arguments]
+
+        threadPool = pool.ThreadPool(processes=min(workers, len(arguments)))
+        try:
+            return threadPool.map(_renderToFile, arguments)
+        finally:
+            threadPool.close()
+            threadPool.join()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Render given template file into given output file without loading the whole content.
+    #
+    #  Template is read in chunks and rendered chunks are written incrementally, therefore memory usage is
+    #  bounded by the chunk size rather than the size of the template. Keys are replaced in a single pass,
+    #  see mFileSystem.templateFileLib.ReplacePattern.replaceChunks method. Template is read with the same
+    #  encoding as the output file is written, see mFileSystem.fileLib.openTextFile function. Output file is
+    #  written atomically, see mFileSystem.fileLib.AtomicWriter class.
+    #
+    # @code
+    #mFileSystem.templateFileLib.TemplateFile.renderStream('/absolutePath/template.txt',
+    #                                                      {'SHOT':'sh010'},
+    #                                                      '/absolutePath/sh010/scene.txt')
+    # @endcode
+    #
+    #  @param templateFile [ str  | None    | in  ] - Absolute path of a template file.
+    #  @param replaceData  [ dict | None    | in  ] - Data, which will be used to replace whats in the template file.
+    #  @param absFile      [ str  | None    | in  ] - Absolute path of the output file.
+    #  @param overwrite    [ bool | False   | in  ] - Whether existing `absFile` file will be overwritten.
+    #  @param chunkSize    [ int  | 1048576 | in  ] - Number of characters read at a time.
+    #  @param fsync        [ bool | False   | in  ] - Whether to flush the file to the disk before returning.
+    #
+    #  @exception IOError - If `absFile` exists and overwrite argument provided False.
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def renderStream(templateFile, replaceData, absFile, overwrite=False, chunkSize=1048576, fsync=False):
+
+        if os.path.isfile(absFile) and not overwrite:
+            raise IOError('File already exists, could not be created: {}'.format(absFile))
+
+        path = os.path.dirname(absFile)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        pattern = getReplacePattern(replaceData)
+
+        with mFileSystem.fileLib.openTextFile(templateFile, 'r') as inFile:
+            with mFileSystem.fileLib.AtomicWriter(absFile, fsync=fsync) as outFile:
+                chunks = iter(lambda: inFile.read(chunkSize), '')
+                for chunk in pattern.replaceChunks(chunks, replaceData):
+                    outFile.write(chunk)
+
+        return True
@@ -29,10 +29,13 @@ import os
 import shutil
 import unittest
 
+from   multiprocessing import pool
+
 import mCore.platformLib
 
 import mFileSystem.directoryLib
 import mFileSystem.fileLib
+import mFileSystem.versionIndexLib
 import mFileSystem.versionLib
 
 
@@ -230,6 +233,54 @@ class DirectoryTest(unittest.TestCase):
 
         shutil.rmtree(self._tempDirectory)
 
+    def test_listFilesRecursivelyCompact(self):
+
+        for path in ('a/b-c.txt', 'a/b/d.txt', 'a/b0.txt', 'a/.hidden.txt', 'a.txt', 'a0/e.jpg', 'z.jpg', 'a/b/b/b/f.txt'):
+            mFileSystem.fileLib.File.create(os.path.join(self._tempDirectory, *path.split('/')), overwrite=True)
+
+        _dir = mFileSystem.directoryLib.Directory(self._tempDirectory)
+
+        for relative in (False, True):
+            for extension, ignoreExtensions in ((None, None), ('txt', None), (None, ['.jpg'])):
+                pathList = _dir.listFilesRecursively(relative=relative,
+                                                     extension=extension,
+                                                     ignoreExtensions=ignoreExtensions,
+                                                     compact=True)
+                files    = _dir.listFilesRecursively(relative=relative,
+                                                     extension=extension,
+                                                     ignoreExtensions=ignoreExtensions)
+
+                self.assertEqual(list(pathList), files)
+                self.assertEqual(pathList, files)
+                self.assertEqual(len(pathList), len(files))
+                self.assertEqual(pathList[-1], files[-1])
+                self.assertEqual(pathList[1:3], files[1:3])
+
+        pathList = _dir.listFilesRecursively(compact=True)
+
+        # Each directory is stored once
+        self.assertEqual(sorted(pathList.directories()), ['', 'a' + os.sep, os.path.join('a', 'b', ''),
+                                                          os.path.join('a', 'b', 'b', 'b', ''), 'a0' + os.sep])
+        self.assertEqual(pathList.split(0), ('', 'a.txt'))
+
+    def test_sortedTraversal(self):
+
+        for path in ('a/b-c.txt', 'a/b/d.txt', 'a/b/x/j.txt', 'a/b0/e.txt', 'a/b-c/i.txt', 'a.txt', 'a0/f.txt', '.hidden/g.txt', 'a/.hidden/h.txt'):
+            mFileSystem.fileLib.File.create(os.path.join(self._tempDirectory, *path.split('/')), overwrite=True)
+
+        _dir = mFileSystem.directoryLib.Directory(self._tempDirectory)
+
+        files       = [os.path.join(x, z) for x, y, zs in os.walk(self._tempDirectory) for z in zs]
+        directories = [os.path.join(x, z) for x, ys, y in os.walk(self._tempDirectory) for z in ys]
+
+        # Results are in sorted order without a final sort
+        self.assertEqual(list(_dir.iterateFilesRecursively(ignoreDot=False)), sorted(files))
+        self.assertEqual(_dir.listDirectoriesRecursively(ignoreDot=False), sorted(directories))
+
+        # Hidden directories are pruned
+        self.assertEqual(_dir.listFilesRecursively(), sorted(x for x in files if os.sep + '.' not in x))
+        self.assertEqual(_dir.listDirectoriesRecursively(), sorted(x for x in directories if os.sep + '.' not in x))
+
     def test_navigateUp(self):
 
         if mCore.platformLib.Platform.isWindows():
@@ -297,6 +348,63 @@ class DirectoryTest(unittest.TestCase):
                                                                                           ignore=False,
                                                                                           createPath=False))
 
+    def test_listVersionedFoldersIndexed(self):
+
+        versionFolderDirectory = os.path.join(self._testDirectory, 'versionedFolders')
+
+        for version in (mFileSystem.versionLib.Version.kAll,
+                        mFileSystem.versionLib.Version.kLatest,
+                        mFileSystem.versionLib.Version.kFirst,
+                        mFileSystem.versionLib.Version.kPrevious,
+                        '2.0.0',
+                        '2.0.1'):
+            for absolutePath in (False, True):
+                self.assertEqual(mFileSystem.directoryLib.Directory.listVersionedFolders(directory=versionFolderDirectory,
+                                                                                         absolutePath=absolutePath,
+                                                                                         version=version),
+                                 mFileSystem.directoryLib.Directory.listVersionedFolders(directory=versionFolderDirectory,
+                                                                                         absolutePath=absolutePath,
+                                                                                         version=version,
+                                                                                         useIndex=True))
+
+        index = mFileSystem.versionIndexLib.getVersionIndex(versionFolderDirectory)
+
+        self.assertIs(mFileSystem.versionIndexLib.getVersionIndex(versionFolderDirectory), index)
+        self.assertEqual(index.get((10, 0, 0)), '10.0.0')
+        self.assertEqual(index.get((4, 0, 0)), None)
+
+        # Index is rebuilt when the directory is altered
+        newFolder = os.path.join(versionFolderDirectory, '11.0.0')
+        os.mkdir(newFolder)
+        try:
+            self.assertEqual(index.get(mFileSystem.versionLib.Version.kLatest), '11.0.0')
+        finally:
+            os.rmdir(newFolder)
+
+        self.assertEqual(index.get(mFileSystem.versionLib.Version.kLatest), '10.0.0')
+
+    def test_listVersionedFoldersConstraint(self):
+
+        versionFolderDirectory = os.path.join(self._testDirectory, 'versionedFolders')
+
+        for version, expected in ((mFileSystem.versionLib.Version.kAll, ['2.0.0', '3.0.0']),
+                                  (mFileSystem.versionLib.Version.kLatest, '3.0.0'),
+                                  (mFileSystem.versionLib.Version.kFirst, '2.0.0'),
+                                  (mFileSystem.versionLib.Version.kPrevious, '2.0.0'),
+                                  ('3.0.0', '3.0.0'),
+                                  ('1.0.0', None)):
+            self.assertEqual(mFileSystem.directoryLib.Directory.listVersionedFolders(directory=versionFolderDirectory,
+                                                                                     version=version,
+                                                                                     constraint='>=2, <10'),
+                             expected)
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.listVersionedFolders(directory=versionFolderDirectory,
+                                                                                 absolutePath=True,
+                                                                                 constraint='^1.0'),
+                         os.path.join(versionFolderDirectory, '1.0.0'))
+        self.assertIsNone(mFileSystem.directoryLib.Directory.listVersionedFolders(directory=versionFolderDirectory,
+                                                                                  constraint='>10'))
+
     def test_listVersionedFiles(self):
 
         versionFileDirectory = os.path.join(self._testDirectory, 'versionedFiles')
@@ -342,6 +450,123 @@ class DirectoryTest(unittest.TestCase):
                                                                                                  version=1,
                                                                                                  createPath=False))
 
+    def test_findLatestVersionedFile(self):
+
+        versionFileDirectory = os.path.join(self._testDirectory, 'versionedFiles')
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory), 'file.v011.txt')
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory, extension='txt'), 'file.v011.txt')
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory, extension='jpg'), None)
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory, absolutePath=True),
+                         os.path.join(versionFileDirectory, 'file.v011.txt'))
+
+        # Pointer file
+        shutil.copytree(versionFileDirectory, os.path.join(self._tempDirectory, 'versionedFiles'))
+        versionFileDirectory = os.path.join(self._tempDirectory, 'versionedFiles')
+
+        mFileSystem.directoryLib.Directory.setLatestVersionedFile(versionFileDirectory, 'file.v010.txt', extension='txt')
+
+        # Pointer lagging behind is followed by probing the next versions
+        self.assertEqual(mFileSystem.directoryLib.Directory.listVersionedFiles(versionFileDirectory,
+                                                                               extension='txt',
+                                                                               usePointer=True,
+                                                                               baseName='file'),
+                         'file.v011.txt')
+
+        # Pointers are kept per base name
+        open(os.path.join(versionFileDirectory, 'other.v020.txt'), 'w').close()
+        mFileSystem.directoryLib.Directory.setLatestVersionedFile(versionFileDirectory, 'other.v020.txt')
+
+        for baseName, expected in (('file', 'file.v011.txt'), ('other', 'other.v020.txt'), ('missing', None)):
+            for usePointer in (False, True):
+                self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory,
+                                                                                            extension='txt',
+                                                                                            usePointer=usePointer,
+                                                                                            baseName=baseName),
+                                 expected)
+
+        # Missing versions following the pointed file are probed past, versions 3 to 9 are missing
+        os.remove(os.path.join(versionFileDirectory, 'file.v003.txt'))
+
+        mFileSystem.directoryLib.Directory.setLatestVersionedFile(versionFileDirectory, 'file.v002.txt')
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory,
+                                                                                    extension='txt',
+                                                                                    usePointer=True,
+                                                                                    baseName='file'),
+                         'file.v011.txt')
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersionedFile(versionFileDirectory, 'file', 'txt'),
+                         os.path.join(versionFileDirectory, 'file.v012.txt'))
+        os.remove(os.path.join(versionFileDirectory, 'file.v012.txt'))
+
+        # Directory is scanned if the pointed file has been removed
+        mFileSystem.directoryLib.Directory.setLatestVersionedFile(versionFileDirectory, 'file.v002.txt')
+        os.remove(os.path.join(versionFileDirectory, 'file.v002.txt'))
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory,
+                                                                                    extension='txt',
+                                                                                    usePointer=True,
+                                                                                    baseName='file'),
+                         'file.v011.txt')
+
+        self.assertRaises(ValueError, mFileSystem.directoryLib.Directory.setLatestVersionedFile, versionFileDirectory, 'file.txt')
+
+    def test_createNextVersion(self):
+
+        versionFolderDirectory = os.path.join(self._tempDirectory, 'versionedFolders')
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersion(versionFolderDirectory),
+                         os.path.join(versionFolderDirectory, '1.0.0'))
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersion(versionFolderDirectory, component=2),
+                         os.path.join(versionFolderDirectory, '1.0.1'))
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersion(versionFolderDirectory, component=1),
+                         os.path.join(versionFolderDirectory, '1.1.0'))
+
+        # Concurrent publishers get distinct versions
+        threadPool = pool.ThreadPool(processes=8)
+        folders = threadPool.map(mFileSystem.directoryLib.Directory.createNextVersion, [versionFolderDirectory] * 20)
+        threadPool.close()
+        threadPool.join()
+
+        self.assertEqual(sorted(folders), sorted(os.path.join(versionFolderDirectory, '{}.0.0'.format(x)) for x in range(2, 22)))
+
+    def test_createNextVersionedFile(self):
+
+        versionFileDirectory = os.path.join(self._tempDirectory, 'versionedFiles')
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersionedFile(versionFileDirectory, 'file', 'txt'),
+                         os.path.join(versionFileDirectory, 'file.v001.txt'))
+
+        # Version is allocated even if the pointer file is behind
+        open(os.path.join(versionFileDirectory, 'file.v002.txt'), 'w').close()
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersionedFile(versionFileDirectory, 'file', 'txt'),
+                         os.path.join(versionFileDirectory, 'file.v003.txt'))
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory,
+                                                                                    extension='txt',
+                                                                                    usePointer=True,
+                                                                                    baseName='file'),
+                         'file.v003.txt')
+
+        # Concurrent publishers get distinct versions and the latest one is found even if the pointer lags behind
+        threadPool = pool.ThreadPool(processes=8)
+        files = threadPool.map(lambda x: mFileSystem.directoryLib.Directory.createNextVersionedFile(versionFileDirectory, 'file', 'txt'),
+                               range(40))
+        threadPool.close()
+        threadPool.join()
+
+        self.assertEqual(sorted(files), [os.path.join(versionFileDirectory, 'file.v{:03d}.txt'.format(x)) for x in range(4, 44)])
+
+        mFileSystem.directoryLib.Directory.setLatestVersionedFile(versionFileDirectory, 'file.v010.txt')
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.findLatestVersionedFile(versionFileDirectory,
+                                                                                    extension='txt',
+                                                                                    usePointer=True,
+                                                                                    baseName='file'),
+                         'file.v043.txt')
+        self.assertEqual(mFileSystem.directoryLib.Directory.createNextVersionedFile(versionFileDirectory, 'file', 'txt', maxRetries=1),
+                         os.path.join(versionFileDirectory, 'file.v044.txt'))
+
     def test_toNativeSeparators(self):
 
         path         = '/mnt/libs//external\\boost\\\\1.66'
@@ -354,6 +579,45 @@ class DirectoryTest(unittest.TestCase):
         self.assertEqual(mFileSystem.directoryLib.Directory.toNativeSeparators(path),
                          expectedPath)
 
+    def test_join(self):
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.join('/mnt/libs', 'external', '/boost/'),
+                         os.path.join(os.sep, 'mnt', 'libs', 'external', 'boost'))
+        self.assertEqual(mFileSystem.directoryLib.Directory.join(['mnt', 'libs'], '', 'boost'),
+                         mFileSystem.directoryLib.Directory.toNativeSeparators(os.path.join('mnt', 'libs', 'boost')))
+
+        # Listing methods join the same way
+        for directory in ('/mnt/libs', '/mnt/libs/', 'mnt//libs', '/mnt\\libs\\\\', ''):
+            names = ['a', 'b.txt', 'c\\d']
+            self.assertEqual(mFileSystem.directoryLib.Directory._joinFast(directory, names),
+                             [mFileSystem.directoryLib.Directory.join(directory, x) for x in names])
+
+        if not mCore.platformLib.Platform.isWindows():
+            self.assertEqual(mFileSystem.directoryLib.Directory.toNativeSeparators('mnt\\\\\\libs///boost/', endWithSeparator=True),
+                             '/mnt/libs//boost/')
+            self.assertEqual(mFileSystem.directoryLib.Directory.toNativeSeparators('/mnt/libs/', startWithSeparator=False),
+                             'mnt/libs')
+
+    def test_batchPathOperations(self):
+
+        paths = ['boost/1.66', '/qt//5.12/', 'python\\3.7', '', 'tbb']
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.joinMany('/mnt/libs', paths),
+                         [mFileSystem.directoryLib.Directory.join('/mnt/libs', x) for x in paths])
+
+        self.assertEqual(mFileSystem.directoryLib.Directory.splitMany(paths),
+                         [mFileSystem.directoryLib.Directory.split(x) for x in paths])
+
+        for useNumpy in (False, True):
+            for startWithSeparator, endWithSeparator in ((True, False), (False, True)):
+                self.assertEqual(mFileSystem.directoryLib.Directory.toNativeSeparatorsMany(paths,
+                                                                                           startWithSeparator=startWithSeparator,
+                                                                                           endWithSeparator=endWithSeparator,
+                                                                                           useNumpy=useNumpy),
+                                 [mFileSystem.directoryLib.Directory.toNativeSeparators(x,
+                                                                                        startWithSeparator=startWithSeparator,
+                                                                                        endWithSeparator=endWithSeparator) for x in paths])
+
 #
 #-----------------------------------------------------------------------------------------------------
 # INVOKE
@@ -0,0 +1,148 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/tests/directoryWalkerLibTest.py [ FILE   ] - Unit test module.
+## @package mFileSystem.tests.directoryWalkerLibTest    [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import inspect
+import unittest
+import shutil
+
+import mFileSystem.directoryWalkerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class DirectoryWalkerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'directoryWalker'))
+
+        for path in ('a/b/c/file.txt', 'a/b-c/file.txt', 'a/file.txt', 'd/file.txt', 'file.txt'):
+            path = os.path.join(self._tempDirectory, *path.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            open(path, 'w').close()
+
+    def tearDown(self):
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    def _paths(self, walker):
+
+        return [x + y for x, y, z in walker.walk()]
+
+    def test_walk(self):
+
+        walker = mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory)
+        paths  = self._paths(walker)
+
+        self.assertEqual(paths, sorted(paths))
+        self.assertEqual(len(paths), 10)
+
+        stats = walker.stats()
+
+        self.assertEqual(stats.maxDepth(), 4)
+        self.assertEqual(stats.count('files'), 5)
+        self.assertEqual(stats.count('directories'), 5)
+        self.assertEqual(stats.count('directories', depth=2), 2)
+        self.assertEqual(stats.asDict()['depths'][0], {'depth'       : 1,
+                                                       'directories' : 2,
+                                                       'files'       : 1,
+                                                       'symlinks'    : 0,
+                                                       'loops'       : 0,
+                                                       'errors'      : 0})
+
+    def test_maxDepth(self):
+
+        walker = mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory, maxDepth=2)
+
+        self.assertEqual(self._paths(walker), ['a',
+                                               os.path.join('a', 'b'),
+                                               os.path.join('a', 'b-c'),
+                                               os.path.join('a', 'file.txt'),
+                                               'd',
+                                               os.path.join('d', 'file.txt'),
+                                               'file.txt'])
+
+        self.assertEqual(self._paths(mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory, maxDepth=0)), [])
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'Symbolic links are not supported.')
+    def test_symlinkLoop(self):
+
+        os.symlink(os.path.join(self._tempDirectory, 'a'), os.path.join(self._tempDirectory, 'a', 'b', 'loop'))
+
+        walker = mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory)
+        paths  = self._paths(walker)
+
+        # Link is listed, but not traversed again
+        self.assertIn(os.path.join('a', 'b', 'loop'), paths)
+        self.assertEqual(len(paths), 11)
+        self.assertEqual(walker.stats().count('loops', depth=4), 1)
+        self.assertEqual(walker.stats().count('symlinks'), 1)
+
+        # Link to a directory outside of the walked branch is traversed
+        os.symlink(os.path.join(self._tempDirectory, 'd'), os.path.join(self._tempDirectory, 'a', 'd'))
+
+        self.assertIn(os.path.join('a', 'd', 'file.txt'), self._paths(walker))
+        self.assertNotIn(os.path.join('a', 'd', 'file.txt'),
+                         self._paths(mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory, followSymlinks=False)))
+
+    def test_deepTree(self):
+
+        deepDirectory = os.path.join(self._tempDirectory, *(['x'] * 300))
+        os.makedirs(deepDirectory)
+
+        walker = mFileSystem.directoryWalkerLib.DirectoryWalker(self._tempDirectory)
+
+        # Walking doesn't recurse
+        recursionLimit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 50)
+        try:
+            paths = self._paths(walker)
+        finally:
+            sys.setrecursionlimit(recursionLimit)
+
+        self.assertEqual(walker.stats().maxDepth(), 300)
+        self.assertEqual(paths[-1], os.path.relpath(deepDirectory, self._tempDirectory))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
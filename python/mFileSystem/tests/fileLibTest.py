@@ -224,6 +224,74 @@ class FileTest(unittest.TestCase):
 
         os.remove(self._file)
 
+    def test_writeAtomic(self):
+
+        _file = mFileSystem.fileLib.File.create(self._file, overwrite=False)
+        os.chmod(self._file, 0o640)
+
+        _file.write('-' * 100, append=False, fsync=True)
+        _file.update()
+
+        self.assertEqual(_file.size(), 100)
+        self.assertEqual(os.stat(self._file).st_mode & 0o777, 0o640)
+        self.assertEqual([x for x in os.listdir(self._tempDirectory) if x.endswith('.tmp')], [])
+
+        self.assertTrue(_file.remove())
+
+    def test_textEncoding(self):
+
+        _file = mFileSystem.fileLib.File.create(self._file, overwrite=False)
+
+        # Atomic writes, appends and reads use the same encoding regardless of the locale
+        _file.write(u'\u015eafak\n', append=False)
+        _file.write(u'\u6f22\u5b57\n')
+        _file.writeLines([u'\u00e7\n'])
+
+        with open(self._file, 'rb') as inFile:
+            self.assertEqual(inFile.read(), u'\u015eafak\n\u6f22\u5b57\n\u00e7\n'.encode('utf-8'))
+
+        self.assertEqual(_file.read(), u'\u015eafak\n\u6f22\u5b57\n\u00e7\n')
+        self.assertEqual(_file.readLines(), [u'\u015eafak\n', u'\u6f22\u5b57\n', u'\u00e7\n'])
+
+        self.assertTrue(_file.remove())
+
+    def test_atomicWriterUmask(self):
+
+        # Mode creation mask set after the import is applied to new files
+        umask = os.umask(0o027)
+        try:
+            with mFileSystem.fileLib.AtomicWriter(self._file) as outFile:
+                outFile.write(u'\u015eafak \u6f22\u5b57')
+        finally:
+            os.umask(umask)
+
+        if os.name == 'posix':
+            self.assertEqual(os.stat(self._file).st_mode & 0o777, 0o640)
+
+        # Text is encoded as UTF-8 regardless of the locale
+        with open(self._file, 'rb') as inFile:
+            self.assertEqual(inFile.read().decode('utf-8'), u'\u015eafak \u6f22\u5b57')
+
+        os.remove(self._file)
+
+    def test_atomicWriter(self):
+
+        _file = mFileSystem.fileLib.File.create(self._file, overwrite=False)
+        _file.write('content', append=False)
+
+        try:
+            with mFileSystem.fileLib.AtomicWriter(self._file) as outFile:
+                outFile.write('partial')
+                raise RuntimeError('Interrupted')
+        except RuntimeError:
+            pass
+
+        # Previous content is intact and temporary file is removed
+        self.assertEqual(_file.read(), 'content')
+        self.assertEqual([x for x in os.listdir(self._tempDirectory) if x.endswith('.tmp')], [])
+
+        self.assertTrue(_file.remove())
+
 #
 #-----------------------------------------------------------------------------------------------------
 # INVOKE
@@ -0,0 +1,111 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/tests/jsonBackendLibTest.py [ FILE   ] - Unit test module.
+## @package mFileSystem.tests.jsonBackendLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mFileSystem.jsonBackendLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class JSONBackendTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._backend = mFileSystem.jsonBackendLib.getBackend()
+
+    def tearDown(self):
+
+        mFileSystem.jsonBackendLib.setBackend(self._backend.NAME)
+
+    def test_loadsDumps(self):
+
+        data = {'attr'    : 'value',
+                'list'    : [1, 2.5, None, True, 'ü'],
+                'nested'  : {'big' : 2 ** 70}}
+
+        for backendClass in mFileSystem.jsonBackendLib.listAvailableBackends():
+
+            backend = backendClass()
+
+            for indent in (None, 2, 4):
+                document = backend.dumps(data, indent=indent)
+                self.assertEqual(backend.loads(document), data)
+                self.assertEqual(backend.loads(document.encode('utf-8')), data)
+
+            self.assertRaises(ValueError, backend.loads, '{"attr":')
+
+    def test_indent(self):
+
+        data = {'attr' : 'value', 'list' : [1, {}, []], 'nested' : {'key' : None}}
+
+        # Indented documents are the same regardless of the backend
+        for indent in (0, 4):
+            expected = mFileSystem.jsonBackendLib.JSONBackend().dumps(data, indent=indent)
+            for backendClass in mFileSystem.jsonBackendLib.listAvailableBackends():
+                self.assertEqual(backendClass().dumps(data, indent=indent), expected)
+
+    def test_nonFiniteFloat(self):
+
+        data = {'nan' : [float('nan')], 'inf' : {'value' : float('inf')}, 'none' : None}
+
+        for backendClass in mFileSystem.jsonBackendLib.listAvailableBackends():
+
+            content = backendClass().loads(backendClass().dumps(data))
+
+            # NaN and Infinity are never written as null
+            self.assertNotEqual(content['nan'][0], content['nan'][0])
+            self.assertEqual(content['inf']['value'], float('inf'))
+            self.assertIsNone(content['none'])
+
+        self.assertFalse(mFileSystem.jsonBackendLib.containsNonFiniteFloat({'a' : [1.5, None, 'nan']}))
+
+    def test_setBackend(self):
+
+        backend = mFileSystem.jsonBackendLib.setBackend('json')
+
+        self.assertEqual(backend.NAME, 'json')
+        self.assertIs(mFileSystem.jsonBackendLib.getBackend(), backend)
+
+        self.assertRaises(ValueError, mFileSystem.jsonBackendLib.setBackend, 'notABackend')
+
+    def test_benchmark(self):
+
+        results = mFileSystem.jsonBackendLib.benchmark(mFileSystem.jsonBackendLib.createConfigContent(10), iterations=1)
+
+        self.assertIn('json', results)
+        self.assertEqual(sorted(results['json']), ['dumps', 'loads', 'size'])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -29,7 +29,9 @@ import os
 import unittest
 import shutil
 
+import mFileSystem.jsonBackendLib
 import mFileSystem.jsonFileLib
+import mFileSystem.msgPackLib
 
 
 #
@@ -94,6 +96,307 @@ class JSONFileTest(unittest.TestCase):
 
         os.remove(self._file)
 
+    def test_roundTrip(self):
+
+        backendName = mFileSystem.jsonBackendLib.getBackend().NAME
+
+        data = {'name' : u'\u015eafak \u00fc\u00e7 \u6f22\u5b57', 'nan' : float('nan'), 'inf' : float('-inf')}
+
+        for backendClass in mFileSystem.jsonBackendLib.listAvailableBackends():
+
+            mFileSystem.jsonBackendLib.setBackend(backendClass.NAME)
+
+            try:
+                _file = mFileSystem.jsonFileLib.JSONFile.create(self._file, overwrite=True)
+                _file.setContent(data)
+                _file.write()
+
+                content = _file.read()
+
+                self.assertEqual(content['name'], data['name'])
+                self.assertNotEqual(content['nan'], content['nan'])
+                self.assertEqual(content['inf'], float('-inf'))
+                self.assertEqual(_file.get('name'), data['name'])
+
+                # File is encoded as UTF-8 regardless of the locale
+                with open(self._file, 'rb') as inFile:
+                    self.assertEqual(mFileSystem.jsonBackendLib.JSONBackend().loads(inFile.read().decode('utf-8'))['name'], data['name'])
+            finally:
+                mFileSystem.jsonBackendLib.setBackend(backendName)
+
+        os.remove(self._file)
+
+    def test_readCache(self):
+
+        _file = mFileSystem.jsonFileLib.JSONFile.create(self._file, overwrite=False)
+
+        data = {'attr':'value', 'list':[1, 2]}
+
+        _file.setContent(data)
+        _file.write()
+
+        content = _file.read(cache=True, copy=False)
+
+        self.assertEqual(content, data)
+        self.assertRaises(TypeError, content.__setitem__, 'attr', 'other')
+        self.assertRaises(TypeError, content['list'].append, 3)
+
+        # Same content is shared
+        self.assertIs(mFileSystem.jsonFileLib.JSONFile(self._file).read(cache=True, copy=False), content)
+
+        # Copy is mutable
+        content = _file.read(cache=True)
+        content['list'].append(3)
+
+        self.assertEqual(_file.read(cache=True, copy=False), data)
+
+        # Altered file is parsed again
+        data = {'attr':'newValue'}
+
+        _file.setContent(data)
+        _file.write()
+
+        self.assertEqual(_file.read(cache=True), data)
+
+        # Replaced file of the same size and modification time is parsed again
+        stat        = os.stat(self._file)
+        replacement = os.path.join(self._tempDirectory, 'replacement.json')
+
+        _replacement = mFileSystem.jsonFileLib.JSONFile.create(replacement, overwrite=False)
+        _replacement.setContent({'attr':'valueNew'})
+        _replacement.write()
+
+        if hasattr(stat, 'st_mtime_ns'):
+            os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        else:
+            os.utime(replacement, (stat.st_atime, stat.st_mtime))
+        os.rename(replacement, self._file)
+
+        self.assertEqual(os.stat(self._file).st_size, stat.st_size)
+        self.assertEqual(_file.read(cache=True, copy=False), {'attr':'valueNew'})
+
+        mFileSystem.jsonFileLib.contentCache.clear()
+
+        os.remove(self._file)
+
+    def test_iterate(self):
+
+        _file = mFileSystem.jsonFileLib.JSONFile.create(self._file, overwrite=False)
+
+        data = [{'attr':'value'}, 12345, 'text', [1.5, None, True]]
+
+        _file.setContent(data)
+        _file.write(indent=4)
+
+        self.assertEqual(list(_file.iterate(chunkSize=3)), data)
+
+        data = {'first':[1, 2], 'second':{'attr':'value'}}
+
+        _file.setContent(data)
+        _file.write()
+
+        self.assertEqual(dict(_file.iterate(chunkSize=3)), data)
+
+        os.remove(self._file)
+
+    def test_get(self):
+
+        _file = mFileSystem.jsonFileLib.JSONFile.create(self._file, overwrite=False)
+
+        data = {'assets'  : [{'name':'first', 'tags':['a', 'b']}, {'name':'se"co]nd', 'tags':[]}],
+                'version' : '1.2.3'}
+
+        _file.setContent(data)
+        _file.write(indent=4)
+
+        self.assertEqual(_file.get('version', chunkSize=3), '1.2.3')
+        self.assertEqual(_file.get(['assets', 1, 'name'], chunkSize=3), 'se"co]nd')
+        self.assertEqual(_file.get(['assets', 0, 'tags']), ['a', 'b'])
+        self.assertEqual(_file.get([]), data)
+
+        self.assertIsNone(_file.get(['assets', 2]))
+        self.assertEqual(_file.get(['missing'], default=0), 0)
+        self.assertEqual(_file.get(['version', 'missing'], default=0), 0)
+
+        # First occurrence of a duplicate key is used
+        with open(self._file, 'w') as outFile:
+            outFile.write('{"a": {"b": 1, "b": 3}, "c": [0], "a": {"b": 2}}')
+
+        self.assertEqual(_file.get(['a', 'b']), 1)
+
+        # Value is found far in the file past escaped strings, rest of the file isn't read
+        with open(self._file, 'w') as outFile:
+            outFile.write('{"pad": [')
+            outFile.write(', '.join(['{"s": "\\\\ \\" ] } [ {", "t": ["\\u005d"]}'] * 20000))
+            outFile.write('], "k\\u0065y": {"value": "\\"x\\""}, "rest": [invalid')
+
+        self.assertGreater(os.path.getsize(self._file), 524288)
+        self.assertEqual(_file.get(['key', 'value'], chunkSize=1000), '"x"')
+        self.assertEqual(_file.get(['pad', 19999, 't', 0]), ']')
+        self.assertRaises(ValueError, _file.get, ['missing'])
+
+        os.remove(self._file)
+
+    def test_writeIterable(self):
+
+        _file = mFileSystem.jsonFileLib.JSONFile.create(self._file, overwrite=False)
+
+        _file.writeIterable(({'index':x} for x in range(10)), indent=4)
+
+        self.assertEqual(_file.read(), [{'index':x} for x in range(10)])
+
+        _file.writeIterable(iter([]))
+
+        self.assertEqual(_file.read(), [])
+
+        os.remove(self._file)
+
+class JSONLinesFileTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'jsonLinesFile'))
+        if not os.path.isdir(self._tempDirectory):
+            os.makedirs(self._tempDirectory)
+
+        self._file = os.path.join(self._tempDirectory, 'testFile.jsonl')
+
+    def tearDown(self):
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    def test_append(self):
+
+        _file = mFileSystem.jsonFileLib.JSONLinesFile.create(self._file, overwrite=False)
+
+        self.assertTrue(_file.append({'attr':'value'}))
+        self.assertTrue(_file.appendMany([1, 'text', [1, 2]]))
+
+        self.assertEqual(_file.read(), [{'attr':'value'}, 1, 'text', [1, 2]])
+
+        # Last line without a line break isn't joined with the appended record
+        with open(self._file, 'ab') as outFile:
+            outFile.write(b'{"last": true}')
+
+        _file.buildIndex()
+
+        self.assertTrue(_file.appendMany([2, 3]))
+        self.assertEqual(_file.read(), [{'attr':'value'}, 1, 'text', [1, 2], {'last':True}, 2, 3])
+        self.assertEqual(_file.record(6), 3)
+
+    def test_write(self):
+
+        _file = mFileSystem.jsonFileLib.JSONLinesFile.create(self._file, overwrite=False)
+
+        data = [{'index':x} for x in range(5)]
+
+        _file.setContent(data)
+        _file.write()
+
+        self.assertEqual(list(_file.iterate()), data)
+
+    def test_record(self):
+
+        _file = mFileSystem.jsonFileLib.JSONLinesFile.create(self._file, overwrite=False)
+        _file.appendMany({'index':x} for x in range(5))
+
+        self.assertEqual(_file.recordCount(), 5)
+        self.assertEqual(_file.record(2), {'index':2})
+
+        # Index is kept up to date by append
+        _file.append({'index':5})
+
+        self.assertEqual(_file.recordCount(), 6)
+        self.assertEqual(_file.record(-1), {'index':5})
+
+        self.assertRaises(IndexError, _file.record, 6)
+
+    def test_readParallel(self):
+
+        _file = mFileSystem.jsonFileLib.JSONLinesFile.create(self._file, overwrite=False)
+        _file.appendMany({'index':x} for x in range(1000))
+
+        # Force parallel read for the small file
+        parallelReadMinSize = mFileSystem.jsonFileLib.JSONLinesFile.PARALLEL_READ_MIN_SIZE
+        mFileSystem.jsonFileLib.JSONLinesFile.PARALLEL_READ_MIN_SIZE = 0
+
+        try:
+            self.assertEqual(_file.readParallel(workers=3), [{'index':x} for x in range(1000)])
+        finally:
+            mFileSystem.jsonFileLib.JSONLinesFile.PARALLEL_READ_MIN_SIZE = parallelReadMinSize
+
+class MessagePackFileTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'messagePackFile'))
+        if not os.path.isdir(self._tempDirectory):
+            os.makedirs(self._tempDirectory)
+
+        self._file     = os.path.join(self._tempDirectory, 'testFile.msgpack')
+        self._jsonFile = os.path.join(self._tempDirectory, 'testFile.json')
+
+        self._data     = {'attr'  : 'value',
+                          'list'  : [1, -300, 2 ** 40, 1.5, None, True, False, 'ü' * 40],
+                          'items' : [{'index':x} for x in range(100)]}
+
+    def tearDown(self):
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    @unittest.skipUnless(mFileSystem.msgPackLib.isAvailable(), 'msgpack module is not installed.')
+    def test_read(self):
+
+        _file = mFileSystem.jsonFileLib.MessagePackFile.create(self._file, overwrite=False)
+
+        _file.setContent(self._data)
+        _file.write()
+
+        self.assertEqual(mFileSystem.jsonFileLib.MessagePackFile(self._file).read(), self._data)
+
+    @unittest.skipUnless(mFileSystem.msgPackLib.isAvailable(), 'msgpack module is not installed.')
+    def test_fromJSONFile(self):
+
+        _jsonFile = mFileSystem.jsonFileLib.JSONFile.create(self._jsonFile, overwrite=False)
+        _jsonFile.setContent(self._data)
+        _jsonFile.write()
+
+        _file = mFileSystem.jsonFileLib.MessagePackFile.fromJSONFile(mFileSystem.jsonFileLib.JSONFile(self._jsonFile),
+                                                                     self._file)
+
+        _jsonFile.update()
+
+        self.assertEqual(_file.read(), self._data)
+        self.assertLess(_file.size(), _jsonFile.size())
+
+        os.remove(self._jsonFile)
+
+        self.assertEqual(_file.toJSONFile(self._jsonFile).read(), self._data)
+
+    @unittest.skipIf(mFileSystem.msgPackLib.isAvailable(), 'msgpack module is installed.')
+    def test_msgpackRequired(self):
+
+        self.assertRaises(ImportError, mFileSystem.msgPackLib.packb, self._data)
+        self.assertRaises(ImportError, mFileSystem.msgPackLib.unpackb, b'\x80')
+
+        _file = mFileSystem.jsonFileLib.MessagePackFile.create(self._file, overwrite=False)
+        _file.setContent(self._data)
+
+        self.assertRaises(ImportError, _file.write)
+        self.assertEqual(os.path.getsize(self._file), 0)
+
 #
 #-----------------------------------------------------------------------------------------------------
 # INVOKE
@@ -0,0 +1,193 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/tests/simpleWatcherLibTest.py [ FILE   ] - Unit test module.
+## @package mFileSystem.tests.simpleWatcherLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import unittest
+import shutil
+
+import mFileSystem.simpleWatcherLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class SimpleWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'simpleWatcher'))
+
+        self._watchDirectory = os.path.join(self._tempDirectory, 'watched')
+        if not os.path.isdir(self._watchDirectory):
+            os.makedirs(self._watchDirectory)
+
+        self._stateFile = os.path.join(self._tempDirectory, 'state.json')
+
+        self._createdFiles = []
+        self._editedFiles  = []
+        self._deletedFiles = []
+        self._movedFiles   = []
+
+    def tearDown(self):
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    def _created(self, fileList):
+
+        self._createdFiles.extend(fileList)
+
+    def _edited(self, fileList):
+
+        self._editedFiles.extend(fileList)
+
+    def _deleted(self, fileList):
+
+        self._deletedFiles.extend(fileList)
+
+    def _moved(self, fileList):
+
+        self._movedFiles.extend(fileList)
+
+    def _createWatcher(self):
+
+        return mFileSystem.simpleWatcherLib.SimpleWatcher(path=self._watchDirectory,
+                                                          createdCallback=self._created,
+                                                          editedCallback=self._edited,
+                                                          deletedCallback=self._deleted,
+                                                          movedCallback=self._moved,
+                                                          stateFile=self._stateFile)
+
+    def _writeFile(self, fileName, content):
+
+        path = os.path.join(self._watchDirectory, fileName)
+
+        _file = open(path, 'w')
+        _file.write(content)
+        _file.close()
+
+        return path
+
+    def test_stateFile(self):
+
+        file1 = self._writeFile('file1.txt', 'a')
+        file2 = self._writeFile('file2.txt', 'b')
+
+        _watcher = self._createWatcher()
+        _watcher._detectChanges()
+        _watcher.stop()
+
+        self.assertEqual(sorted(self._createdFiles), [file1, file2])
+        self.assertTrue(os.path.isfile(self._stateFile))
+
+        self._createdFiles[:] = []
+
+        # Changes made while the watcher isn't running
+        self._writeFile('file1.txt', 'changed')
+        os.remove(file2)
+        file3 = self._writeFile('file3.txt', 'c')
+
+        _watcher = self._createWatcher()
+        self.assertTrue(_watcher.loadState())
+        _watcher._detectChanges()
+        _watcher.stop()
+
+        self.assertEqual(self._createdFiles, [file3])
+        self.assertEqual(self._editedFiles, [file1])
+        self.assertEqual(self._deletedFiles, [file2])
+
+    def test_stateFileInWatchedPath(self):
+
+        file1 = self._writeFile('file1.txt', 'a')
+
+        self._stateFile = os.path.join(self._watchDirectory, 'state.json')
+
+        _watcher = self._createWatcher()
+        _watcher._detectChanges()
+
+        self._writeFile('file1.txt', 'changed')
+        _watcher._detectChanges()
+        _watcher._detectChanges()
+        _watcher.stop()
+
+        # State file is checkpointed but never reported
+        self.assertTrue(os.path.isfile(self._stateFile))
+        self.assertEqual(self._createdFiles, [file1])
+        self.assertEqual(self._editedFiles, [file1])
+
+    def test_movedCallback(self):
+
+        file1 = self._writeFile('file1.txt', 'a')
+        file2 = self._writeFile('file2.txt', 'b')
+
+        _watcher = self._createWatcher()
+        _watcher._detectChanges()
+
+        self._createdFiles[:] = []
+
+        movedFile = os.path.join(self._watchDirectory, 'moved.txt')
+        os.rename(file1, movedFile)
+
+        _watcher._detectChanges()
+        _watcher.stop()
+
+        self.assertEqual(self._movedFiles, [(file1, movedFile)])
+        self.assertEqual(self._createdFiles, [])
+        self.assertEqual(self._deletedFiles, [])
+
+    def test_stats(self):
+
+        self._writeFile('file1.txt', 'a')
+        self._writeFile('file2.txt', 'b')
+
+        _watcher = self._createWatcher()
+        _watcher._detectChanges()
+        _watcher._detectChanges()
+        _watcher.stop()
+
+        stats = _watcher.stats().asDict()
+
+        self.assertEqual(stats['tickCount'], 2)
+        self.assertEqual(stats['entriesScanned'], 2)
+        self.assertEqual(stats['totalStatCalls'], 4)
+        self.assertEqual(stats['eventsEmitted'], 0)
+        self.assertEqual(stats['totalEventsEmitted'], 2)
+        self.assertEqual(sum(x[1] for x in stats['scanDurationHistogram']), 2)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
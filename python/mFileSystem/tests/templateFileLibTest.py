@@ -26,6 +26,7 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import shutil
 import unittest
 
 import mCore.pythonUtilsLib
@@ -100,6 +101,157 @@ class TemplateFileTest(unittest.TestCase):
 
         os.remove(self._outputFilePath)
 
+    def test_replaceCompiled(self):
+
+        _templateFile = mFileSystem.templateFileLib.TemplateFile()
+        _templateFile.setFile(self._templateFilePath)
+        _templateFile.replace({'Ipsum':'REPLACED_IPSUM',
+                               'Letraset':'REPLACED_LETRASET',
+                               'Lorem':'REPLACED_LOREM'}, compiled=True)
+
+        self.assertEqual(_templateFile.replacedContent(), EXPECTED_CONTENT)
+
+        # Replaced values are not matched again and longer keys take precedence
+        pattern = mFileSystem.templateFileLib.getReplacePattern(['A', 'AB', 'B'])
+
+        self.assertIs(mFileSystem.templateFileLib.getReplacePattern(['B', 'AB', 'A']), pattern)
+        self.assertEqual(pattern.replace('AB A B', {'A':'B', 'AB':'A', 'B':'C'}), 'A B C')
+
+    def test_renderMany(self):
+
+        _templateFile = mFileSystem.templateFileLib.TemplateFile()
+        _templateFile.setFile(self._templateFilePath)
+
+        outputDirectory = os.path.join(self._tempDirectory, 'renderMany')
+
+        items = [({'Ipsum':'REPLACED_IPSUM', 'Letraset':'REPLACED_LETRASET', 'Lorem':'REPLACED_LOREM'},
+                  os.path.join(outputDirectory, 'shot{}'.format(x), 'output.txt')) for x in range(20)]
+
+        self.assertEqual(_templateFile.renderMany(items, workers=4), [x[1] for x in items])
+
+        for _, absFile in items:
+            _file = open(absFile, 'r')
+            content = _file.read()
+            _file.close()
+            self.assertEqual(content, EXPECTED_CONTENT)
+
+        self.assertRaises(IOError, _templateFile.renderMany, items)
+
+        self.assertEqual(_templateFile.renderMany(items[:1], overwrite=True), [items[0][1]])
+
+        shutil.rmtree(outputDirectory)
+
+        # Directory shared by many outputs is listed once, relative outputs go into the current directory
+        items = [({'Lorem':'REPLACED_LOREM'}, os.path.join(outputDirectory, 'output{}.txt'.format(x))) for x in range(20)]
+
+        self.assertEqual(len(_templateFile.renderMany(items)), 20)
+        self.assertRaises(IOError, _templateFile.renderMany, items)
+        self.assertRaises(IOError, _templateFile.renderMany, items[-1:])
+
+        currentDirectory = os.getcwd()
+        os.chdir(outputDirectory)
+        try:
+            self.assertEqual(_templateFile.renderMany([({'Lorem':'REPLACED_LOREM'}, 'relative.txt')]), ['relative.txt'])
+            self.assertRaises(IOError, _templateFile.renderMany, [({'Lorem':'REPLACED_LOREM'}, 'relative.txt')])
+        finally:
+            os.chdir(currentDirectory)
+
+        self.assertTrue(os.path.isfile(os.path.join(outputDirectory, 'relative.txt')))
+
+        shutil.rmtree(outputDirectory)
+
+    def test_templateCache(self):
+
+        templateFilePath = os.path.join(self._tempDirectory, 'cachedTemplate.txt')
+        shutil.copyfile(self._templateFilePath, templateFilePath)
+
+        keys = ['Ipsum', 'Letraset', 'Lorem']
+
+        _templateFileA = mFileSystem.templateFileLib.TemplateFile()
+        _templateFileA.setFile(templateFilePath)
+
+        _templateFileB = mFileSystem.templateFileLib.TemplateFile()
+        _templateFileB.setFile(templateFilePath)
+
+        # Content and parsed templates are shared
+        self.assertIs(_templateFileB.content(), _templateFileA.content())
+        self.assertIs(_templateFileB.parse(keys), _templateFileA.parse(keys))
+
+        # Altered file is read again
+        _file = open(templateFilePath, 'a')
+        _file.write('\nLorem')
+        _file.close()
+
+        _templateFileB.setFile(templateFilePath)
+
+        self.assertTrue(_templateFileB.content().endswith('\nLorem'))
+        self.assertIsNot(_templateFileB.parse(keys), _templateFileA.parse(keys))
+
+        # Replaced file of the same size and modification time is read again
+        stat        = os.stat(templateFilePath)
+        replacement = os.path.join(self._tempDirectory, 'replacement.txt')
+
+        _file = open(replacement, 'w')
+        _file.write('-' * stat.st_size)
+        _file.close()
+
+        if hasattr(stat, 'st_mtime_ns'):
+            os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        else:
+            os.utime(replacement, (stat.st_atime, stat.st_mtime))
+        os.rename(replacement, templateFilePath)
+
+        _templateFileB.setFile(templateFilePath)
+
+        self.assertEqual(_templateFileB.content(), '-' * stat.st_size)
+
+        os.remove(templateFilePath)
+
+    def test_renderStream(self):
+
+        replaceData = {'Ipsum':'REPLACED_IPSUM', 'Letraset':'REPLACED_LETRASET', 'Lorem':'REPLACED_LOREM'}
+
+        # Small chunks make the keys straddle chunk boundaries
+        for chunkSize in (1, 3, 7, 64, 1048576):
+            mFileSystem.templateFileLib.TemplateFile.renderStream(self._templateFilePath,
+                                                                  replaceData,
+                                                                  self._outputFilePath,
+                                                                  overwrite=True,
+                                                                  chunkSize=chunkSize)
+
+            _file = open(self._outputFilePath, 'r')
+            content = _file.read()
+            _file.close()
+            self.assertEqual(content, EXPECTED_CONTENT)
+
+        self.assertRaises(IOError,
+                          mFileSystem.templateFileLib.TemplateFile.renderStream,
+                          self._templateFilePath,
+                          replaceData,
+                          self._outputFilePath)
+
+        os.remove(self._outputFilePath)
+
+        # Longer keys take precedence across chunk boundaries
+        pattern = mFileSystem.templateFileLib.getReplacePattern(['A', 'AB', 'B'])
+        chunks  = ['A', 'B A', ' B']
+
+        self.assertEqual(''.join(pattern.replaceChunks(chunks, {'A':'B', 'AB':'A', 'B':'C'})), 'A B C')
+
+        # Template is read with the encoding the output file is written with
+        with open(self._outputFilePath, 'wb') as outFile:
+            outFile.write(u'\u015eafak SHOT \u6f22\u5b57'.encode('utf-8'))
+
+        absFile = os.path.join(self._tempDirectory, 'stream.txt')
+
+        mFileSystem.templateFileLib.TemplateFile.renderStream(self._outputFilePath, {'SHOT':'sh010'}, absFile, chunkSize=3)
+
+        with open(absFile, 'rb') as inFile:
+            self.assertEqual(inFile.read().decode('utf-8'), u'\u015eafak sh010 \u6f22\u5b57')
+
+        os.remove(absFile)
+        os.remove(self._outputFilePath)
+
     def test_replaceByFunction(self):
 
         _templateFile = mFileSystem.templateFileLib.TemplateFile()
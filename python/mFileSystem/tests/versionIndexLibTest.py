@@ -0,0 +1,118 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/tests/versionIndexLibTest.py [ FILE   ] - Unit test module.
+## @package mFileSystem.tests.versionIndexLibTest    [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import unittest
+import shutil
+
+import mFileSystem.versionIndexLib
+import mFileSystem.versionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class VersionIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'versionIndex'))
+
+        self._assetDirectories = []
+
+        for i in range(10):
+            assetDirectory = os.path.join(self._tempDirectory, 'asset{}'.format(i))
+            for version in ('1.0.0', '1.2.0', '{}.0.0'.format(i + 2), 'notVersion', '1.0'):
+                os.makedirs(os.path.join(assetDirectory, version))
+            self._assetDirectories.append(assetDirectory)
+
+    def tearDown(self):
+
+        mFileSystem.versionIndexLib.clearVersionIndexes()
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    def test_resolveVersions(self):
+
+        result = mFileSystem.versionIndexLib.resolveVersions(self._assetDirectories, workers=4)
+
+        self.assertEqual(result, dict((x, '{}.0.0'.format(i + 2)) for i, x in enumerate(self._assetDirectories)))
+
+        missingDirectory = os.path.join(self._tempDirectory, 'missing')
+
+        result = mFileSystem.versionIndexLib.resolveVersions({self._assetDirectories[0] : mFileSystem.versionLib.Version.kPrevious,
+                                                              self._assetDirectories[1] : mFileSystem.versionLib.Version.kAll,
+                                                              self._assetDirectories[2] : '1.0.0',
+                                                              missingDirectory          : mFileSystem.versionLib.Version.kLatest},
+                                                             absolutePath=True)
+
+        self.assertEqual(result, {self._assetDirectories[0] : os.path.join(self._assetDirectories[0], '1.2.0'),
+                                  self._assetDirectories[1] : [os.path.join(self._assetDirectories[1], x) for x in ('1.0.0', '1.2.0', '3.0.0')],
+                                  self._assetDirectories[2] : os.path.join(self._assetDirectories[2], '1.0.0'),
+                                  missingDirectory          : None})
+
+        # Folders with less than three components are resolved unless semantic only
+        self.assertEqual(mFileSystem.versionIndexLib.resolveVersions(self._assetDirectories[:1],
+                                                                     version=mFileSystem.versionLib.Version.kFirst,
+                                                                     semanticOnly=False),
+                         {self._assetDirectories[0] : '1.0'})
+
+    def test_query(self):
+
+        for version in ('1.4.1', '1.10.0', '0.4.2', '0.5.0'):
+            os.makedirs(os.path.join(self._assetDirectories[0], version))
+
+        index = mFileSystem.versionIndexLib.getVersionIndex(self._assetDirectories[0])
+
+        self.assertEqual(index.query(), ['0.4.2', '0.5.0', '1.0.0', '1.2.0', '1.4.1', '1.10.0', '2.0.0'])
+        self.assertEqual(index.query('>=1.2,<2.0'), ['1.2.0', '1.4.1', '1.10.0'])
+        self.assertEqual(index.query('>1.2 <=2'), ['1.4.1', '1.10.0', '2.0.0'])
+        self.assertEqual(index.query('~1.4'), ['1.4.1'])
+        self.assertEqual(index.query('^1.2'), ['1.2.0', '1.4.1', '1.10.0'])
+        self.assertEqual(index.query('^0.4'), ['0.4.2'])
+        self.assertEqual(index.query('1.2'), ['1.2.0'])
+        self.assertEqual(index.query('!=1.0.0', newest=2), ['1.10.0', '2.0.0'])
+        self.assertEqual(index.query(newest=0), [])
+
+        self.assertRaises(ValueError, index.query, '>=1.x')
+        self.assertRaises(ValueError, mFileSystem.versionLib.VersionConstraint, ' , ')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
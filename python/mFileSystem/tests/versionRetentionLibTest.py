@@ -0,0 +1,150 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/tests/versionRetentionLibTest.py [ FILE   ] - Unit test module.
+## @package mFileSystem.tests.versionRetentionLibTest    [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import unittest
+import shutil
+
+import mFileSystem.versionIndexLib
+import mFileSystem.versionRetentionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class VersionRetentionTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempDirectory = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                           '..',
+                                                           '..',
+                                                           '..',
+                                                           'test',
+                                                           'versionRetention'))
+
+        self._folderDirectory = os.path.join(self._tempDirectory, 'folders')
+        self._fileDirectory   = os.path.join(self._tempDirectory, 'files')
+
+        os.makedirs(self._fileDirectory)
+
+        oldTime = time.time() - 3600
+
+        for i in range(1, 11):
+            folder = os.path.join(self._folderDirectory, '{}.0.0'.format(i))
+            os.makedirs(folder)
+            with open(os.path.join(folder, 'data.txt'), 'w') as outFile:
+                outFile.write('-' * 10)
+            os.utime(folder, (oldTime, oldTime))
+
+            absFile = os.path.join(self._fileDirectory, 'file.v{:03d}.txt'.format(i))
+            with open(absFile, 'w') as outFile:
+                outFile.write('-' * 10)
+            os.utime(absFile, (oldTime, oldTime))
+
+    def tearDown(self):
+
+        mFileSystem.versionIndexLib.clearVersionIndexes()
+
+        if os.path.isdir(self._tempDirectory):
+            shutil.rmtree(self._tempDirectory)
+
+    def test_policy(self):
+
+        self.assertRaises(ValueError, mFileSystem.versionRetentionLib.RetentionPolicy)
+
+    def test_pruneFolders(self):
+
+        open(os.path.join(self._folderDirectory, '2.0.0', '.keep'), 'w').close()
+
+        now = time.time()
+        os.utime(os.path.join(self._folderDirectory, '5.0.0'), (now, now))
+
+        policy = mFileSystem.versionRetentionLib.RetentionPolicy(keepLast=3,
+                                                                 keepNewerThan=60,
+                                                                 keepTagged=['1.0.0'],
+                                                                 tagFileName='.keep')
+
+        report = mFileSystem.versionRetentionLib.prune(self._folderDirectory, policy)
+
+        kept    = [os.path.join(self._folderDirectory, '{}.0.0'.format(x)) for x in (1, 2, 5, 8, 9, 10)]
+        removed = [os.path.join(self._folderDirectory, '{}.0.0'.format(x)) for x in (3, 4, 6, 7)]
+
+        self.assertTrue(report.dryRun())
+        self.assertEqual(report.kept(), kept)
+        self.assertEqual(report.removed(), removed)
+        self.assertEqual(report.freedBytes(), 40)
+        self.assertTrue(all(os.path.isdir(x) for x in removed))
+
+        report = mFileSystem.versionRetentionLib.prune(self._folderDirectory, policy, dryRun=False, workers=4)
+
+        self.assertEqual(report.removed(), removed)
+        self.assertEqual(report.errors(), {})
+        self.assertEqual(report.freedBytes(), 40)
+        self.assertFalse(any(os.path.isdir(x) for x in removed))
+        self.assertTrue(all(os.path.isdir(x) for x in kept))
+
+    def test_pruneFiles(self):
+
+        policy = mFileSystem.versionRetentionLib.RetentionPolicy(keepLast=2)
+
+        report = mFileSystem.versionRetentionLib.prune(self._fileDirectory, policy, files=True, extension='txt', dryRun=False)
+
+        self.assertEqual(sorted(os.listdir(self._fileDirectory)), ['file.v009.txt', 'file.v010.txt'])
+        self.assertEqual(report.asDict()['freedBytes'], 80)
+        self.assertEqual(len(report.asStr().splitlines()), 9)
+
+    def test_pruneFileGroups(self):
+
+        for name in ('model.v001.ma', 'model.v002.ma', 'model.v003.ma', 'model.v003.txt',
+                     'texture.v001.txt', 'texture.v002.txt', 'texture.v003.txt'):
+            open(os.path.join(self._fileDirectory, name), 'w').close()
+
+        policy = mFileSystem.versionRetentionLib.RetentionPolicy(keepLast=2)
+
+        report = mFileSystem.versionRetentionLib.prune(self._fileDirectory, policy, files=True, dryRun=False)
+
+        self.assertEqual(sorted(os.listdir(self._fileDirectory)), ['file.v009.txt',
+                                                                   'file.v010.txt',
+                                                                   'model.v002.ma',
+                                                                   'model.v003.ma',
+                                                                   'model.v003.txt',
+                                                                   'texture.v002.txt',
+                                                                   'texture.v003.txt'])
+        self.assertEqual(len(report.kept()), 7)
+        self.assertEqual(len(report.removed()), 10)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,428 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/versionIndexLib.py @brief [ FILE   ] - Index versioned folders.
+## @package mFileSystem.versionIndexLib    @brief [ MODULE ] - Index versioned folders.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import bisect
+
+from   multiprocessing  import pool
+from   threading        import Lock
+
+import mFileSystem.versionLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## [ re.Pattern ] - Matches folder names made of dot separated numbers, like 1.2 or 1.2.3.
+VERSION_NAME_RE          = re.compile(r'^[0-9]+(?:\.[0-9]+)*$')
+
+## [ int ] - Minimum number of components of a semantic version, like 1.2.3.
+SEMANTIC_VERSION_LENGTH  = 3
+
+## [ tuple ] - Version options from mFileSystem.versionLib.Version class, any other version is a folder name or a version tuple.
+VERSION_OPTIONS          = (mFileSystem.versionLib.Version.kAll,
+                            mFileSystem.versionLib.Version.kLatest,
+                            mFileSystem.versionLib.Version.kCurrent,
+                            mFileSystem.versionLib.Version.kFirst,
+                            mFileSystem.versionLib.Version.kLast,
+                            mFileSystem.versionLib.Version.kPrevious)
+
+#
+## @brief List names of the folders in given directory.
+#
+#  os.scandir is used where available so entry types are read without an extra stat per entry.
+#
+#  @param directory [ str  | None | in  ] - Absolute path of a directory.
+#  @param ignoreDot [ bool | True | in  ] - Ignore folders that start with dot (hidden folders).
+#
+#  @exception OSError - If the directory can't be listed.
+#
+#  @return list of str - Folder names, not sorted.
+def listFolderNames(directory, ignoreDot=True):
+
+    if hasattr(os, 'scandir'):
+        folders = [x.name for x in os.scandir(directory) if x.is_dir()]
+    else:
+        folders = [x for x in os.listdir(directory) if os.path.isdir(os.path.join(directory, x))]
+
+    if ignoreDot:
+        folders = [x for x in folders if not x.startswith('.')]
+
+    return folders
+
+#
+## @brief Parse given folder name into a version tuple.
+#
+#  @param name [ str | None | in  ] - Folder name, like 1.2.3.
+#
+#  @exception N/A
+#
+#  @return tuple of int - Version, like (1, 2, 3).
+#  @return None         - If the name is not made of dot separated numbers.
+def parseVersion(name):
+
+    if not VERSION_NAME_RE.match(name):
+        return None
+
+    return tuple(int(x) for x in name.split('.'))
+
+#
+## @brief [ CLASS ] - Class to index versioned folders of a directory.
+#
+#  Folder names are parsed into version tuples once and kept sorted. The index is rebuilt only when the
+#  modification time of the directory changes, which happens when a folder is added, removed or renamed
+#  in it. Latest, first and previous versions are answered in O(1), specific versions by name in O(1)
+#  and by version tuple in O(log n).
+class VersionIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory    [ str  | None | in  ] - Absolute path of the directory where the versioned folders are.
+    #  @param semanticOnly [ bool | True | in  ] - Index only the folders with semantic version naming convention, like 1.2.3.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, directory, semanticOnly=True):
+
+        ## [ str ] - Absolute path of the directory.
+        self._directory    = directory
+
+        ## [ bool ] - Index only the folders with semantic version naming convention.
+        self._semanticOnly = semanticOnly
+
+        ## [ int ] - Modification time of the directory when the index was built.
+        self._mtime        = None
+
+        ## [ tuple ] - Sorted version tuples, folder names in the same order and a dict of their positions by name.
+        self._entries      = ([], [], {})
+
+        ## [ threading.Lock ] - Lock.
+        self._lock         = Lock()
+
+    #
+    ## @brief Number of indexed versions.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self.refresh()[1])
+
+    #
+    ## @brief Build the index.
+    #
+    #  @param mtime [ int | None | in  ] - Modification time of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _build(self, mtime):
+
+        entries = []
+
+        for name in listFolderNames(self._directory):
+            version = parseVersion(name)
+            if version is None or (self._semanticOnly and len(version) < SEMANTIC_VERSION_LENGTH):
+                continue
+            entries.append((version, name))
+
+        entries.sort()
+
+        names = [x[1] for x in entries]
+
+        self._entries = ([x[0] for x in entries], names, dict((x, i) for i, x in enumerate(names)))
+        self._mtime   = mtime
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Directory.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @brief Whether only the folders with semantic version naming convention are indexed.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def semanticOnly(self):
+
+        return self._semanticOnly
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Rebuild the index if the directory has been altered since it was built.
+    #
+    #  Directory is stat'ed on each call, it is listed only if its modification time has changed.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Sorted version tuples, folder names in the same order and a dict of their positions by name.
+    def refresh(self):
+
+        try:
+            stat = os.stat(self._directory)
+        except OSError:
+            with self._lock:
+                self._entries = ([], [], {})
+                self._mtime   = None
+            return self._entries
+
+        mtime = getattr(stat, 'st_mtime_ns', stat.st_mtime)
+
+        with self._lock:
+            if mtime != self._mtime:
+                self._build(mtime)
+            return self._entries
+
+    #
+    ## @brief Folder names sorted by version.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Folder names.
+    def names(self):
+
+        return list(self.refresh()[1])
+
+    #
+    ## @brief Get folder name of given version.
+    #
+    #  @param version [ enum, str, tuple | None | in  ] - Version from mFileSystem.versionLib.Version class, folder name or version tuple.
+    #
+    #  @exception N/A
+    #
+    #  @return str         - Folder name.
+    #  @return list of str - Folder names, if all versions are requested.
+    #  @return None        - If the version doesn't exist.
+    def get(self, version):
+
+        versions, names, positions = self.refresh()
+
+        if version == mFileSystem.versionLib.Version.kAll:
+            return list(names)
+
+        if not names:
+            return None
+
+        if version in (mFileSystem.versionLib.Version.kLatest,
+                       mFileSystem.versionLib.Version.kCurrent,
+                       mFileSystem.versionLib.Version.kLast):
+            return names[-1]
+
+        elif version == mFileSystem.versionLib.Version.kFirst:
+            return names[0]
+
+        elif version == mFileSystem.versionLib.Version.kPrevious:
+            return names[-2] if len(names) > 1 else names[0]
+
+        elif isinstance(version, tuple):
+            position = bisect.bisect_left(versions, version)
+            if position < len(versions) and versions[position] == version:
+                return names[position]
+            return None
+
+        position = positions.get(version)
+
+        return None if position is None else names[position]
+
+    #
+    ## @brief Get folder names of the versions satisfying given constraint.
+    #
+    #  Constraint is evaluated on the parsed version tuples of the index, the directory is not listed again
+    #  unless it has been altered.
+    #
+    # @code
+    #index.query('>=1.2,<2.0')
+    #['1.2.0', '1.4.1', '1.10.0']
+    #
+    #index.query('~1.4', newest=1)
+    #['1.4.1']
+    # @endcode
+    #
+    #  @param constraint [ str, mFileSystem.versionLib.VersionConstraint | None | in  ] - Constraint, all the versions if None.
+    #  @param newest     [ int                                           | None | in  ] - Return only this many newest versions.
+    #
+    #  @exception ValueError - If the constraint is not valid.
+    #
+    #  @return list of str - Folder names sorted by version, oldest first.
+    def query(self, constraint=None, newest=None):
+
+        if constraint is not None and not isinstance(constraint, mFileSystem.versionLib.VersionConstraint):
+            constraint = mFileSystem.versionLib.VersionConstraint(constraint)
+
+        versions, names, positions = self.refresh()
+
+        if constraint is None:
+            result = list(names)
+        else:
+            result = [names[i] for i, x in enumerate(versions) if constraint.matches(x)]
+
+        if newest is not None:
+            result = result[-newest:] if newest > 0 else []
+
+        return result
+
+#
+## [ dict ] - Indexes used by getVersionIndex function, keys are (directory, semanticOnly) tuples.
+_versionIndexes     = {}
+
+## [ threading.Lock ] - Lock of the indexes.
+_versionIndexesLock = Lock()
+
+#
+## @brief Get the process wide index of given directory, indexes are created on demand.
+#
+#  @param directory    [ str  | None | in  ] - Absolute path of the directory where the versioned folders are.
+#  @param semanticOnly [ bool | True | in  ] - Index only the folders with semantic version naming convention, like 1.2.3.
+#
+#  @exception N/A
+#
+#  @return mFileSystem.versionIndexLib.VersionIndex - Index.
+def getVersionIndex(directory, semanticOnly=True):
+
+    key = (os.path.abspath(directory), bool(semanticOnly))
+
+    with _versionIndexesLock:
+        index = _versionIndexes.get(key)
+        if index is None:
+            index = VersionIndex(key[0], semanticOnly=key[1])
+            _versionIndexes[key] = index
+
+    return index
+
+#
+## @brief Remove all process wide indexes.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clearVersionIndexes():
+
+    with _versionIndexesLock:
+        _versionIndexes.clear()
+
+#
+## @brief Resolve version of a directory.
+#
+#  This function is used by mFileSystem.versionIndexLib.resolveVersions function.
+#
+#  @param arguments [ tuple | None | in  ] - Directory, version, semantic only and absolute path flags.
+#
+#  @exception N/A
+#
+#  @return variant - Result of mFileSystem.versionIndexLib.VersionIndex.get method.
+def _resolveVersion(arguments):
+
+    directory, version, semanticOnly, absolutePath = arguments
+
+    result = getVersionIndex(directory, semanticOnly=semanticOnly).get(version)
+
+    if result is None or not absolutePath:
+        return result
+
+    if version == mFileSystem.versionLib.Version.kAll:
+        return [os.path.join(directory, x) for x in result]
+
+    return os.path.join(directory, result)
+
+#
+## @brief Resolve versions of many directories concurrently.
+#
+#  Directories are resolved by a pool of worker threads through their process wide indexes, see
+#  getVersionIndex function, so listing directories on network file systems overlaps and resolving the
+#  same directories again costs a stat per directory.
+#
+# @code
+#mFileSystem.versionIndexLib.resolveVersions(['/assets/chair', '/assets/table'])
+#{'/assets/chair': '2.0.0', '/assets/table': '1.3.0'}
+#
+#mFileSystem.versionIndexLib.resolveVersions({'/assets/chair': '1.0.0',
+#                                             '/assets/table': mFileSystem.versionLib.Version.kPrevious})
+#{'/assets/chair': '1.0.0', '/assets/table': '1.2.0'}
+# @endcode
+#
+#  @param directories  [ iterable, dict   | None  | in  ] - Directories, or a dict whose keys are directories and values are versions.
+#  @param version      [ enum, str, tuple | None  | in  ] - Version of the directories that are not given with a version, see mFileSystem.versionIndexLib.VersionIndex.get method.
+#  @param semanticOnly [ bool             | True  | in  ] - Resolve only the folders with semantic version naming convention, like 1.2.3.
+#  @param absolutePath [ bool             | False | in  ] - Whether to return absolute path of the versioned folders.
+#  @param workers      [ int              | 16    | in  ] - Number of worker threads.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are the directories, values are the results of mFileSystem.versionIndexLib.VersionIndex.get method.
+def resolveVersions(directories,
+                    version=mFileSystem.versionLib.Version.kLatest,
+                    semanticOnly=True,
+                    absolutePath=False,
+                    workers=16):
+
+    if isinstance(directories, dict):
+        items = list(directories.items())
+    else:
+        items = [(x, version) for x in directories]
+
+    arguments = [(x[0], x[1], semanticOnly, absolutePath) for x in items]
+
+    if workers < 2 or len(arguments) < 2:
+        results = [_resolveVersion(x) for x in arguments]
+    else:
+        threadPool = pool.ThreadPool(processes=min(workers, len(arguments)))
+        try:
+            results = threadPool.map(_resolveVersion, arguments)
+        finally:
+            threadPool.close()
+            threadPool.join()
+
+    return dict(zip([x[0] for x in items], results))
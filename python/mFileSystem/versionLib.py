@@ -25,6 +25,9 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import re
+import operator
+
 import mMeco.core.enumAbs
 
 
@@ -53,3 +56,158 @@ class Version(mMeco.core.enumAbs.Enum):
 
     ## [ str ] - Previous.
     kPrevious   = 'previous'
+
+#
+## @brief [ CLASS ] - Version constraint evaluated on version tuples.
+#
+#  Constraints are comma or space separated clauses, all of which must be satisfied. Versions are compared
+#  component by component, missing components are treated as 0, so 1.2 equals to 1.2.0.
+#
+#  Clause    | Matches                  |
+#  --------- | ------------------------ |
+#  1.2.3     | 1.2.3                    |
+#  ==1.2.3   | 1.2.3                    |
+#  !=1.2.3   | Anything but 1.2.3       |
+#  >=1.2     | 1.2.0 and newer          |
+#  <2.0      | Older than 2.0.0         |
+#  ~1.4      | >=1.4.0,<1.5.0           |
+#  ~1.4.2    | >=1.4.2,<1.5.0           |
+#  ^1.4      | >=1.4.0,<2.0.0           |
+#  ^0.4      | >=0.4.0,<0.5.0           |
+#
+# @code
+#constraint = mFileSystem.versionLib.VersionConstraint('>=1.2,<2.0')
+#constraint.matches((1, 4, 0))
+#True
+# @endcode
+class VersionConstraint(object):
+
+    ## [ re.Pattern ] - Matches a clause.
+    CLAUSE_RE = re.compile(r'^(==|!=|>=|<=|>|<|=|~|\^)?([0-9]+(?:\.[0-9]+)*)$')
+
+    ## [ dict ] - Keys are operators, values are comparison functions.
+    OPERATORS = {'=='   : operator.eq,
+                 '='    : operator.eq,
+                 '!='   : operator.ne,
+                 '>='   : operator.ge,
+                 '<='   : operator.le,
+                 '>'    : operator.gt,
+                 '<'    : operator.lt}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param constraint [ str | None | in  ] - Constraint, like `>=1.2,<2.0`.
+    #
+    #  @exception ValueError - If the constraint is not valid.
+    #
+    #  @return None - None.
+    def __init__(self, constraint):
+
+        ## [ str ] - Constraint.
+        self._constraint = constraint
+
+        ## [ list of tuple ] - Comparison functions and versions of the clauses.
+        self._clauses    = []
+
+        for clause in re.split(r'[\s,]+', constraint.strip()):
+            if clause:
+                self._clauses.extend(VersionConstraint._parseClause(clause))
+
+        if not self._clauses:
+            raise ValueError('Version constraint is empty: {}'.format(constraint))
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Constraint.
+    def __str__(self):
+
+        return self._constraint
+
+    #
+    ## @brief Parse given clause.
+    #
+    #  @param clause [ str | None | in  ] - Clause, like `>=1.2`.
+    #
+    #  @exception ValueError - If the clause is not valid.
+    #
+    #  @return list of tuple - Comparison functions and versions.
+    @staticmethod
+    def _parseClause(clause):
+
+        match = VersionConstraint.CLAUSE_RE.match(clause)
+        if not match:
+            raise ValueError('Version constraint clause is not valid: {}'.format(clause))
+
+        _operator = match.group(1) or '=='
+        version   = tuple(int(x) for x in match.group(2).split('.'))
+
+        if _operator in VersionConstraint.OPERATORS:
+            return [(VersionConstraint.OPERATORS[_operator], version)]
+
+        if _operator == '~':
+            # Allow changes in the last component given, minor component if only major is given
+            component = max(0, min(len(version), 2) - 1)
+        else:
+            # Allow changes that don't modify the first non zero component
+            component = next((i for i, x in enumerate(version) if x), len(version) - 1)
+
+        upperBound = version[:component] + (version[component] + 1,)
+
+        return [(operator.ge, version), (operator.lt, upperBound)]
+
+    #
+    ## @brief Compare given versions after padding them to the same length.
+    #
+    #  @param function [ function     | None | in  ] - Comparison function.
+    #  @param versionA [ tuple of int | None | in  ] - Version.
+    #  @param versionB [ tuple of int | None | in  ] - Version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def _compare(function, versionA, versionB):
+
+        length = max(len(versionA), len(versionB))
+
+        return function(versionA + (0,) * (length - len(versionA)), versionB + (0,) * (length - len(versionB)))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given version satisfies this constraint.
+    #
+    #  @param version [ tuple of int | None | in  ] - Version, like (1, 2, 3).
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def matches(self, version):
+
+        for function, clauseVersion in self._clauses:
+            if not VersionConstraint._compare(function, version, clauseVersion):
+                return False
+
+        return True
+
+    #
+    ## @brief Filter given versions.
+    #
+    #  @param versions [ iterable of tuple | None | in  ] - Versions.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Versions satisfying this constraint, in the given order.
+    def filter(self, versions):
+
+        return [x for x in versions if self.matches(x)]
@@ -0,0 +1,465 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mFileSystem/versionRetentionLib.py @brief [ FILE   ] - Prune versioned folders and files.
+## @package mFileSystem.versionRetentionLib    @brief [ MODULE ] - Prune versioned folders and files.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+
+from   multiprocessing  import pool
+
+import mFileSystem.directoryLib
+import mFileSystem.fileLib
+import mFileSystem.versionLib
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Class to decide which versions to keep.
+#
+#  A version is kept if any of the rules keeps it, the rest of the versions are removed.
+#
+# @code
+#import mFileSystem.versionRetentionLib
+#
+## Keep the last 5 versions, versions modified in the last 30 days and the versions tagged with a .keep file
+#policy = mFileSystem.versionRetentionLib.RetentionPolicy(keepLast=5,
+#                                                         keepNewerThan=30 * 24 * 60 * 60,
+#                                                         tagFileName='.keep')
+# @endcode
+class RetentionPolicy(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param keepLast      [ int             | None | in  ] - Number of the latest versions to keep.
+    #  @param keepNewerThan [ float           | None | in  ] - Keep versions modified in this many seconds.
+    #  @param keepTagged    [ iterable of str | None | in  ] - Names of the versions to keep, like 1.2.0 or file.v003.txt.
+    #  @param tagFileName   [ str             | None | in  ] - Keep versioned folders containing a file with this name.
+    #
+    #  @exception ValueError - If no rule is given.
+    #
+    #  @return None - None.
+    def __init__(self, keepLast=None, keepNewerThan=None, keepTagged=None, tagFileName=None):
+
+        if keepLast is None and keepNewerThan is None and not keepTagged and not tagFileName:
+            raise ValueError('Retention policy must have at least one rule.')
+
+        ## [ int ] - Number of the latest versions to keep.
+        self._keepLast      = keepLast
+
+        ## [ float ] - Keep versions modified in this many seconds.
+        self._keepNewerThan = keepNewerThan
+
+        ## [ set of str ] - Names of the versions to keep.
+        self._keepTagged    = set(keepTagged or [])
+
+        ## [ str ] - Keep versioned folders containing a file with this name.
+        self._tagFileName   = tagFileName
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Split given versions into the versions to keep and to remove.
+    #
+    #  @param versions [ list of str | None | in  ] - Absolute paths of the versions, oldest first.
+    #  @param now      [ float       | None | in  ] - Current time, time.time() is used if None.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Versions to keep.
+    #  @return list of str - Versions to remove.
+    def apply(self, versions, now=None):
+
+        keep = set()
+
+        if self._keepLast:
+            keep.update(versions[-self._keepLast:])
+
+        if self._keepTagged:
+            keep.update(x for x in versions if os.path.basename(x) in self._keepTagged)
+
+        if self._keepNewerThan is not None:
+            threshold = (time.time() if now is None else now) - self._keepNewerThan
+            for version in versions:
+                try:
+                    if os.path.getmtime(version) >= threshold:
+                        keep.add(version)
+                except OSError:
+                    pass
+
+        if self._tagFileName:
+            keep.update(x for x in versions if os.path.isfile(os.path.join(x, self._tagFileName)))
+
+        return [x for x in versions if x in keep], [x for x in versions if x not in keep]
+
+#
+## @brief [ CLASS ] - Class to report the result of a prune.
+class RetentionReport(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param dryRun [ bool | None | in  ] - Whether the versions were only reported, not removed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, dryRun):
+
+        ## [ bool ] - Whether the versions were only reported, not removed.
+        self._dryRun     = dryRun
+
+        ## [ list of str ] - Kept versions.
+        self._kept       = []
+
+        ## [ list of str ] - Removed versions, or the versions that would be removed in a dry run.
+        self._removed    = []
+
+        ## [ dict ] - Keys are versions that could not be removed, values are error messages.
+        self._errors     = {}
+
+        ## [ int ] - Total size of the removed versions in bytes.
+        self._freedBytes = 0
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Report.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Whether the versions were only reported, not removed.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def dryRun(self):
+
+        return self._dryRun
+
+    #
+    ## @brief Kept versions.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths.
+    def kept(self):
+
+        return self._kept
+
+    #
+    ## @brief Removed versions, or the versions that would be removed in a dry run.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths.
+    def removed(self):
+
+        return self._removed
+
+    #
+    ## @brief Versions that could not be removed.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are absolute paths, values are error messages.
+    def errors(self):
+
+        return self._errors
+
+    #
+    ## @brief Total size of the removed versions in bytes.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Size.
+    def freedBytes(self):
+
+        return self._freedBytes
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add kept versions.
+    #
+    #  @param versions [ list of str | None | in  ] - Absolute paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addKept(self, versions):
+
+        self._kept.extend(versions)
+
+    #
+    ## @brief Add removed version, or a version that would be removed in a dry run.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #  @param size [ int | None | in  ] - Size of the version in bytes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addRemoved(self, path, size):
+
+        self._removed.append(path)
+        self._freedBytes += size
+
+    #
+    ## @brief Add version that could not be removed.
+    #
+    #  @param path    [ str | None | in  ] - Absolute path.
+    #  @param message [ str | None | in  ] - Error message.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addError(self, path, message):
+
+        self._errors[path] = message
+
+    #
+    ## @brief Get report as dict.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Report.
+    def asDict(self):
+
+        return {'dryRun'     : self._dryRun,
+                'kept'       : list(self._kept),
+                'removed'    : list(self._removed),
+                'errors'     : dict(self._errors),
+                'freedBytes' : self._freedBytes
+                }
+
+    #
+    ## @brief Get report as str.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Report.
+    def asStr(self):
+
+        lines = ['{} {} version(s), kept {}, freed {}'.format('Would remove' if self._dryRun else 'Removed',
+                                                               len(self._removed),
+                                                               len(self._kept),
+                                                               mFileSystem.fileLib.File.getFileSizeAsStr(self._freedBytes))]
+
+        lines.extend('  - {}'.format(x) for x in self._removed)
+        lines.extend('  ! {}: {}'.format(x, y) for x, y in sorted(self._errors.items()))
+
+        return '\n'.join(lines)
+
+#
+## @brief Get total size of given file or directory.
+#
+#  @param path [ str | None | in  ] - Absolute path of a file or a directory.
+#
+#  @exception N/A
+#
+#  @return int - Size in bytes, symbolic links are not followed.
+def getSize(path):
+
+    if not os.path.isdir(path) or os.path.islink(path):
+        try:
+            return os.lstat(path).st_size
+        except OSError:
+            return 0
+
+    size = 0
+
+    for root, directories, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+
+    return size
+
+#
+## @brief Group given versioned files by base name and extension.
+#
+#  Versions are allocated per base name and extension, see
+#  mFileSystem.directoryLib.Directory.createNextVersionedFile method, therefore each group is a separate
+#  line of versions. Files whose names are not versioned file names are left out.
+#
+#  @param versions [ list of str | None | in  ] - Absolute paths of versioned files.
+#
+#  @exception N/A
+#
+#  @return list of list of str - Groups sorted by base name and extension, versions in each group are
+#                                sorted by version number in ascending order.
+def _groupVersionedFiles(versions):
+
+    groups = {}
+
+    for path in versions:
+        stem, extension = os.path.splitext(os.path.basename(path))
+        match = mFileSystem.directoryLib.Directory.VERSIONED_FILE_NAME_RE.match(stem)
+        if not match:
+            continue
+        groups.setdefault((match.group(1), extension), []).append((int(match.group(2)), path))
+
+    return [[x[1] for x in sorted(groups[key])] for key in sorted(groups)]
+
+#
+## @brief Remove given version.
+#
+#  This function is used by mFileSystem.versionRetentionLib.prune function.
+#
+#  @param arguments [ tuple | None | in  ] - Absolute path of the version and dry run flag.
+#
+#  @exception N/A
+#
+#  @return int - Size of the version in bytes.
+#  @return str - Error message, None if the version is removed.
+def _removeVersion(arguments):
+
+    path, dryRun = arguments
+
+    size = getSize(path)
+
+    if dryRun:
+        return size, None
+
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except (IOError, OSError) as error:
+        return 0, str(error)
+
+    return size, None
+
+#
+## @brief Remove the versions under given path by given policy.
+#
+#  Versions are listed once, see mFileSystem.directoryLib.Directory.listVersionedFolders and
+#  mFileSystem.directoryLib.Directory.listVersionedFiles methods. Versioned files are grouped by base name
+#  and extension and the policy is applied to each group, so model.v001.ma and texture.v001.png are
+#  separate lines of versions even if they live in the same directory. Sizes of the versions to remove
+#  are computed and they are removed by a pool of worker threads. Nothing is removed in a dry run, the report lists what would be.
+#
+# @code
+#import mFileSystem.versionRetentionLib
+#
+#policy = mFileSystem.versionRetentionLib.RetentionPolicy(keepLast=5)
+#report = mFileSystem.versionRetentionLib.prune('/publish/chair', policy)
+#print(report)
+#
+#report = mFileSystem.versionRetentionLib.prune('/publish/chair', policy, dryRun=False)
+# @endcode
+#
+#  @param directory [ str                                                | None  | in  ] - Directory where the versions are.
+#  @param policy    [ mFileSystem.versionRetentionLib.RetentionPolicy    | None  | in  ] - Policy.
+#  @param files     [ bool                                               | False | in  ] - Prune versioned files rather than versioned folders.
+#  @param extension [ str                                                | None  | in  ] - Extension of the versioned files.
+#  @param dryRun    [ bool                                               | True  | in  ] - Only report the versions that would be removed.
+#  @param workers   [ int                                                | 8     | in  ] - Number of worker threads.
+#
+#  @exception N/A
+#
+#  @return mFileSystem.versionRetentionLib.RetentionReport - Report.
+def prune(directory, policy, files=False, extension=None, dryRun=True, workers=8):
+
+    report = RetentionReport(dryRun)
+
+    if files:
+        versions = mFileSystem.directoryLib.Directory.listVersionedFiles(directory,
+                                                                         absolutePath=True,
+                                                                         version=mFileSystem.versionLib.Version.kAll,
+                                                                         extension=extension,
+                                                                         createPath=False)
+    else:
+        versions = mFileSystem.directoryLib.Directory.listVersionedFolders(directory,
+                                                                           absolutePath=True,
+                                                                           version=mFileSystem.versionLib.Version.kAll,
+                                                                           useIndex=True)
+
+    if not versions:
+        return report
+
+    removed = []
+
+    for group in (_groupVersionedFiles(versions) if files else [versions]):
+        kept, _removed = policy.apply(group)
+        report.addKept(kept)
+        removed.extend(_removed)
+
+    if not removed:
+        return report
+
+    arguments = [(x, dryRun) for x in removed]
+
+    if workers < 2 or len(arguments) < 2:
+        results = [_removeVersion(x) for x in arguments]
+    else:
+        threadPool = pool.ThreadPool(processes=min(workers, len(arguments)))
+        try:
+            results = threadPool.map(_removeVersion, arguments)
+        finally:
+            threadPool.close()
+            threadPool.join()
+
+    for path, (size, error) in zip(removed, results):
+        if error:
+            report.addError(path, error)
+            continue
+        report.addRemoved(path, size)
+
+    return report